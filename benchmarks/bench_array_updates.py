@@ -0,0 +1,67 @@
+"""Updating 10k samples of a waveform stored as observable list and as observable
+NumPy array. Requires `numpy`.
+
+Run with `python -m benchmarks.bench_array_updates`.
+"""
+
+from typing import Any
+
+import numpy as np
+
+from observer_pattern import Observable, Observer
+
+from benchmarks.utils import measure, report
+
+SAMPLES = 10_000
+
+
+class CountingObserver(Observer):
+    def __init__(self, observable: Observable) -> None:
+        super().__init__(observable)
+        self.count = 0
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.count += 1
+
+
+class Sensor(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.list_waveform = [0.0] * SAMPLES
+        self.array_waveform = np.zeros(SAMPLES)
+
+
+def main() -> None:
+    sensor = Sensor()
+    observer = CountingObserver(sensor)
+    new_samples = np.random.default_rng().random(SAMPLES)
+    new_list = new_samples.tolist()
+
+    def update_list() -> None:
+        waveform = sensor.list_waveform
+        for index, sample in enumerate(new_list):
+            waveform[index] = sample
+
+    def update_array() -> None:
+        sensor.array_waveform[:] = new_samples
+
+    def update_array_mask() -> None:
+        waveform = sensor.array_waveform
+        waveform[waveform > 0.5] = 0.0  # noqa: PLR2004
+
+    results = {}
+    notifications = {}
+    for name, update in (
+        ("list: per-index writes", update_list),
+        ("array: slice write", update_array),
+        ("array: mask write", update_array_mask),
+    ):
+        observer.count = 0
+        results[name] = measure(update, number=1, repeat=5) / 1e3
+        notifications[name] = observer.count / 5
+    report(results, unit="us")
+    report(notifications, unit="notifications per update")
+
+
+if __name__ == "__main__":
+    main()
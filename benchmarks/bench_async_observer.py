@@ -0,0 +1,58 @@
+"""Writer latency with a slow synchronous or asynchronous observer.
+
+The synchronous observer delays every write by its handling time, while the
+`AsyncObserver` only queues the notification. Run with
+`python -m benchmarks.bench_async_observer`.
+"""
+
+import asyncio
+import time
+
+from observer_pattern import Observable, Observer
+from observer_pattern.observer import AsyncObserver
+
+from benchmarks.utils import measure, report
+
+HANDLING_TIME = 0.001
+
+
+class MyObservable(Observable):
+    value = 0
+
+
+class SlowObserver(Observer):
+    def on_change(self, full_access_path: str, value: object) -> None:
+        time.sleep(HANDLING_TIME)
+
+
+class SlowAsyncObserver(AsyncObserver):
+    async def on_change(self, full_access_path: str, value: object) -> None:
+        await asyncio.sleep(HANDLING_TIME)
+
+
+def write(instance: MyObservable) -> None:
+    instance.value += 1
+
+
+async def main() -> None:
+    results = {}
+    dropped = {}
+
+    instance = MyObservable()
+    SlowObserver(instance)
+    results["sync observer"] = measure(lambda: write(instance), number=100, repeat=3)
+
+    for backpressure in ("drop_oldest", "coalesce"):
+        instance = MyObservable()
+        observer = SlowAsyncObserver(instance, backpressure=backpressure)
+        results[f"async observer ({backpressure})"] = measure(
+            lambda instance=instance: write(instance), number=10_000
+        )
+        dropped[f"dropped notifications ({backpressure})"] = observer.dropped
+
+    report(results)
+    report(dropped, unit="")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
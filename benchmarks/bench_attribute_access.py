@@ -0,0 +1,60 @@
+"""Attribute read cost on `Observable` instances compared to plain objects.
+
+Properties notify their reads through a descriptor, other attributes are read like
+on plain objects.
+
+Run with `python -m benchmarks.bench_attribute_access`.
+"""
+
+from observer_pattern import Observable
+
+from benchmarks.utils import measure, report
+
+
+class PlainObject:
+    def __init__(self) -> None:
+        self.value = 1
+
+    def method(self) -> int:
+        return self.value
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 1
+
+    def method(self) -> int:
+        return self.value
+
+
+class ObservableWithProperty(MyObservable):
+    @property
+    def doubled(self) -> int:
+        return 2 * self.value
+
+
+def main() -> None:
+    plain = PlainObject()
+    observable = MyObservable()
+    with_property = ObservableWithProperty()
+
+    report(
+        {
+            "plain object: data attribute": measure(lambda: plain.value),
+            "observable: data attribute": measure(lambda: observable.value),
+            "plain object: bound method": measure(lambda: plain.method),
+            "observable: bound method": measure(lambda: observable.method),
+            "observable: _observers": measure(lambda: observable._observers),
+            "observable with property: data attribute": measure(
+                lambda: with_property.value
+            ),
+            "observable with property: property, 0 observers": measure(
+                lambda: with_property.doubled
+            ),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Construction time of observable instances with class-level defaults, created one by
+one and in bulk with `from_records`.
+
+Run with `python -m benchmarks.bench_construction`.
+"""
+
+from typing import Any
+
+from observer_pattern import Observable
+
+from benchmarks.utils import measure, report
+
+INSTANCES = 100_000
+
+
+class Base(Observable):
+    unit = "V"
+    scale = 1.0
+
+
+class Channel(Base):
+    name = ""
+    value = 0.0
+    offset = 0.0
+    enabled = True
+    label = "channel"
+    precision = 3
+
+    @property
+    def scaled(self) -> float:
+        return self.value * self.scale
+
+
+class InitialisedChannel(Observable):
+    def __init__(self, name: str, value: float) -> None:
+        super().__init__()
+        self.name = name
+        self.value = value
+
+
+def make_records() -> list[dict[str, Any]]:
+    return [{"name": f"ch{i}", "value": float(i)} for i in range(INSTANCES)]
+
+
+def main() -> None:
+    records = make_records()
+    results = {
+        f"{INSTANCES} x Channel()": measure(
+            lambda: [Channel() for _ in range(INSTANCES)], number=1, repeat=3
+        ),
+        f"{INSTANCES} x InitialisedChannel(name, value)": measure(
+            lambda: [
+                InitialisedChannel(record["name"], record["value"])
+                for record in records
+            ],
+            number=1,
+            repeat=3,
+        ),
+        f"Channel.from_records({INSTANCES} records)": measure(
+            lambda: Channel.from_records(records), number=1, repeat=3
+        ),
+    }
+    report({name: result / 1e6 for name, result in results.items()}, unit="ms")
+
+
+if __name__ == "__main__":
+    main()
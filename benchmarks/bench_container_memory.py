@@ -0,0 +1,56 @@
+"""Memory per wrapped list and dict, measured with `tracemalloc` while wrapping many
+small containers held by an observable list (i.e. with one observer each).
+
+Run with `python -m benchmarks.bench_container_memory`.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from observer_pattern import Observable
+
+from benchmarks.utils import report
+
+CONTAINERS = 100_000
+
+
+class Table(Observable):
+    rows: Any = None
+
+
+def traced_bytes(func: Callable[[], object]) -> int:
+    """Returns the memory allocated by `func` that is still in use afterwards."""
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()  # noqa: F841
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def bytes_per_container(make_item: Callable[[int], Any]) -> dict[str, float]:
+    items: list[Any] = []
+    builtin = traced_bytes(
+        lambda: items.extend(make_item(i) for i in range(CONTAINERS))
+    )
+    table = Table()
+    wrapped = traced_bytes(lambda: setattr(table, "rows", items))
+    return {"builtin": builtin / CONTAINERS, "wrapped": wrapped / CONTAINERS}
+
+
+def main() -> None:
+    results = {}
+    for name, make_item in (
+        ("list with one item", lambda i: [i]),
+        ("dict with one key", lambda i: {"value": i}),
+    ):
+        for kind, size in bytes_per_container(make_item).items():
+            results[f"{kind} {name}"] = size
+    report(results, unit="B")
+
+
+if __name__ == "__main__":
+    main()
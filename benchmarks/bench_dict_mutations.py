@@ -0,0 +1,56 @@
+"""Bulk updates of observed dicts with 100k keys compared to plain dicts.
+
+Run with `python -m benchmarks.bench_dict_mutations`.
+"""
+
+from observer_pattern import Observable, Observer
+
+from benchmarks.utils import measure, report
+
+SIZE = 100_000
+
+
+class CountingObserver(Observer):
+    def __init__(self, observable: Observable) -> None:
+        super().__init__(observable)
+        self.count = 0
+
+    def on_change(self, full_access_path: str, value: object) -> None:
+        self.count += 1
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.values: dict[int, int] = {}
+
+
+def main() -> None:
+    items = {i: i for i in range(SIZE)}
+    plain: dict[int, int] = {}
+    observable = MyObservable()
+    observer = CountingObserver(observable)
+    observed = observable.values
+
+    def set_items() -> None:
+        for key, value in items.items():
+            observed[key] = value
+
+    report(
+        {
+            "plain dict: update 100k keys": measure(
+                lambda: plain.update(items), number=10
+            ),
+            "observed dict: update 100k keys": measure(
+                lambda: observed.update(items), number=10
+            ),
+            "observed dict: 100k x __setitem__ (int keys)": measure(
+                set_items, number=10
+            ),
+        },
+    )
+    print(f"notifications: {observer.count}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
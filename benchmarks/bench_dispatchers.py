@@ -0,0 +1,73 @@
+"""Write latency and throughput with I/O-bound observers per dispatcher.
+
+Every observer sleeps for `IO_TIME` per notification. The latency is the time a
+write takes to return, the throughput the number of writes per second until all
+notifications are delivered. Run with `python -m benchmarks.bench_dispatchers`.
+"""
+
+import time
+from typing import Any
+
+from observer_pattern import Observable, Observer
+from observer_pattern.dispatchers import (
+    Dispatcher,
+    ProcessPoolDispatcher,
+    ThreadPoolDispatcher,
+)
+
+from benchmarks.utils import report
+
+IO_TIME = 0.0005
+OBSERVERS = 100
+WRITES = 20
+
+
+class MyObservable(Observable):
+    value = 0
+
+
+class IOBoundObserver(Observer):
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        time.sleep(IO_TIME)
+
+
+def run(dispatcher: Dispatcher | None) -> tuple[float, float]:
+    """Returns the mean write latency in µs and the throughput in writes per
+    second."""
+
+    instance = MyObservable()
+    instance.set_dispatcher(dispatcher)
+    for _ in range(OBSERVERS):
+        IOBoundObserver(instance)
+
+    latency = 0.0
+    start = time.perf_counter()
+    for i in range(WRITES):
+        write_start = time.perf_counter()
+        instance.value = i
+        latency += time.perf_counter() - write_start
+    if dispatcher is not None:
+        dispatcher.wait()
+    elapsed = time.perf_counter() - start
+    if dispatcher is not None:
+        dispatcher.shutdown()
+    return latency / WRITES * 1e6, WRITES / elapsed
+
+
+def main() -> None:
+    latencies = {}
+    throughputs = {}
+    for name, dispatcher in (
+        ("inline", None),
+        ("thread pool (32 workers)", ThreadPoolDispatcher(32)),
+        ("process pool", ProcessPoolDispatcher()),
+    ):
+        latencies[f"{name}: latency"], throughputs[f"{name}: throughput"] = run(
+            dispatcher
+        )
+    report(latencies, unit="µs")
+    report(throughputs, unit="writes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Time of importing `observer_pattern` in a fresh interpreter, compared with starting
+the interpreter and with importing `click` (which the package imported for its
+logging setup).
+
+Run with `python -m benchmarks.bench_import_time`.
+"""
+
+import subprocess
+import sys
+import time
+
+from benchmarks.utils import report
+
+REPEAT = 20
+
+
+def import_time(statement: str) -> float:
+    """Returns the best observed time of running `statement` in a new interpreter in
+    milliseconds."""
+
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)  # noqa: S603
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    report(
+        {
+            "interpreter start": import_time("pass"),
+            "import click": import_time("import click"),
+            "import observer_pattern": import_time("import observer_pattern"),
+        },
+        unit="ms",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Cost of journaling changes with `JournalObserver` compared to an observer
+writing every change as a JSON line.
+
+Run with `python -m benchmarks.bench_journal`.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from observer_pattern import Observable, Observer
+from observer_pattern.observer import JournalObserver
+
+from benchmarks.utils import measure, report
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 0.0
+        self.items = [0] * 10
+
+
+class JsonLinesObserver(Observer):
+    def __init__(self, observable: Observable, path: Path) -> None:
+        super().__init__(observable)
+        self.file = path.open("a", buffering=1)
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.file.write(json.dumps({"path": full_access_path, "value": value}) + "\n")
+
+    def on_change_start(self, full_access_path: str) -> None:
+        self.file.write(json.dumps({"path": full_access_path}) + "\n")
+
+
+def write(instance: MyObservable) -> None:
+    instance.value += 1.0
+    instance.items[3] = 1
+
+
+def main() -> None:
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        instance = MyObservable()
+        results["no observer"] = measure(lambda: write(instance), number=10_000)
+
+        instance = MyObservable()
+        observer = JsonLinesObserver(instance, Path(directory) / "changes.jsonl")
+        results["json lines observer"] = measure(lambda: write(instance), number=10_000)
+        observer.file.close()
+        observer.detach()
+
+        instance = MyObservable()
+        journal = JournalObserver(instance, Path(directory) / "journal")
+        results["journal observer"] = measure(lambda: write(instance), number=10_000)
+        journal.close()
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Assignment time and peak memory of a large nested structure with eager and lazy
+wrapping (`lazy_wrapping=True`), and the time of accessing all of its items.
+
+Run with `python -m benchmarks.bench_lazy_wrapping`.
+"""
+
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from observer_pattern import Observable
+
+from benchmarks.utils import report
+
+ROWS = 100_000
+
+
+class EagerTable(Observable):
+    rows: Any = None
+
+
+class LazyTable(Observable, lazy_wrapping=True):
+    rows: Any = None
+
+
+def make_rows() -> list[dict[str, Any]]:
+    return [{"id": i, "tags": ["a", "b"], "meta": {"x": i}} for i in range(ROWS)]
+
+
+def timed(func: Callable[[], object]) -> float:
+    """Returns the time of calling `func` once in milliseconds."""
+
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def peak_memory(func: Callable[[], object]) -> float:
+    """Returns the peak of memory allocated while calling `func` in MiB."""
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def access_all(table: Observable) -> None:
+    for row in table.rows:
+        row["meta"]["x"]  # noqa: B018
+
+
+def main() -> None:
+    results: dict[str, float] = {}
+    memory: dict[str, float] = {}
+    for name, table_type in (("eager", EagerTable), ("lazy", LazyTable)):
+        table = table_type()
+        rows = make_rows()
+        results[f"{name}: assign {ROWS} rows"] = timed(
+            lambda: setattr(table, "rows", rows)  # noqa: B023
+        )
+        results[f"{name}: access all rows"] = timed(
+            lambda: access_all(table)  # noqa: B023
+        )
+
+        table = table_type()
+        rows = make_rows()
+        memory[f"{name}: peak memory of assignment"] = peak_memory(
+            lambda: setattr(table, "rows", rows)  # noqa: B023
+        )
+
+    report(results, unit="ms")
+    report(memory, unit="MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Mutation cost of observed lists with 1M elements compared to plain lists.
+
+Run with `python -m benchmarks.bench_list_mutations`.
+"""
+
+import time
+
+from observer_pattern import Observable, Observer
+
+from benchmarks.utils import measure, report
+
+SIZE = 1_000_000
+
+
+class NullObserver(Observer):
+    def on_change(self, full_access_path: str, value: object) -> None:
+        pass
+
+
+class Item(Observable):
+    value = 0
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.values: list[object] = []
+
+
+def time_appends(target: list[object]) -> float:
+    start = time.perf_counter()
+    for i in range(SIZE):
+        target.append(i)
+    return (time.perf_counter() - start) / SIZE * 1e9
+
+
+def main() -> None:
+    observable = MyObservable()
+    NullObserver(observable)
+    results = {
+        "plain list: append 1M": time_appends([]),
+        "observed list: append 1M": time_appends(observable.values),
+    }
+
+    plain = list(range(SIZE))
+    results["plain list: insert(0) into 1M"] = measure(
+        lambda: plain.insert(0, 0), number=1_000
+    )
+
+    # every 1000th element is an observable whose index is shifted by each insert
+    observable.values = [Item() if i % 1_000 == 0 else i for i in range(SIZE)]
+    observed = observable.values
+    results["observed list: insert(0) into 1M"] = measure(
+        lambda: observed.insert(0, 0), number=1_000
+    )
+    last_item = observed[-1_000]
+
+    def insert_and_notify_item() -> None:
+        observed.insert(0, 0)
+        last_item.value += 1
+
+    results["observed list: insert(0) + item change"] = measure(
+        insert_and_notify_item, number=100
+    )
+
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
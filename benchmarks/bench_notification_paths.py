@@ -0,0 +1,51 @@
+"""Notification cost of changes deep in a nested model with many observers.
+
+Run with `python -m benchmarks.bench_notification_paths`.
+"""
+
+from observer_pattern import Observable, Observer
+
+from benchmarks.utils import measure, report
+
+
+class NullObserver(Observer):
+    def on_change(self, full_access_path: str, value: object) -> None:
+        pass
+
+
+class Node(Observable):
+    def __init__(self, depth: int) -> None:
+        super().__init__()
+        self.value = 0
+        self.items = [Leaf()]
+        if depth > 0:
+            self.child = Node(depth - 1)
+
+
+class Leaf(Observable):
+    value = 0
+
+
+def main() -> None:
+    results = {}
+    for depth in (1, 10):
+        for observer_count in (1, 100):
+            root = Node(depth)
+            for _ in range(observer_count):
+                NullObserver(root)
+            node = root
+            while hasattr(node, "child"):
+                node = node.child
+            leaf = node.items[0]
+
+            def write(leaf: Leaf = leaf) -> None:
+                leaf.value = 1
+
+            results[f"depth {depth:>2}, {observer_count:>3} observers"] = measure(
+                write, number=2_000
+            )
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Cost of catching up a client with `diff()` compared to a full `to_dict()`
+snapshot, for a large tree with few changes.
+
+Run with `python -m benchmarks.bench_patch`.
+"""
+
+import pickle
+
+from observer_pattern import Observable
+from observer_pattern.patch import current_version
+
+from benchmarks.bench_snapshot import Model
+from benchmarks.utils import measure, report
+
+
+def main() -> None:
+    model = Model()
+    version = current_version()
+    for i in range(10):
+        model.devices[i * 100].channels[3].value = -1.0
+
+    def catch_up(model: Observable = model) -> None:
+        model.diff(version)
+
+    report(
+        {
+            "to_dict": measure(model.to_dict, number=1, repeat=3),
+            "diff (10 changes)": measure(catch_up, number=10, repeat=3),
+        }
+    )
+    report(
+        {
+            "to_dict": len(pickle.dumps(model.to_dict())),
+            "diff (10 changes)": len(pickle.dumps(model.diff(version))),
+        },
+        unit="bytes",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Fan-out cost of path subscriptions compared to filtering in `on_change`.
+
+Run with `python -m benchmarks.bench_path_subscriptions`.
+"""
+
+from observer_pattern import Observable, Observer
+
+from benchmarks.utils import measure, report
+
+DEVICE_COUNT = 1_000
+
+
+class Device(Observable):
+    voltage = 0.0
+
+
+class Lab(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.devices = [Device() for _ in range(DEVICE_COUNT)]
+
+
+class FilteringObserver(Observer):
+    def __init__(self, observable: Observable, path: str) -> None:
+        super().__init__(observable)
+        self.path = path
+
+    def on_change(self, full_access_path: str, value: object) -> None:
+        if full_access_path == self.path:
+            pass
+
+
+class SubscribedObserver(Observer):
+    def on_change(self, full_access_path: str, value: object) -> None:
+        pass
+
+
+def main() -> None:
+    filtered_lab = Lab()
+    for i in range(DEVICE_COUNT):
+        FilteringObserver(filtered_lab, f"devices[{i}].voltage")
+
+    subscribed_lab = Lab()
+    for i in range(DEVICE_COUNT):
+        SubscribedObserver(subscribed_lab, paths=[f"devices[{i}].voltage"])
+
+    def write(lab: Lab) -> None:
+        lab.devices[500].voltage = 1.0
+
+    report(
+        {
+            f"{DEVICE_COUNT} observers filtering in on_change": measure(
+                lambda: write(filtered_lab), number=1_000
+            ),
+            f"{DEVICE_COUNT} observers subscribed to paths": measure(
+                lambda: write(subscribed_lab), number=1_000
+            ),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Write cost and delivered notifications of a sensor written 10,000 times, observed
+by a plain observer and by a throttled observer delivering at 20 Hz.
+
+Run with `python -m benchmarks.bench_rate_limited_observer`.
+"""
+
+from typing import Any
+
+from observer_pattern import Observable, Observer
+from observer_pattern.observer import RateLimitedObserver
+
+from benchmarks.utils import measure, report
+
+WRITES = 10_000
+
+
+class Sensor(Observable):
+    value = 0.0
+
+
+class CountingObserver(Observer):
+    calls = 0
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.calls += 1
+
+
+class CountingThrottledObserver(RateLimitedObserver):
+    calls = 0
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.calls += 1
+
+
+def main() -> None:
+    results = {}
+    deliveries = {}
+
+    sensor = Sensor()
+    observer = CountingObserver(sensor)
+    results["plain observer"] = measure(
+        lambda: setattr(sensor, "value", 1.0), number=WRITES, repeat=1
+    )
+    deliveries["plain observer"] = observer.calls
+
+    sensor = Sensor()
+    throttled = CountingThrottledObserver(sensor, interval=0.05)
+    results["throttled observer (20 Hz)"] = measure(
+        lambda: setattr(sensor, "value", 1.0), number=WRITES, repeat=1
+    )
+    throttled.close()
+    deliveries["throttled observer (20 Hz)"] = throttled.calls
+
+    report(results)
+    report(deliveries, unit=f"calls of on_change per {WRITES} writes")
+
+
+if __name__ == "__main__":
+    main()
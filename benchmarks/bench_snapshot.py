@@ -0,0 +1,64 @@
+"""Snapshot of a large `Observable` tree with `to_dict` and `iter_snapshot`,
+compared to a recursive walk through the public accessors.
+
+Run with `python -m benchmarks.bench_snapshot`.
+"""
+
+from typing import Any
+
+from observer_pattern import Observable
+from observer_pattern.observable_object import ObservableObject
+
+from benchmarks.utils import measure, report
+
+
+class Channel(Observable):
+    def __init__(self, index: int) -> None:
+        super().__init__()
+        self.name = f"channel {index}"
+        self.value = float(index)
+        self.limits = {"min": 0.0, "max": 10.0}
+
+
+class Device(Observable):
+    def __init__(self, index: int) -> None:
+        super().__init__()
+        self.name = f"device {index}"
+        self.channels = [Channel(i) for i in range(10)]
+
+
+class Model(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.devices = [Device(i) for i in range(1_000)]
+
+
+def walk(value: Any) -> Any:
+    if isinstance(value, list):
+        return [walk(item) for item in value]
+    if isinstance(value, dict):
+        return {key: walk(item) for key, item in value.items()}
+    if isinstance(value, ObservableObject):
+        return {
+            name: walk(getattr(value, name))
+            for name in vars(value)
+            if not name.startswith("_")
+        }
+    return value
+
+
+def main() -> None:
+    model = Model()
+    report(
+        {
+            "recursive walk": measure(lambda: walk(model), number=1, repeat=3),
+            "to_dict": measure(model.to_dict, number=1, repeat=3),
+            "iter_snapshot": measure(
+                lambda: sum(1 for _ in model.iter_snapshot()), number=1, repeat=3
+            ),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Write throughput of a thread-safe `Observable` tree with 1 to 32 writer threads.
+
+Every writer changes an item of a nested list while another thread keeps
+registering and detaching observers. Run with
+`python -m benchmarks.bench_threaded_writers [writes_per_thread]`.
+"""
+
+import sys
+import threading
+import time
+from typing import Any
+
+from observer_pattern import Observable, Observer
+
+from benchmarks.utils import report
+
+
+class Device(Observable, thread_safe=True):
+    value = 0
+
+
+class Model(Observable, thread_safe=True):
+    def __init__(self, devices: int) -> None:
+        super().__init__()
+        self.devices = [Device() for _ in range(devices)]
+
+
+class NullObserver(Observer):
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        pass
+
+
+def run(threads: int, writes_per_thread: int) -> float:
+    """Returns the number of writes per second."""
+
+    model = Model(threads)
+    NullObserver(model)
+    barrier = threading.Barrier(threads + 1)
+    done = threading.Event()
+
+    def write(device: Device) -> None:
+        barrier.wait()
+        for i in range(writes_per_thread):
+            device.value = i
+
+    def churn() -> None:
+        while not done.is_set():
+            NullObserver(model).detach()
+
+    writers = [
+        threading.Thread(target=write, args=(device,)) for device in model.devices
+    ]
+    churner = threading.Thread(target=churn)
+    for thread in writers:
+        thread.start()
+    churner.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in writers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    churner.join()
+    return threads * writes_per_thread / elapsed
+
+
+def main(writes_per_thread: int = 5_000) -> None:
+    report(
+        {
+            f"{threads:>2} writer threads": run(threads, writes_per_thread)
+            for threads in (1, 2, 4, 8, 16, 32)
+        },
+        unit="writes/s",
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,37 @@
+"""Soak test assigning and discarding lists and dicts on an `Observable`.
+
+Prints the registry size and the traced memory while cycling through millions of
+assignments. Both should stay flat. Run with
+`python -m benchmarks.soak_identity_registry [cycles]`.
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from observer_pattern import Observable
+
+
+class MyObservable(Observable):
+    pass
+
+
+def main(cycles: int = 2_000_000) -> None:
+    instance = MyObservable()
+    tracemalloc.start()
+
+    for i in range(cycles):
+        instance.list_attr = [i]
+        instance.dict_attr = {"value": i}
+        if i % (cycles // 10) == 0:
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            print(  # noqa: T201
+                f"{i:>10} cycles: {current / 1024:10.1f} KiB traced, "
+                f"{Observable._list_mapping.stats()}, "
+                f"{Observable._dict_mapping.stats()}"
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
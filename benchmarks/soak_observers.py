@@ -0,0 +1,50 @@
+"""Soak test creating and dropping observers of an `Observable`.
+
+Creates millions of short-lived observers, alternately registered weakly (and
+dropped) and registered strongly (and detached). Prints the number of registered
+observers and the traced memory, which should both stay flat. Run with
+`python -m benchmarks.soak_observers [observers]`.
+"""
+
+import gc
+import sys
+import tracemalloc
+from typing import Any
+
+from observer_pattern import Observable, Observer
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 0
+
+
+class MyObserver(Observer):
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        pass
+
+
+def main(observers: int = 1_000_000) -> None:
+    instance = MyObservable()
+    tracemalloc.start()
+
+    for i in range(observers):
+        if i % 2:
+            MyObserver(instance, weak=True)
+        else:
+            MyObserver(instance, paths=["value"]).detach()
+        instance.value = i
+        if i % (observers // 10) == 0:
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            registered = sum(len(o) for o in instance._observers.values())
+            print(  # noqa: T201
+                f"{i:>10} observers: {current / 1024:10.1f} KiB traced, "
+                f"{registered} registered, "
+                f"subscriptions={bool(instance._subscriptions)}"
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,311 @@
+"""Benchmark suite of the hot paths of the library: attribute access with 0 to 100
+observers, writes of unchanged values, notifications of nested changes, wrapping of
+large lists and dicts, property notifications and instance construction.
+
+Run with `python -m benchmarks.suite`. The results are printed in nanoseconds per
+call. Store them with `--output results.json` and compare a later run with them with
+`--compare results.json`, which exits with status 1 if a case got slower by more than
+`--threshold` (10% by default) and by more than `--noise-floor` nanoseconds (5 by
+default), or by more than the noise of the repetitions if that is larger. Each case
+is timed in repetitions of at least 0.2 s after a warmup, and the median repetition
+counts. `--filter` selects the cases whose names contain the
+given text, e.g. `--filter wrap`.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+
+from observer_pattern import Observable, Observer
+
+from benchmarks.utils import calibrate, report
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    """Returns the function to time."""
+    number: int
+    """The minimum number of calls per repetition, which is raised until a
+    repetition takes long enough to time (see `calibrate`). Cases with `number=1`
+    are instead set up again for every repetition, e.g. to wrap a new list every
+    time."""
+
+
+class NullObserver(Observer):
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        pass
+
+
+class Model(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 0
+        self.name = "model"
+        self.items = [1, 2, 3]
+        self.settings = {"enabled": True}
+
+
+class ComparedModel(Model, write_equality="equality"):
+    pass
+
+
+class Node(Observable):
+    def __init__(self, depth: int) -> None:
+        super().__init__()
+        self.value = 0
+        if depth > 0:
+            self.child = Node(depth - 1)
+
+
+class Holder(Observable):
+    data: Any = None
+
+
+class Reading(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self._value = 1
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class ComparedReading(Reading, property_equality="equality"):
+    pass
+
+
+ObservableT = TypeVar("ObservableT", bound=Observable)
+
+
+def observed(observable: ObservableT, observer_count: int) -> ObservableT:
+    for _ in range(observer_count):
+        NullObserver(observable)
+    return observable
+
+
+def read_case(observer_count: int) -> Case:
+    def setup() -> Callable[[], object]:
+        model = observed(Model(), observer_count)
+        return lambda: model.value
+
+    return Case(f"read attribute, {observer_count} observers", setup, 100_000)
+
+
+def write_case(observer_count: int) -> Case:
+    def setup() -> Callable[[], object]:
+        model = observed(Model(), observer_count)
+        return lambda: setattr(model, "value", 1)
+
+    return Case(f"write attribute, {observer_count} observers", setup, 10_000)
+
+
+def unchanged_write_case(model_type: type[Model]) -> Case:
+    def setup() -> Callable[[], object]:
+        model = observed(model_type(), 1)
+        return lambda: setattr(model, "value", 0)
+
+    comparison = "" if model_type is Model else " (equality)"
+    return Case(f"write unchanged attribute{comparison}, 1 observer", setup, 10_000)
+
+
+def nested_write_case(depth: int) -> Case:
+    def setup() -> Callable[[], object]:
+        root = observed(Node(depth), 1)
+        node = root
+        while hasattr(node, "child"):
+            node = node.child
+        return lambda: setattr(node, "value", 1)
+
+    return Case(f"write {depth} levels below the root, 1 observer", setup, 5_000)
+
+
+def wrap_case(kind: str, size: int) -> Case:
+    def setup() -> Callable[[], object]:
+        holder = observed(Holder(), 1)
+        data = list(range(size)) if kind == "list" else dict.fromkeys(range(size), 0)
+        return lambda: setattr(holder, "data", data)
+
+    return Case(f"wrap {kind} of {size} items", setup, 1)
+
+
+def property_case(reading_type: type[Reading]) -> Case:
+    def setup() -> Callable[[], object]:
+        reading = observed(reading_type(), 1)
+        return lambda: reading.value
+
+    comparison = "" if reading_type is Reading else " (equality)"
+    return Case(f"read property{comparison}, 1 observer", setup, 10_000)
+
+
+CASES = [
+    *(read_case(observer_count) for observer_count in (0, 1, 100)),
+    *(write_case(observer_count) for observer_count in (0, 1, 100)),
+    unchanged_write_case(Model),
+    unchanged_write_case(ComparedModel),
+    *(nested_write_case(depth) for depth in (1, 5, 10, 20)),
+    *(
+        wrap_case(kind, size)
+        for kind in ("list", "dict")
+        for size in (10_000, 100_000, 1_000_000)
+    ),
+    property_case(Reading),
+    property_case(ComparedReading),
+    Case("construct instance", lambda: Model, 10_000),
+]
+
+
+def sampler(case: Case) -> Callable[[], float]:
+    """Returns a function timing one repetition of the case, which returns the time
+    per call in nanoseconds."""
+
+    if case.number > 1:
+        timer = timeit.Timer(case.setup())
+        number = calibrate(timer, case.number)
+        return lambda: timer.timeit(number) / number * 1e9
+
+    def sample() -> float:
+        func = case.setup()
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        return (time.perf_counter() - start) * 1e9
+
+    return sample
+
+
+def run(name_filter: str, repeat: int) -> tuple[dict[str, float], dict[str, float]]:
+    """Returns the median time per call of the cases in nanoseconds and the noise
+    of the repetitions, i.e. their interquartile range relative to the median.
+
+    The repetitions of the cases are interleaved, so that every case is timed
+    throughout the run and load changes of the machine affect all cases alike.
+    """
+
+    cases = [case for case in CASES if name_filter in case.name]
+    samplers = [sampler(case) for case in cases]
+    samples: dict[str, list[float]] = {case.name: [] for case in cases}
+    for _ in range(repeat):
+        for case, sample in zip(cases, samplers, strict=True):
+            samples[case.name].append(sample())
+
+    results = {}
+    noise = {}
+    for name, case_samples in samples.items():
+        median = statistics.median(case_samples)
+        quartiles = statistics.quantiles(case_samples, n=4)
+        results[name] = median
+        noise[name] = (quartiles[2] - quartiles[0]) / median
+    return results, noise
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+    noise_floor: float,
+    noise: dict[str, float],
+) -> list[str]:
+    """Prints the ratio of the results to the baseline and returns the names of the
+    cases that got slower by more than `threshold`.
+
+    The threshold of a case is raised to the noise of its repetitions in both runs
+    (see `run`), and differences of less than `noise_floor` nanoseconds are ignored,
+    so that repeated runs of the same code do not report changes.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<50} {'no baseline':>12}")  # noqa: T201
+            continue
+        ratio = result / baseline[name]
+        tolerance = max(threshold, noise.get(name, 0.0))
+        marker = ""
+        if abs(result - baseline[name]) < noise_floor:
+            pass
+        elif ratio > 1 + tolerance:
+            marker = "  slower"
+            regressions.append(name)
+        elif ratio < 1 - tolerance:
+            marker = "  faster"
+        print(f"{name:<50} {ratio:11.2f}x{marker}")  # noqa: T201
+    return regressions
+
+
+def machine() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.machine(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--output", type=Path, help="write the results to this file")
+    parser.add_argument(
+        "--compare", type=Path, help="compare with the results in this file"
+    )
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--filter", default="", help="only run the matching cases")
+    parser.add_argument(
+        "--noise-floor",
+        type=float,
+        default=5.0,
+        help="ignore differences of less than this many nanoseconds",
+    )
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    results, noise = run(args.filter, args.repeat)
+    report(results)
+
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "created": datetime.now(timezone.utc).isoformat(),
+                    "machine": machine(),
+                    "unit": "ns",
+                    "results": results,
+                    "noise": noise,
+                },
+                indent=2,
+            )
+        )
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        if baseline["machine"] != machine():
+            print("The baseline was measured on a different machine.")  # noqa: T201
+        print(f"\nCompared with {args.compare}:")  # noqa: T201
+        baseline_noise = baseline.get("noise", {})
+        combined_noise = {
+            name: value + baseline_noise.get(name, 0.0) for name, value in noise.items()
+        }
+        if compare(
+            results,
+            baseline["results"],
+            args.threshold,
+            args.noise_floor,
+            combined_noise,
+        ):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import timeit
+from collections.abc import Callable
+
+
+def calibrate(timer: timeit.Timer, number: int = 1, min_time: float = 0.2) -> int:
+    """Returns a number of calls of the timed function taking at least `min_time`
+    seconds, starting the search with `number` calls. The calls of the search also
+    warm up the function and the caches it uses."""
+
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            return number
+        # aims slightly above `min_time`, as the estimate is based on short runs
+        estimate = int(number * 1.2 * min_time / elapsed) if elapsed > 0 else 0
+        number = max(2 * number, estimate)
+
+
+def measure(
+    func: Callable[[], object],
+    number: int | None = None,
+    repeat: int = 7,
+    min_time: float = 0.2,
+) -> float:
+    """Returns the best observed time per call of `func` in nanoseconds.
+
+    Each of the `repeat` repetitions times `number` calls. If `number` is not given,
+    it is calibrated so that a repetition takes at least `min_time` seconds, after
+    warming up `func`.
+    """
+
+    timer = timeit.Timer(func)
+    if number is None:
+        number = calibrate(timer, min_time=min_time)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def report(results: dict[str, float], unit: str = "ns") -> None:
+    for name, result in results.items():
+        print(f"{name:<50} {result:12.1f} {unit}")  # noqa: T201
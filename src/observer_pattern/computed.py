@@ -0,0 +1,74 @@
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
+
+if TYPE_CHECKING:
+    from observer_pattern.observable import Observable
+
+T = TypeVar("T")
+
+
+class _DependencyTrackers(threading.local):
+    def __init__(self) -> None:
+        self.stack: list[tuple["Observable", set[str]]] = []
+        """The computed attributes being evaluated by the thread. Each entry holds
+        the instance and the set collecting the names of the attributes read from
+        it."""
+
+
+_dependency_trackers = _DependencyTrackers()
+"""Per thread, so that threads evaluating computed attributes at the same time do
+not record each other's reads."""
+
+
+class computed(Generic[T]):  # noqa: N801
+    """Cached attribute of an `Observable` that is recomputed when its inputs change.
+
+    While the decorated getter is evaluated, all attributes it reads from the instance
+    are recorded as its inputs. The result is cached until one of the inputs (or
+    anything nested in them, e.g. an item of a list attribute) notifies a change. The
+    cached value is then discarded and, if the instance is observed, recomputed and
+    notified under the name of the computed attribute.
+
+    Only attributes read from the instance itself are tracked. Values read from
+    observables that are not attributes of the instance do not invalidate the cache.
+
+    Example:
+
+    ```python
+    >>> class Sensor(Observable):
+    ...     def __init__(self) -> None:
+    ...         super().__init__()
+    ...         self.samples = [1.0, 2.0, 3.0]
+    ...
+    ...     @computed
+    ...     def mean(self) -> float:
+    ...         return sum(self.samples) / len(self.samples)
+    ```
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> "computed[T]":
+        ...
+
+    @overload
+    def __get__(self, instance: "Observable", owner: type | None = None) -> T:
+        ...
+
+    def __get__(
+        self, instance: "Observable | None", owner: type | None = None
+    ) -> "computed[T] | T":
+        if instance is None:
+            return self
+        return instance._get_computed_value(self)
+
+    def __set__(self, instance: "Observable", value: Any) -> None:
+        raise AttributeError(f"Cannot set computed attribute '{self.name}'.")
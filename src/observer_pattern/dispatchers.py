@@ -0,0 +1,159 @@
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _invoke(observer: Any, method: str, args: tuple[Any, ...]) -> None:
+    getattr(observer, method)(*args)
+
+
+class Dispatcher(ABC):
+    """Delivers notifications to the observers registered with an `ObservableObject`.
+
+    Only the observers registered with `attr_name=""` (i.e. `Observer` instances) are
+    notified through the dispatcher of an object. Parent objects in the observable tree
+    are always notified inline, so that the access paths are built while the tree is
+    in the changed state.
+    """
+
+    @abstractmethod
+    def dispatch(self, observer: Any, method: str, args: tuple[Any, ...]) -> None:
+        """Calls the notification method `method` of `observer` with `args`."""
+
+    def wait(self, timeout: float | None = None) -> bool:  # noqa: ARG002
+        """Waits until all dispatched notifications have been delivered.
+
+        Returns `False` if the notifications did not settle within `timeout` seconds.
+        Dispatchers delivering in the notifying thread have nothing to wait for.
+        """
+
+        return True
+
+    def shutdown(self) -> None:
+        """Waits for the dispatched notifications and releases the resources of the
+        dispatcher."""
+
+        self.wait()
+
+
+class InlineDispatcher(Dispatcher):
+    """Notifies the observers in the thread changing the observable, one after the
+    other. Equivalent to not setting a dispatcher."""
+
+    def dispatch(self, observer: Any, method: str, args: tuple[Any, ...]) -> None:
+        _invoke(observer, method, args)
+
+
+class _ExecutorDispatcher(Dispatcher):
+    """Notifies the observers in an executor, keeping the order of the notifications
+    per observer.
+
+    While a notification of an observer is being delivered, further notifications of
+    the same observer are queued and submitted one after the other. Notifications of
+    different observers are delivered concurrently.
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._settled = threading.Condition(self._lock)
+        self._pending: dict[int, deque[tuple[Any, str, tuple[Any, ...]]]] = {}
+        """Maps the ids of the observers with a notification in flight to their queued
+        notifications."""
+        self._in_flight = 0
+
+    def dispatch(self, observer: Any, method: str, args: tuple[Any, ...]) -> None:
+        key = id(observer)
+        with self._lock:
+            self._in_flight += 1
+            pending = self._pending.get(key)
+            if pending is not None:
+                pending.append((observer, method, args))
+                return
+            self._pending[key] = deque()
+        self._submit(key, observer, method, args)
+
+    def _submit(
+        self, key: int, observer: Any, method: str, args: tuple[Any, ...]
+    ) -> None:
+        try:
+            future = self._executor.submit(_invoke, observer, method, args)
+        except RuntimeError as exception:  # the executor was shut down or is broken
+            future = Future()
+            future.set_exception(exception)
+        future.add_done_callback(lambda future: self._on_done(key, future))
+
+    def _on_done(self, key: int, future: "Future[None]") -> None:
+        exception = future.exception()
+        if exception is not None:
+            logger.error(
+                "Error while notifying an observer: %r", exception, exc_info=exception
+            )
+
+        with self._lock:
+            self._in_flight -= 1
+            pending = self._pending[key]
+            if pending:
+                notification = pending.popleft()
+            else:
+                del self._pending[key]
+                notification = None
+            if not self._in_flight:
+                self._settled.notify_all()
+        if notification is not None:
+            self._submit(key, *notification)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Waits until all dispatched notifications have been delivered.
+
+        Must not be called by an observer notified by this dispatcher.
+        """
+
+        with self._settled:
+            return self._settled.wait_for(lambda: not self._in_flight, timeout)
+
+    def shutdown(self) -> None:
+        self.wait()
+        self._executor.shutdown()
+
+
+class ThreadPoolDispatcher(_ExecutorDispatcher):
+    """Notifies the observers in a pool of threads.
+
+    Suited for observers that wait for I/O, e.g. network pushes or database writes.
+    The observers have to be thread-safe, as they are called from the worker threads.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        super().__init__(
+            ThreadPoolExecutor(max_workers, thread_name_prefix="observer-dispatch")
+        )
+
+
+class ProcessPoolDispatcher(_ExecutorDispatcher):
+    """Notifies the observers in a pool of processes.
+
+    The observer and the arguments of every notification are pickled and the
+    notification method is called on the unpickled copy in a worker process. Hence,
+    observers and values have to be picklable (the observed object is not pickled with
+    the `Observer`), and changes of the state of the observer are not visible in the
+    notifying process. Suited for CPU-bound observers with side effects, e.g. writing
+    files.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        super().__init__(ProcessPoolExecutor(max_workers))
+
+    def dispatch(self, observer: Any, method: str, args: tuple[Any, ...]) -> None:
+        # weakly registered observers are wrapped in an unpicklable proxy
+        ref = getattr(observer, "_ref", None)
+        if ref is not None:
+            observer = ref()
+            if observer is None:
+                return
+        super().dispatch(observer, method, args)
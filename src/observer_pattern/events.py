@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+class ContainerEvent(ABC):
+    """Base class of the structural changes of observable containers.
+
+    Container events are notified with the access path of the container itself
+    instead of the path of a single item.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def apply(self, target: Any) -> None:
+        """Applies the change to `target`, e.g. to replay it on a copy."""
+
+
+@dataclass(frozen=True)
+class ListSplice(ContainerEvent):
+    """The items `[start:stop]` of a list were replaced by `items`.
+
+    The indices refer to the list before the change. Appending `value` to a list of
+    length `n` is notified as `ListSplice(n, n, (value,))`, deleting the item at index
+    `i` as `ListSplice(i, i + 1, ())`.
+    """
+
+    start: int
+    stop: int
+    items: tuple[Any, ...]
+
+    def apply(self, target: Any) -> None:
+        target[self.start : self.stop] = self.items
+
+
+@dataclass(frozen=True)
+class DictUpdate(ContainerEvent):
+    """The keys `deleted` were removed from a dict and the items `updated` were set.
+
+    `dict.update` is notified as a single `DictUpdate` with all updated items, while
+    `del`, `pop`, `popitem` and `clear` are notified with the removed keys.
+    """
+
+    updated: dict[Any, Any]
+    deleted: tuple[Any, ...] = ()
+
+    def apply(self, target: Any) -> None:
+        for key in self.deleted:
+            del target[key]
+        target.update(self.updated)
+
+
+@dataclass(frozen=True)
+class ArrayUpdate(ContainerEvent):
+    """The elements `key` of a NumPy array were set to `values`.
+
+    `key` is the index used for the assignment, e.g. a slice, a tuple of slices, a
+    boolean mask or an array of indices (`...` for changes of the whole array).
+    `values` is a read-only view of the new data for basic indices (integers and
+    slices), and a read-only copy of the assigned values, broadcast to the shape of
+    the selection, for masks and index arrays. The views are not copied, so they show
+    later changes of the array.
+    """
+
+    key: Any
+    values: Any
+
+    def apply(self, target: Any) -> None:
+        target[self.key] = self.values
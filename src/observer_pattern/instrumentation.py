@@ -0,0 +1,337 @@
+"""Timing of the notifications of `Observer` instances.
+
+While enabled, every notification delivered to an `Observer` (inline, or by the
+dispatcher of the object) is timed and counted per observer and per path prefix,
+i.e. the first attribute name of the notified access path. Counters are kept per
+thread, so that recording a notification does not take a lock. Instrumentation is
+disabled by default and then costs one check per notified object.
+"""
+
+import contextlib
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from observer_pattern import observable_object
+from observer_pattern.utils.helpers import get_root_attribute_name
+
+if TYPE_CHECKING:
+    from observer_pattern.dispatchers import Dispatcher
+
+
+class CallStats(NamedTuple):
+    calls: int
+    total_time: float
+    """The cumulative time of the calls in seconds."""
+    max_time: float
+    """The longest call in seconds."""
+    rate: float
+    """The calls per second since the instrumentation was enabled or reset."""
+
+
+class InstrumentationStats(NamedTuple):
+    observers: dict[str, CallStats]
+    """The notifications per observer, keyed by the type and id of the observer.
+    Observers are dropped from the stats once they are garbage collected."""
+    paths: dict[str, CallStats]
+    """The notifications per path prefix. A batch notification counts for each of
+    the path prefixes it contains."""
+    elapsed: float
+    """The seconds since the instrumentation was enabled or reset."""
+
+
+class SlowNotification(NamedTuple):
+    observer: Any
+    method: str
+    """The notification method, e.g. `"_notify_changed"`."""
+    full_access_path: str
+    """The access path of the change relative to the object notifying the observer,
+    `""` for batches."""
+    duration: float
+    """The time of the call in seconds."""
+
+
+_Counter = list[float]
+"""`[calls, total_time, max_time]`, updated in place."""
+
+
+def _unwrap_observer(observer: Any) -> Any:
+    # weakly registered observers are wrapped in a proxy
+    ref = getattr(observer, "_ref", None)
+    if ref is not None and ref() is not None:
+        return ref()
+    return observer
+
+
+def _merge(counters: Iterable[dict[Any, _Counter]]) -> dict[Any, _Counter]:
+    merged: dict[Any, _Counter] = {}
+    for thread_counters in counters:
+        # copied first, as the counters of other threads may be changing
+        for key, (calls, total_time, max_time) in dict(thread_counters).items():
+            counter = merged.setdefault(key, [0, 0.0, 0.0])
+            counter[0] += calls
+            counter[1] += total_time
+            counter[2] = max(counter[2], max_time)
+    return merged
+
+
+class _ThreadCounters:
+    __slots__ = ("observers", "paths")
+
+    def __init__(self) -> None:
+        self.observers: dict[int, _Counter] = {}
+        self.paths: dict[str, _Counter] = {}
+
+
+class _TimedObserver:
+    """Dispatched instead of an observer, records the time of the notifications in
+    the thread delivering them.
+
+    Like a weakly registered observer, it refers to the observer through `_ref`, which
+    `ProcessPoolDispatcher` unwraps to pickle the observer itself. Notifications
+    delivered in other processes are hence not timed.
+    """
+
+    __slots__ = ("_instrumentation", "_ref")
+
+    def __init__(self, instrumentation: "Instrumentation", observer: Any) -> None:
+        self._instrumentation = instrumentation
+        self._ref: Callable[[], Any]
+        try:
+            self._ref = weakref.ref(observer)
+        except TypeError:
+            # kept alive until the instrumentation is reset
+            self._ref = lambda: observer
+
+    def _forward(self, method: str, args: tuple[Any, ...]) -> None:
+        observer = self._ref()
+        if observer is not None:
+            self._instrumentation._call(observer, method, args)
+
+    def _notify_changed(self, changed_attribute: str, value: Any) -> None:
+        self._forward("_notify_changed", (changed_attribute, value))
+
+    def _notify_change_start(self, changing_attribute: str) -> None:
+        self._forward("_notify_change_start", (changing_attribute,))
+
+    def _notify_batch_changed(self, changes: dict[str, Any]) -> None:
+        self._forward("_notify_batch_changed", (changes,))
+
+
+class Instrumentation:
+    """Collects the timings of the notifications of `Observer` instances.
+
+    Use `enable_instrumentation()` to install an instance.
+    """
+
+    def __init__(
+        self,
+        latency_budget: float | None = None,
+        on_slow_observer: Callable[[SlowNotification], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            latency_budget (float | None): Calls `on_slow_observer` for notifications
+                taking longer than this number of seconds.
+            on_slow_observer (Callable[[SlowNotification], None] | None): Called in
+                the thread delivering a notification (e.g. a worker thread of the
+                dispatcher) after it exceeded the latency budget.
+        """
+
+        self._latency_budget = latency_budget
+        self._on_slow_observer = on_slow_observer
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        """Guards `_thread_counters`, `_labels` and `_timed_observers`, which are only
+        changed on the first notification of a thread or an observer, and when an
+        observer is collected."""
+        self._thread_counters: list[_ThreadCounters] = []
+        self._labels: dict[int, str] = {}
+        self._timed_observers: dict[int, _TimedObserver] = {}
+        """The timed observers dispatched instead of the observers, by observer id."""
+        self._started = time.perf_counter()
+
+    def _counters(self) -> _ThreadCounters:
+        counters = _ThreadCounters()
+        with self._lock:
+            self._thread_counters.append(counters)
+        self._local.counters = counters
+        return counters
+
+    def _add_label(self, key: int, observer: Any) -> None:
+        observer = _unwrap_observer(observer)
+        with self._lock:
+            self._labels[key] = f"{type(observer).__qualname__} at {id(observer):#x}"
+        # forgets the observer before its id can be reused by a new object
+        with contextlib.suppress(TypeError):  # not weakly referenceable
+            weakref.finalize(observer, self._forget, key)
+
+    def _forget(self, key: int) -> None:
+        with self._lock:
+            self._labels.pop(key, None)
+            self._timed_observers.pop(key, None)
+            for counters in self._thread_counters:
+                counters.observers.pop(key, None)
+
+    def _deliver(
+        self,
+        observers: Iterable[Any],
+        method: str,
+        args: tuple[Any, ...],
+        dispatcher: "Dispatcher | None",
+    ) -> None:
+        """Notifies the observers like `ObservableObject._dispatch` and records the
+        time of every call in the thread delivering it."""
+
+        if dispatcher is None:
+            for observer in tuple(observers):
+                self._call(observer, method, args)
+            return
+        for observer in tuple(observers):
+            timed_observer = self._get_timed_observer(observer)
+            if timed_observer is not None:
+                dispatcher.dispatch(timed_observer, method, args)
+
+    def _get_timed_observer(self, observer: Any) -> "_TimedObserver | None":
+        """Returns the timed observer dispatched instead of `observer`, `None` if a
+        weakly registered observer was collected.
+
+        There is one timed observer per observer, so that dispatchers keep the order
+        of the notifications of the observer.
+        """
+
+        observer = _unwrap_observer(observer)
+        key = id(observer)
+        timed_observer = self._timed_observers.get(key)
+        if timed_observer is None:
+            if getattr(observer, "_ref", None) is not None:
+                return None
+            timed_observer = _TimedObserver(self, observer)
+            with self._lock:
+                timed_observer = self._timed_observers.setdefault(key, timed_observer)
+            if key not in self._labels:
+                self._add_label(key, observer)
+        return timed_observer
+
+    def _call(self, observer: Any, method: str, args: tuple[Any, ...]) -> None:
+        start = time.perf_counter()
+        try:
+            getattr(observer, method)(*args)
+        finally:
+            duration = time.perf_counter() - start
+            argument = args[0]
+            paths = (argument,) if isinstance(argument, str) else tuple(argument)
+            self._record(observer, paths, duration)
+
+        if (
+            self._on_slow_observer is not None
+            and self._latency_budget is not None
+            and duration > self._latency_budget
+        ):
+            path = argument if isinstance(argument, str) else ""
+            self._on_slow_observer(SlowNotification(observer, method, path, duration))
+
+    def _record(
+        self,
+        observer: Any,
+        paths: tuple[str, ...],
+        duration: float,
+    ) -> None:
+        counters = getattr(self._local, "counters", None) or self._counters()
+        key = id(observer)
+        counter = counters.observers.get(key)
+        if counter is None:
+            if key not in self._labels:
+                self._add_label(key, observer)
+            counter = counters.observers[key] = [0, 0.0, 0.0]
+        counter[0] += 1
+        counter[1] += duration
+        if duration > counter[2]:
+            counter[2] = duration
+
+        for prefix in {get_root_attribute_name(path) for path in paths}:
+            counter = counters.paths.get(prefix)
+            if counter is None:
+                counter = counters.paths[prefix] = [0, 0.0, 0.0]
+            counter[0] += 1
+            counter[1] += duration
+            if duration > counter[2]:
+                counter[2] = duration
+
+    def stats(self) -> InstrumentationStats:
+        """Returns a snapshot of the collected timings."""
+
+        elapsed = time.perf_counter() - self._started
+        with self._lock:
+            thread_counters = list(self._thread_counters)
+            labels = dict(self._labels)
+
+        def to_stats(counter: _Counter) -> CallStats:
+            calls, total_time, max_time = counter
+            return CallStats(int(calls), total_time, max_time, calls / elapsed)
+
+        return InstrumentationStats(
+            observers={
+                labels[key]: to_stats(counter)
+                for key, counter in _merge(
+                    counters.observers for counters in thread_counters
+                ).items()
+                # skips observers collected while merging
+                if key in labels
+            },
+            paths={
+                prefix: to_stats(counter)
+                for prefix, counter in _merge(
+                    counters.paths for counters in thread_counters
+                ).items()
+            },
+            elapsed=elapsed,
+        )
+
+    def reset(self) -> None:
+        """Discards the collected timings."""
+
+        with self._lock:
+            self._thread_counters = []
+            self._labels = {}
+            self._timed_observers = {}
+            self._local = threading.local()
+            self._started = time.perf_counter()
+
+
+def enable_instrumentation(
+    latency_budget: float | None = None,
+    on_slow_observer: Callable[[SlowNotification], None] | None = None,
+) -> Instrumentation:
+    """Starts timing the notifications of all `Observer` instances.
+
+    Replaces the instrumentation enabled before. See `Instrumentation` for the
+    arguments.
+    """
+
+    instrumentation = Instrumentation(latency_budget, on_slow_observer)
+    observable_object._instrumentation = instrumentation
+    return instrumentation
+
+
+def disable_instrumentation() -> None:
+    """Stops timing notifications."""
+
+    observable_object._instrumentation = None
+
+
+def get_instrumentation() -> Instrumentation | None:
+    """Returns the enabled instrumentation, if any."""
+
+    return observable_object._instrumentation
+
+
+def stats() -> InstrumentationStats:
+    """Returns a snapshot of the timings of the enabled instrumentation."""
+
+    instrumentation = get_instrumentation()
+    if instrumentation is None:
+        raise RuntimeError("Instrumentation is not enabled.")
+    return instrumentation.stats()
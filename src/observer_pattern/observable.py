@@ -1,53 +1,791 @@
 import logging
-from typing import Any
+import threading
+from abc import ABCMeta
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
-from observer_pattern.observable_object import ObservableObject
-from observer_pattern.utils.helpers import is_property_attribute
+from observer_pattern.computed import _dependency_trackers, computed
+from observer_pattern.events import ContainerEvent
+from observer_pattern.observable_object import (
+    ObservableObject,
+    _elide_write,
+    _ObservableContainer,
+    _version_clock,
+    _WritePolicy,
+)
+from observer_pattern.patch import Patch, PatchOperation, apply_patch, diff
+from observer_pattern.snapshot import SnapshotEntry, iter_snapshot, to_dict
+from observer_pattern.utils.change_detection import (
+    EqualityStrategy,
+    NotificationCounters,
+    resolve_equality,
+)
+from observer_pattern.utils.helpers import (
+    AttributeKind,
+    build_attribute_kinds,
+    classify_attribute,
+    get_object_by_path,
+    get_parent_paths,
+    get_root_attribute_name,
+)
+
+if TYPE_CHECKING:
+    from observer_pattern.observable_object import _ListIndex
 
 logger = logging.getLogger(__name__)
 
+_UNRESOLVED = object()
+"""Placeholder for batched changes that are resolved when the batch is delivered, i.e.
+computed attributes (which are only recomputed once) and structural changes of
+containers (which are delivered as the resulting container)."""
+
+
+_ObservableT = TypeVar("_ObservableT", bound="Observable")
+
+_InitPlan = tuple[dict[str, Any], tuple[tuple[str, Any], ...]]
+"""The class defaults copied into the instances of a class: the defaults that are
+stored as they are, and the lists, dicts and other values that are wrapped per
+instance (see `_build_init_plan`)."""
+
+_PLAIN_TYPES = (int, float, complex, str, bytes, bool, type(None), tuple, frozenset)
+"""Types of class defaults that are never wrapped or observed."""
+
+_INSTANCE_STATE = frozenset(
+    {
+        *_ObservableContainer._CONTAINER_SLOTS,
+        "_property_values",
+        "_property_counters",
+        "_computed_values",
+        "_computed_inputs",
+        "_computed_dependents",
+        "_batch_depth",
+        "_batched_changes",
+        "_write_counters",
+    }
+)
+"""Names of the instance attributes holding the observer bookkeeping of an
+`Observable`, which are not part of its state (e.g. when pickled)."""
+
+
+class _ObservedProperty(property):
+    """Wraps a property of an `Observable` subclass, notifying the observers of the
+    instance about the value of every read (see `Observable._notify_property_read`).
+
+    Installed in place of the properties of a class when it is created or when a
+    property is assigned to it, so that reading other attributes does not pay for
+    the notification.
+    """
+
+    def __init__(self, wrapped: property, name: str) -> None:
+        super().__init__(wrapped.fget, wrapped.fset, wrapped.fdel, wrapped.__doc__)
+        self._wrapped = wrapped
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        value = self._wrapped.__get__(instance, owner)
+        instance._notify_property_read(self._name, value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self._wrapped.__set__(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self._wrapped.__delete__(instance)
+
+
+class _ObservableMeta(ABCMeta):
+    """Metaclass invalidating the attribute classification of modified classes.
+
+    Assigning or deleting a class attribute at runtime (e.g. monkey-patching a
+    property onto a class) clears the attribute classification table and the
+    initialisation plan of the class and of all its subclasses. They are rebuilt
+    lazily on the next lookup. Assigned properties are wrapped in an
+    `_ObservedProperty`.
+    """
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if isinstance(value, property) and not isinstance(value, _ObservedProperty):
+            value = _ObservedProperty(value, name)
+        super().__setattr__(name, value)
+        if name != "_attribute_kinds":
+            cls._invalidate_class_caches()
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        cls._invalidate_class_caches()
+
+    def _invalidate_class_caches(cls) -> None:
+        pending = [cls]
+        while pending:
+            klass = pending.pop()
+            if "_attribute_kinds" in vars(klass):
+                vars(klass)["_attribute_kinds"].clear()
+            if vars(klass).get("_init_plan") is not None:
+                # bypasses `__setattr__`, which would invalidate the caches again
+                type.__setattr__(klass, "_init_plan", None)
+            pending.extend(klass.__subclasses__())
+
+
+class Observable(ObservableObject, metaclass=_ObservableMeta):
+    _attribute_kinds: ClassVar[dict[str, AttributeKind]] = {}
+    """Maps attribute names to their `AttributeKind`. Every subclass gets its own
+    table which is built in `__init_subclass__` and extended lazily with names that
+    are not defined on the class (e.g. instance attributes)."""
+    _property_equality: ClassVar[Callable[[Any, Any], bool] | None] = None
+    """Comparator used to suppress property read notifications of unchanged values.
+    `None` notifies on every property read."""
+    _write_equality: ClassVar[Callable[[Any, Any], bool] | None] = None
+    """Comparator used to suppress the notifications of writes that leave the value
+    of an attribute unchanged. `None` notifies on every write."""
+    _attribute_write_equality: ClassVar[
+        dict[str, Callable[[Any, Any], bool] | None]
+    ] = {}
+    """Overrides `_write_equality` per attribute name."""
+    _init_plan: ClassVar[_InitPlan | None] = None
+    """The class defaults copied into every instance. Built per class on the first
+    instantiation (see `_get_init_plan`)."""
+    _computed_names: ClassVar[frozenset[str]] = frozenset()
+    """Names of the `computed` attributes of the class."""
+    _batch_depth = 0
+    """Nesting depth of active `batch()` contexts. Overridden per instance."""
+    _thread_safe_instances: ClassVar[bool] = False
+    """Whether instances of the class (and the containers they hold) register
+    observers thread-safely."""
+
+    # created per instance when needed, see `_INSTANCE_STATE`
+    _property_values: dict[str, Any]
+    _property_counters: NotificationCounters
+    _computed_values: dict[str, Any]
+    _computed_inputs: dict[str, set[str]]
+    _computed_dependents: dict[str, set[str]]
+    _batched_changes: dict[str, Any]
+
+    def __init_subclass__(
+        cls,
+        property_equality: EqualityStrategy | None = None,
+        thread_safe: bool | None = None,
+        lazy_wrapping: bool | None = None,
+        write_equality: EqualityStrategy
+        | Mapping[str, EqualityStrategy | None]
+        | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Configures subclasses of `Observable`.
+
+        Args:
+            property_equality (EqualityStrategy | None):
+                Opts into change-detecting property notifications. Reading a
+                property only notifies the observers if the returned value differs
+                from the last value the property produced, as decided by the given
+                strategy (`"identity"`, `"equality"` or a custom comparator).
+                Inherited from the base class if not given.
+            thread_safe (bool | None):
+                Opts into registering observers under a lock, so that the instances
+                can be changed from several threads. Observers are notified without
+                locking, as the observer mappings are replaced on every registration
+                (copy-on-write). Inherited from the base class if not given.
+            lazy_wrapping (bool | None):
+                Opts into wrapping the lists and dicts nested in list and dict
+                attributes when they are first accessed, instead of converting the
+                whole nested structure on assignment. Speeds up assigning large
+                structures of which only a part is accessed. Inherited from the base
+                class if not given.
+            write_equality (EqualityStrategy | Mapping[str, EqualityStrategy | None]
+                | None):
+                Opts into eliding writes that do not change the value of an attribute
+                or of an item of the lists and dicts held by it, as decided by the
+                given strategy. Elided writes neither notify the observers nor wrap
+                the value. A mapping configures the strategies per attribute name,
+                where `None` notifies every write of the attribute. Inherited from
+                the base class if not given.
+
+        Example:
+
+        ```python
+        >>> class Dashboard(Observable, property_equality="equality"):
+        ...     @property
+        ...     def total(self) -> int:
+        ...         return sum(self.values)
+        ```
+        """
+
+        super().__init_subclass__(**kwargs)
+        if property_equality is not None:
+            cls._property_equality = staticmethod(resolve_equality(property_equality))
+        if thread_safe is not None:
+            cls._thread_safe_instances = thread_safe
+        if lazy_wrapping is not None:
+            cls._lazy_wrapping = lazy_wrapping
+        if isinstance(write_equality, Mapping):
+            cls._attribute_write_equality = {
+                **cls._attribute_write_equality,
+                **{
+                    name: None if strategy is None else resolve_equality(strategy)
+                    for name, strategy in write_equality.items()
+                },
+            }
+        elif write_equality is not None:
+            cls._write_equality = staticmethod(resolve_equality(write_equality))
+        cls._computed_names = frozenset(
+            name
+            for klass in cls.__mro__
+            for name, value in vars(klass).items()
+            if isinstance(value, computed)
+        )
+        _wrap_properties(cls)
+        cls._attribute_kinds = build_attribute_kinds(cls)
 
-class Observable(ObservableObject):
     def __init__(self) -> None:
+        cls = type(self)
+        instance_dict = self.__dict__
+        if cls._property_equality is not None:
+            instance_dict["_property_values"] = {}
+            instance_dict["_property_counters"] = NotificationCounters()
+        if cls._computed_names:
+            instance_dict["_computed_values"] = {}
+            instance_dict["_computed_inputs"] = {}
+            instance_dict["_computed_dependents"] = {}
         super().__init__()
-        class_attrs = {
-            k: type(self).__dict__[k]
-            for k in set(type(self).__dict__)
-            - set(Observable.__dict__)
-            - set(self.__dict__)
-        }
-        for name, value in class_attrs.items():
-            if isinstance(value, property) or callable(value):
+        if cls._thread_safe_instances:
+            self._enable_thread_safety()
+
+        # attributes set by subclasses before calling `super().__init__()` keep their
+        # values
+        defaults, wrapped_defaults = _get_init_plan(cls)
+        if instance_dict.keys().isdisjoint(defaults):
+            instance_dict.update(defaults)
+        else:
+            for name, value in defaults.items():
+                instance_dict.setdefault(name, value)
+        if wrapped_defaults:
+            self._initialise_attributes(
+                (name, value)
+                for name, value in wrapped_defaults
+                if name not in instance_dict
+            )
+
+    def _initialise_attributes(self, attributes: Iterable[tuple[str, Any]]) -> None:
+        """Wraps the values and stores them as attributes without notifying the
+        observers, e.g. the class defaults of a new instance."""
+
+        instance_dict = self.__dict__
+        cls = type(self)
+        initialise_new_objects = self._initialise_new_objects
+        has_write_policies = (
+            cls._write_equality is not None or cls._attribute_write_equality
+        )
+        for name, value in attributes:
+            if type(value) in _PLAIN_TYPES:
+                instance_dict[name] = value
                 continue
-            self.__dict__[name] = self._initialise_new_objects(name, value)
+            new_value = initialise_new_objects(name, value)
+            if has_write_policies and isinstance(new_value, _ObservableContainer):
+                policy = self._get_write_policy(name)
+                if policy is not None:
+                    new_value._apply_write_policy(policy)
+            instance_dict[name] = new_value
+
+    @classmethod
+    def from_records(
+        cls: type[_ObservableT], records: Iterable[Mapping[str, Any]]
+    ) -> list[_ObservableT]:
+        """Creates an instance per record, with the attributes set to the values of
+        the record.
+
+        The instances are created without calling the `__init__` method of the class,
+        i.e. attributes missing from a record keep their class defaults. Setting the
+        attributes does not notify, as the new instances have no observers yet, but
+        records a version of the attributes like an assignment (see `diff`).
+
+        Raises:
+            ValueError: If a record contains a private name (starting with `_`), or
+                the name of a method, property or computed attribute.
+
+        Example:
+
+        ```python
+        >>> channels = Channel.from_records(
+        ...     {"name": f"ch{i}", "value": 0.0} for i in range(100_000)
+        ... )
+        ```
+        """
+
+        instances = []
+        checked_names: set[str] = set()
+        # the instances are returned together, so their attributes share a version
+        version = _version_clock.advance()
+        for record in records:
+            if not checked_names.issuperset(record):
+                for name in record:
+                    _check_record_name(cls, name)
+                checked_names.update(record)
+            instance = cls.__new__(cls)
+            # keeps the class defaults of the recorded attributes from being wrapped
+            instance.__dict__.update(record)
+            Observable.__init__(instance)
+            instance._initialise_attributes(record.items())
+            if record:
+                instance_dict = instance.__dict__
+                instance_dict["_version"] = version
+                instance_dict["_child_versions"] = dict.fromkeys(record, version)
+            instances.append(instance)
+        return instances
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if hasattr(self, "_observers"):
+        cls = type(self)
+        instance_dict = self.__dict__
+        if "_observers" in instance_dict:
+            if (
+                isinstance(value, _ObservableContainer)
+                and instance_dict.get(name) is value
+            ):
+                # e.g. `instance.samples += 1`, whose in-place operator has already
+                # notified the change of the container
+                return
+            policy = None
+            if cls._write_equality is not None or cls._attribute_write_equality:
+                policy = self._get_write_policy(name)
+                if (
+                    policy is not None
+                    and name in instance_dict
+                    and _elide_write(policy, instance_dict[name], value)
+                ):
+                    return
             self._remove_observer_if_observable(name)
             value = self._initialise_new_objects(name, value)
+            if policy is not None and isinstance(value, _ObservableContainer):
+                value._apply_write_policy(policy)
             self._notify_change_start(name)
 
         super().__setattr__(name, value)
 
+        if (
+            cls._property_equality is not None
+            and _get_attribute_kind(cls, name) is AttributeKind.PROPERTY
+            and "_property_values" in instance_dict
+        ):
+            # the observers are notified about the written value below
+            instance_dict["_property_values"][name] = value
+        if not name.startswith("_"):
+            self._record_versions((name,))
+
         self._notify_changed(name, value)
 
-    def __getattribute__(self, name: str) -> Any:
-        value = super().__getattribute__(name)
-        if is_property_attribute(self, name):
+    def __delattr__(self, name: str) -> None:
+        held = name in self.__dict__
+        if held:
+            self._remove_observer_if_observable(name)
+        super().__delattr__(name)
+        if held and not name.startswith("_"):
+            # lets `diff` emit the removal of the attribute
+            self._record_versions((name,))
+
+    def _get_write_policy(self, name: str) -> _WritePolicy | None:
+        """Returns the write policy of the attribute `name`, `None` if every write
+        notifies."""
+
+        cls = type(self)
+        equals = cls._attribute_write_equality.get(name, cls._write_equality)
+        if equals is None:
+            return None
+        counters = self.__dict__.get("_write_counters")
+        if counters is None:
+            counters = self.__dict__["_write_counters"] = NotificationCounters()
+        return (equals, counters)
+
+    def get_write_notification_counters(self) -> NotificationCounters:
+        """Returns the counters of notified and elided writes.
+
+        Only the writes of attributes with a `write_equality` strategy are counted,
+        including the writes of the items of the lists and dicts they hold.
+        """
+
+        counters = self.__dict__.get("_write_counters")
+        return counters if counters is not None else NotificationCounters()
+
+    def _notify_property_read(self, name: str, value: Any) -> None:
+        equals = self._property_equality
+        if equals is None:
             self._notify_changed(name, value)
+            return
+
+        property_values: dict[str, Any] = self._property_values
+        counters: NotificationCounters = self._property_counters
+        if name in property_values and equals(property_values[name], value):
+            counters.suppressed += 1
+            return
+
+        property_values[name] = value
+        counters.emitted += 1
+        self._notify_changed(name, value)
+
+    def invalidate_property_cache(self, name: str | None = None) -> None:
+        """Forgets the last value of the property `name` (or of all properties).
+
+        The next read of an invalidated property notifies the observers, regardless of
+        the configured `property_equality`.
+        """
+
+        if self._property_equality is None:
+            return
+        if name is None:
+            self._property_values.clear()
+        else:
+            self._property_values.pop(name, None)
 
+    def get_property_notification_counters(self) -> NotificationCounters:
+        """Returns the counters of emitted and suppressed property notifications.
+
+        Only property reads of classes using `property_equality` are counted.
+        """
+
+        if self._property_equality is None:
+            return NotificationCounters()
+        return self._property_counters
+
+    def _get_computed_value(self, attribute: computed[Any]) -> Any:
+        name = attribute.name
+        computed_values: dict[str, Any] = self._computed_values
+        if name in computed_values:
+            return computed_values[name]
+
+        version = self._version
+        inputs: set[str] = set()
+        trackers = _dependency_trackers.stack
+        trackers.append((self, inputs))
+        tracking = _begin_read_tracking(type(self))
+        try:
+            value = attribute.func(self)
+        finally:
+            trackers.pop()
+            if tracking:
+                _end_read_tracking(type(self))
+
+        if self._version != version:
+            # changed while being evaluated (e.g. by another thread), the value may
+            # be computed from inputs read before the change
+            return value
+        computed_values[name] = value
+        self._computed_inputs[name] = inputs
+        for input_name in inputs:
+            self._computed_dependents.setdefault(input_name, set()).add(name)
         return value
 
+    def _invalidate_computed(self, changed_attribute: str) -> None:
+        """Discards the cached values of the computed attributes depending on the
+        changed attribute, directly or through other computed attributes, and notifies
+        the observers about their new values."""
+
+        computed_dependents: dict[str, set[str]] = self._computed_dependents
+        if not computed_dependents.get(get_root_attribute_name(changed_attribute)):
+            return
+
+        # invalidated transitively before notifying, so that no stale value of a
+        # computed input is read while recomputing
+        computed_values: dict[str, Any] = self._computed_values
+        computed_inputs: dict[str, set[str]] = self._computed_inputs
+        invalidated: dict[str, None] = {}
+        pending = [get_root_attribute_name(changed_attribute)]
+        while pending:
+            for name in list(computed_dependents.get(pending.pop(), ())):
+                if name in invalidated:
+                    continue
+                invalidated[name] = None
+                computed_values.pop(name, None)
+                for input_name in computed_inputs.pop(name, ()):
+                    computed_dependents[input_name].discard(name)
+                pending.append(name)
+
+        for name in invalidated:
+            if self._batch_depth:
+                self._record_batched_change(name, _UNRESOLVED)
+            elif self._observers or self._subscriptions:
+                self._notify_changed(name, getattr(self, name))
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Defers the change notifications of this object until the context exits.
+
+        Repeated changes of the same access path are coalesced to the last value and
+        delivered in a single `Observer.on_batch_change` call (and forwarded as one
+        batch to parent observables). `on_change_start` notifications are dropped
+        while batching. Batches can be nested; the changes are delivered when the
+        outermost batch exits, also if it exits with an exception.
+
+        Example:
+
+        ```python
+        >>> with device.batch():
+        ...     device.voltage = 1.0
+        ...     device.current = 0.1
+        ```
+        """
+
+        if not self._batch_depth:
+            self.__dict__["_batched_changes"] = {}
+        self.__dict__["_batch_depth"] = self._batch_depth + 1
+        try:
+            yield
+        finally:
+            self.__dict__["_batch_depth"] -= 1
+            if not self._batch_depth:
+                self._flush_batched_changes()
+
+    def _record_batched_change(self, changed_attribute: str, value: Any) -> None:
+        batched_changes: dict[str, Any] = self._batched_changes
+        if isinstance(value, ContainerEvent):
+            value = _UNRESOLVED
+        # move the access path to the end to keep the order of the last changes
+        batched_changes.pop(changed_attribute, None)
+        batched_changes[changed_attribute] = value
+
+    def _flush_batched_changes(self) -> None:
+        batched_changes: dict[str, Any] = self.__dict__.pop("_batched_changes")
+
+        # drop changes that were superseded by a later change of a parent path
+        changes: dict[str, Any] = {}
+        changed_later: set[str] = set()
+        for path, value in reversed(batched_changes.items()):
+            if not changed_later.isdisjoint(get_parent_paths(path)):
+                continue
+            changed_later.add(path)
+            changes[path] = (
+                get_object_by_path(self, path) if value is _UNRESOLVED else value
+            )
+        changes = dict(reversed(changes.items()))
+
+        if changes:
+            self._notify_batch_changed(changes)
+
+    def _notify_batch_changed(self, changes: dict[str, Any]) -> None:
+        if self._batch_depth:
+            for path, value in changes.items():
+                self._record_batched_change(path, value)
+            return
+
+        super()._notify_batch_changed(changes)
+        if type(self)._computed_names:
+            for path in changes:
+                self._invalidate_computed(path)
+
+    def _notify_change_start(self, changing_attribute: str) -> None:
+        if self._batch_depth:
+            return
+        super()._notify_change_start(changing_attribute)
+
+    def _notify_changed(self, changed_attribute: str, value: Any) -> None:
+        if self._batch_depth:
+            self._record_batched_change(changed_attribute, value)
+        else:
+            super()._notify_changed(changed_attribute, value)
+        if type(self)._computed_names:
+            self._invalidate_computed(changed_attribute)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns a copy of the public state of the object made of builtin dicts and
+        lists (see `observer_pattern.snapshot.to_dict`)."""
+
+        return to_dict(self)
+
+    def iter_snapshot(self) -> Iterator[SnapshotEntry]:
+        """Yields the state of the object as a stream of entries (see
+        `observer_pattern.snapshot.iter_snapshot`)."""
+
+        return iter_snapshot(self)
+
+    def diff(self, since_version: int) -> Patch:
+        """Returns the changes of the object since `since_version` (see
+        `observer_pattern.patch.diff`)."""
+
+        return diff(self, since_version)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # pickled without observers, locks and dispatcher, e.g. when journaled
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in _INSTANCE_STATE
+        }
+        return _restore_observable, (type(self), state)
+
+    def apply_patch(self, operations: Iterable[PatchOperation]) -> None:
+        """Applies the operations of a patch returned by `diff()` to the object."""
+
+        apply_patch(self, operations)
+
+    def _observable_children(self) -> Iterable[ObservableObject]:
+        return [
+            value
+            for value in self.__dict__.values()
+            if isinstance(value, ObservableObject)
+        ]
+
     def _remove_observer_if_observable(self, name: str) -> None:
-        if not is_property_attribute(self, name):
-            current_value = getattr(self, name, None)
+        if _get_attribute_kind(type(self), name) is not AttributeKind.PROPERTY:
+            # only the values held by the instance are observed by it
+            current_value = self.__dict__.get(name)
 
             if isinstance(current_value, ObservableObject):
                 current_value._remove_observer(self, name)
 
     def _construct_extended_attr_path(
-        self, observer_attr_name: str, instance_attr_name: str
+        self, observer_attr_name: "str | _ListIndex", instance_attr_name: str
     ) -> str:
         if observer_attr_name != "":
+            if instance_attr_name == "":
+                return f"{observer_attr_name}"
             return f"{observer_attr_name}.{instance_attr_name}"
         return instance_attr_name
+
+
+def _wrap_properties(cls: type) -> None:
+    """Replaces the properties defined by `cls` and inherited from base classes that
+    are not `Observable` subclasses (e.g. mixins) by `_ObservedProperty` wrappers."""
+
+    seen: set[str] = set()
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if isinstance(value, property) and not isinstance(value, _ObservedProperty):
+                # bypasses `_ObservableMeta.__setattr__`, the caches are built after
+                type.__setattr__(cls, name, _ObservedProperty(value, name))
+
+
+_PLAIN_GETATTRIBUTE = vars(object)["__getattribute__"]
+_read_tracking_lock = threading.Lock()
+_read_tracking_depths: dict[type, int] = {}
+"""Number of computed attributes being evaluated per class, in any thread."""
+
+
+def _tracking_getattribute(self: Observable, name: str) -> Any:
+    """The `__getattribute__` of classes with computed attributes being evaluated.
+
+    Records the attributes read from the instance whose computed attribute is being
+    evaluated by the current thread as the inputs of the computed attribute.
+    """
+
+    value = object.__getattribute__(self, name)
+    trackers = _dependency_trackers.stack
+    if trackers:
+        instance, inputs = trackers[-1]
+        if (
+            instance is self
+            and _get_attribute_kind(type(self), name) is not AttributeKind.METHOD
+        ):
+            inputs.add(name)
+    return value
+
+
+def _begin_read_tracking(cls: type[Observable]) -> bool:
+    """Installs `_tracking_getattribute` on `cls` while a computed attribute of one of
+    its instances is evaluated. Reads are not intercepted otherwise.
+
+    Returns `False` for classes overriding `__getattribute__` themselves, which keep
+    their implementation. Their computed attributes do not track their inputs.
+    """
+
+    with _read_tracking_lock:
+        depth = _read_tracking_depths.get(cls, 0)
+        if not depth:
+            getattribute = cls.__getattribute__
+            if (
+                getattribute is not _PLAIN_GETATTRIBUTE
+                and getattribute is not _tracking_getattribute
+            ):
+                return False
+            # bypasses `_ObservableMeta.__setattr__`, which would invalidate the caches
+            type.__setattr__(cls, "__getattribute__", _tracking_getattribute)
+        _read_tracking_depths[cls] = depth + 1
+    return True
+
+
+def _end_read_tracking(cls: type[Observable]) -> None:
+    with _read_tracking_lock:
+        depth = _read_tracking_depths.pop(cls) - 1
+        if depth:
+            _read_tracking_depths[cls] = depth
+        else:
+            # inherits the `__getattribute__` of the base classes again
+            type.__delattr__(cls, "__getattribute__")
+
+
+def _restore_observable(cls: type[Observable], state: dict[str, Any]) -> Observable:
+    """Unpickles an `Observable` without calling the `__init__` method of `cls`."""
+
+    instance = cls.__new__(cls)
+    instance.__dict__.update(state)
+    Observable.__init__(instance)
+    instance._initialise_attributes(state.items())
+    return instance
+
+
+def _check_record_name(cls: type[Observable], name: str) -> None:
+    """Raises a `ValueError` if `name` is not a public data attribute of `cls`."""
+
+    if not isinstance(name, str) or name.startswith("_"):
+        raise ValueError(f"Cannot set private attribute {name!r} from a record.")
+    if (
+        name in cls._computed_names
+        or _get_attribute_kind(cls, name) is not AttributeKind.DATA
+    ):
+        raise ValueError(
+            f"Cannot set {name!r} from a record, as it is not a data attribute of "
+            f"{cls.__name__}."
+        )
+
+
+def _get_attribute_kind(cls: type[Observable], name: str) -> AttributeKind:
+    kinds = cls._attribute_kinds
+    kind = kinds.get(name)
+    if kind is None:
+        kind = kinds[name] = classify_attribute(cls, name)
+    return kind
+
+
+def _build_init_plan(cls: type[Observable]) -> _InitPlan:
+    """Returns the class defaults that instances of `cls` copy into their `__dict__`.
+
+    These are the data attributes defined by `cls` and its base classes, except for
+    the attributes of `Observable` itself, dunder names, properties, computed
+    attributes and methods.
+    """
+
+    framework_classes = set(Observable.__mro__)
+    framework_names = {name for klass in Observable.__mro__ for name in vars(klass)}
+    seen: set[str] = set()
+    defaults: dict[str, Any] = {}
+    wrapped_defaults: list[tuple[str, Any]] = []
+    for klass in cls.__mro__:
+        if klass in framework_classes:
+            continue
+        for name, value in vars(klass).items():
+            # the first definition along the MRO hides the others
+            if name in seen:
+                continue
+            seen.add(name)
+            if (
+                name in framework_names
+                or (name.startswith("__") and name.endswith("__"))
+                or isinstance(value, property | computed | classmethod | staticmethod)
+                or callable(value)
+            ):
+                continue
+            if type(value) in _PLAIN_TYPES:
+                defaults[name] = value
+            else:
+                wrapped_defaults.append((name, value))
+    return defaults, tuple(wrapped_defaults)
+
+
+def _get_init_plan(cls: type[Observable]) -> _InitPlan:
+    plan = cls.__dict__.get("_init_plan")
+    if plan is None:
+        plan = _build_init_plan(cls)
+        # bypasses `_ObservableMeta.__setattr__`, which would discard the plan
+        type.__setattr__(cls, "_init_plan", plan)
+    return plan
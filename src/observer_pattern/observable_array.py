@@ -0,0 +1,157 @@
+"""Observable NumPy arrays.
+
+Requires `numpy`. Arrays assigned to `Observable` attributes (or stored in observable
+lists and dicts) are wrapped automatically once `numpy` is imported.
+"""
+
+from typing import Any, ClassVar
+
+import numpy as np
+
+from observer_pattern.events import ArrayUpdate
+from observer_pattern.observable_object import (
+    _ListIndex,
+    _ObservableContainer,
+    _version_clock,
+)
+from observer_pattern.utils.identity_registry import IdentityRegistry
+
+
+def _unwrap(value: Any) -> Any:
+    """Returns observable arrays as plain views, which are not notified about."""
+
+    if isinstance(value, _ObservableArray):
+        return value.view(np.ndarray)
+    if isinstance(value, tuple):
+        return tuple(_unwrap(item) for item in value)
+    return value
+
+
+def _read_only(values: Any) -> Any:
+    if isinstance(values, np.ndarray):
+        values = values.view(np.ndarray)
+        values.flags.writeable = False
+    return values
+
+
+class _ObservableArray(np.ndarray, _ObservableContainer):
+    """`numpy.ndarray` notifying every write as a single `ArrayUpdate`.
+
+    The observable array is a view of the assigned array, so wrapping does not copy
+    the data (and writes through the original array are not observed). Element,
+    slice, mask and index-array assignments, in-place operators (e.g. `+=`), ufuncs
+    writing into the array (`out=`) and `fill()` / `sort()` notify the observers.
+    Indexing returns plain arrays, and writes through views or other in-place
+    methods are not observed.
+    """
+
+    # ndarrays support weak references already
+    __slots__ = tuple(
+        name for name in _ObservableContainer._CONTAINER_SLOTS if name != "__weakref__"
+    )
+
+    _snapshot_as_value: ClassVar[bool] = True
+
+    def _init_container_state(self) -> None:
+        self._observers = None
+        self._extended_attr_paths = None
+        self._subscriptions = None
+        self._thread_safe = False
+        self._registration_lock = None
+        self._version = 0
+        self._child_versions = None
+        self._dispatcher = None
+        self._write_policy = None
+
+    @classmethod
+    def wrap(cls: type["_ObservableArray"], original: np.ndarray) -> "_ObservableArray":
+        return original.view(cls)
+
+    def __array_finalize__(self, obj: Any) -> None:
+        # views derived from the array (e.g. `array.T`) start without observers
+        self._init_container_state()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.view(np.ndarray)[_unwrap(key)]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = _unwrap(key)
+        array = self.view(np.ndarray)
+        self._notify_change_start("")
+        array[key] = _unwrap(value)
+        # a view for basic indices, and the assigned values broadcast to the
+        # selection (a copy) for masks and index arrays
+        self._notify_updated(key, array[key])
+
+    def _notify_updated(self, key: Any, values: Any) -> None:
+        self._version = _version_clock.advance()
+        self._notify_changed("", ArrayUpdate(key, _read_only(values)))
+
+    def __array_ufunc__(
+        self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any
+    ) -> Any:
+        outputs = kwargs.get("out", ())
+        if method == "at":
+            # e.g. `np.add.at(array, indices, 1)` changes the first input in place
+            outputs = inputs[:1]
+        changed = [output for output in outputs if isinstance(output, _ObservableArray)]
+        for output in changed:
+            output._notify_change_start("")
+
+        if "out" in kwargs:
+            kwargs["out"] = _unwrap(kwargs["out"])
+        result = getattr(ufunc, method)(*_unwrap(inputs), **kwargs)
+
+        for output in changed:
+            output._notify_updated(..., output.view(np.ndarray))
+        if changed and method != "at":
+            # in-place operators rebind the name to the result
+            return outputs[0] if len(outputs) == 1 else outputs
+        return result
+
+    def fill(self, value: Any) -> None:
+        self._notify_change_start("")
+        self.view(np.ndarray).fill(value)
+        self._notify_updated(..., self.view(np.ndarray))
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._notify_change_start("")
+        self.view(np.ndarray).sort(*args, **kwargs)
+        self._notify_updated(..., self.view(np.ndarray))
+
+    def _snapshot_copy(self) -> np.ndarray:
+        return self.view(np.ndarray).copy()
+
+    def __reduce__(self) -> Any:
+        # pickled as a plain array, see `_ObservableList.__reduce__`
+        return self.view(np.ndarray).__reduce__()
+
+    def _observable_children(self) -> list[Any]:
+        return []
+
+    def _remove_observer_if_observable(self, name: str) -> None:  # noqa: ARG002
+        # arrays hold no observable objects
+        return
+
+    def _construct_extended_attr_path(
+        self, observer_attr_name: "str | _ListIndex", instance_attr_name: str
+    ) -> str:
+        if observer_attr_name != "":
+            return f"{observer_attr_name}{instance_attr_name}"
+        return instance_attr_name
+
+
+_array_mapping: IdentityRegistry[_ObservableArray] = IdentityRegistry()
+"""Maps the wrapped arrays to their observable views. The views reference the
+wrapped array as their `base`."""
+
+
+def wrap_array(original: np.ndarray) -> _ObservableArray:
+    """Returns the observable view of `original`, reusing the view if the array was
+    wrapped before."""
+
+    wrapper = _array_mapping.get(original)
+    if wrapper is None:
+        wrapper = _ObservableArray.wrap(original)
+        _array_mapping.add(original, wrapper)
+    return wrapper
@@ -1,31 +1,302 @@
+import ast
+import bisect
+import itertools
 import logging
+import operator
+import sys
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, ClassVar
+from collections.abc import (
+    Callable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    Sequence,
+    ValuesView,
+)
+from copy import copy as shallow_copy
+from typing import TYPE_CHECKING, Any, ClassVar, SupportsIndex, TypeAlias
+
+from observer_pattern.events import DictUpdate, ListSplice
+from observer_pattern.utils.change_detection import NotificationCounters
+from observer_pattern.utils.identity_registry import IdentityRegistry
+from observer_pattern.utils.subscription_index import SubscriptionIndex
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
 
 if TYPE_CHECKING:
+    from observer_pattern.dispatchers import Dispatcher
+    from observer_pattern.instrumentation import Instrumentation
     from observer_pattern.observer.observer import Observer
 
 logger = logging.getLogger(__name__)
 
+_mapping_lock = threading.RLock()
+"""Serialises the lookup and creation of container wrappers of thread-safe objects."""
+
+
+class _VersionClock:
+    """Issues the versions of the changes of all observable objects."""
+
+    __slots__ = ("version",)
+
+    def __init__(self) -> None:
+        self.version = 0
+        """The version of the latest change."""
+
+    def advance(self) -> int:
+        self.version += 1
+        return self.version
+
+
+_version_clock = _VersionClock()
+
+_instrumentation: "Instrumentation | None" = None
+"""Times the notifications of `Observer` instances if enabled (see
+`observer_pattern.instrumentation`)."""
+
+_MAX_CACHED_PATHS = 1024
+"""Maximum number of extended access paths cached per registration of an observer."""
+
+
+_RegisteredObserver: TypeAlias = "ObservableObject | Observer | _WeakObserver"
+_Registration: TypeAlias = tuple["str | _ListIndex", int, _RegisteredObserver]
+"""A single observer registration `(attr_name, key, observer)`."""
+_ObserverMapping: TypeAlias = dict["str | _ListIndex", dict[int, _RegisteredObserver]]
+
+_WritePolicy = tuple[Callable[[Any, Any], bool], NotificationCounters]
+"""The comparator deciding whether a write leaves a value unchanged, and the counters
+of the notified and elided writes (see `Observable`'s `write_equality`)."""
+
+
+def _elide_write(policy: _WritePolicy, old: Any, new: Any) -> bool:
+    """Returns whether writing `new` over `old` is elided by the write policy, and
+    counts the write."""
+
+    equals, counters = policy
+    if old is new or equals(old, new):
+        counters.suppressed += 1
+        return True
+    counters.emitted += 1
+    return False
+
+
+def _group_observers(
+    observers_by_attr: "_ObserverMapping | _Registration | None",
+) -> Sequence[tuple["str | _ListIndex", tuple[_RegisteredObserver, ...]]]:
+    """Returns the observers of `ObservableObject._observers` grouped by attribute
+    name.
+
+    Returns copies, as observers may detach (or be collected) while being notified.
+    """
+
+    if observers_by_attr is None:
+        return ()
+    if isinstance(observers_by_attr, tuple):
+        return ((observers_by_attr[0], (observers_by_attr[2],)),)
+    return [
+        (attr_name, tuple(observers.values()))
+        for attr_name, observers in observers_by_attr.items()
+    ]
+
 
 class ObservableObject(ABC):
-    _list_mapping: ClassVar[dict[int, "_ObservableList"]] = {}
-    _dict_mapping: ClassVar[dict[int, "_ObservableDict"]] = {}
+    __slots__ = ()
+
+    _observers: "_ObserverMapping | _Registration | None"
+    """The registered observers per attribute name. Lists and dicts, which are mostly
+    observed by the object holding them only, start with `None` and store their first
+    registration as `_Registration` tuple."""
+    _list_mapping: ClassVar[IdentityRegistry["_ObservableList"]] = IdentityRegistry()
+    _dict_mapping: ClassVar[IdentityRegistry["_ObservableDict"]] = IdentityRegistry()
+    _subscriptions: SubscriptionIndex | None = None
+    """Observers that are only notified about some access paths. Created per instance
+    when the first observer subscribes to access paths."""
+    _thread_safe = False
+    """Whether observers are registered under `_registration_lock`. The observer
+    mappings are then replaced instead of modified (copy-on-write), so that they can be
+    iterated without locking. Enabled per instance by `_enable_thread_safety`."""
+    _registration_lock: "threading.RLock | None" = None
+    _extended_attr_paths: "dict[str, dict[str, str]] | None" = None
+    """Caches the extended access paths per attribute name of the observers (see
+    `_extend_attr_path`). Created on the first notification of an observer."""
+    _version = 0
+    """The version of the latest change of the object or of an object below it (see
+    `observer_pattern.patch`)."""
+    _child_versions: dict[Any, int] | None = None
+    """Maps the attribute names, list indices and dict keys of the object to the
+    version of their last assignment or deletion. The key `None` of lists holds the
+    version of the last structural change."""
+    _dispatcher: "Dispatcher | None" = None
+    """Delivers the notifications of the `Observer` instances. `None` notifies them
+    inline."""
+    _snapshot_as_value: ClassVar[bool] = False
+    """Whether snapshots and patches contain a copy of the object (see
+    `_snapshot_copy`) instead of its items, e.g. for arrays."""
+    _lazy_wrapping = False
+    """Whether the lists and dicts wrapped by the object keep their builtin list and
+    dict items unwrapped until they are accessed (see `_LazyObservableList`)."""
 
     def __init__(self) -> None:
-        self._observers: dict[str, list["ObservableObject | Observer"]] = {}
+        # bypasses `Observable.__setattr__`, which requires `_observers`
+        object.__setattr__(self, "_observers", {})
 
     def add_observer(
-        self, observer: "ObservableObject | Observer", attr_name: str = ""
+        self,
+        observer: "ObservableObject | Observer",
+        attr_name: "str | _ListIndex" = "",
+        paths: Iterable[str] | None = None,
+        *,
+        weak: bool = False,
+    ) -> None:
+        """Registers `observer` to be notified about changes of this object.
+
+        Args:
+            observer (ObservableObject | Observer): The observer.
+            attr_name (str | _ListIndex): The name of the attribute of an observing
+                `ObservableObject` that holds this object. `""` for `Observer`
+                instances.
+            paths (Iterable[str] | None): Only notify the observer about changes of
+                these access paths (see `SubscriptionIndex` for the supported
+                patterns). Notifies about all changes if `None`. Only supported for
+                `attr_name=""`.
+            weak (bool): Only keep a weak reference to `observer`. The observer is
+                removed automatically when it is garbage collected.
+        """
+
+        key = id(observer)
+        registered: ObservableObject | Observer | _WeakObserver = observer
+        if weak:
+            registered = _WeakObserver(observer, self, attr_name, key)
+
+        if paths is not None and attr_name != "":
+            raise ValueError("Only observers with attr_name='' can filter paths.")
+
+        if self._thread_safe:
+            with self._registration_lock:  # type: ignore[union-attr]
+                self._register_observer(key, registered, attr_name, paths)
+        else:
+            self._register_observer(key, registered, attr_name, paths)
+
+    def _register_observer(
+        self,
+        key: int,
+        observer: "ObservableObject | Observer | _WeakObserver",
+        attr_name: "str | _ListIndex",
+        paths: Iterable[str] | None,
     ) -> None:
-        if attr_name not in self._observers:
-            self._observers[attr_name] = []
-        if observer not in self._observers[attr_name]:
-            self._observers[attr_name].append(observer)
+        copy_on_write = self._thread_safe
+
+        if paths is not None:
+            subscriptions = self._subscriptions
+            if subscriptions is None:
+                subscriptions = SubscriptionIndex()
+            elif copy_on_write:
+                subscriptions = subscriptions.copy()
+            subscriptions.add(key, observer, paths)
+            object.__setattr__(self, "_subscriptions", subscriptions)
+            return
+
+        observers_by_attr = self._observers
+        if observers_by_attr is None:
+            object.__setattr__(self, "_observers", (attr_name, key, observer))
+            return
+        if isinstance(observers_by_attr, tuple):
+            if observers_by_attr[:2] == (attr_name, key):
+                return
+            registered_attr_name, registered_key, registered = observers_by_attr
+            observers_by_attr = {registered_attr_name: {registered_key: registered}}
+            copy_on_write = False
+
+        observers = observers_by_attr.get(attr_name)
+        if observers is not None and key in observers:
+            return
+        if copy_on_write:
+            observers_by_attr = dict(observers_by_attr)
+            observers = dict(observers) if observers is not None else {}
+        elif observers is None:
+            observers = {}
+        observers[key] = observer
+        observers_by_attr[attr_name] = observers
+        object.__setattr__(self, "_observers", observers_by_attr)
+
+    def _remove_observer(
+        self, observer: "ObservableObject | Observer", attribute: "str | _ListIndex"
+    ) -> None:
+        self._discard_observer(attribute, id(observer))
+
+    def _discard_observer(self, attribute: "str | _ListIndex", key: int) -> None:
+        """Removes the registration `key` of an observer of `attribute`, if any."""
+
+        if self._thread_safe:
+            with self._registration_lock:  # type: ignore[union-attr]
+                self._unregister_observer(attribute, key)
+        else:
+            self._unregister_observer(attribute, key)
+
+    def _unregister_observer(self, attribute: "str | _ListIndex", key: int) -> None:
+        copy_on_write = self._thread_safe
+
+        subscriptions = self._subscriptions
+        if attribute == "" and subscriptions is not None:
+            if copy_on_write:
+                subscriptions = subscriptions.copy()
+            subscriptions.remove(key)
+            object.__setattr__(self, "_subscriptions", subscriptions)
+
+        observers_by_attr = self._observers
+        if isinstance(observers_by_attr, tuple):
+            if observers_by_attr[:2] == (attribute, key):
+                object.__setattr__(self, "_observers", None)
+                self._forget_extended_attr_paths(attribute)
+            return
+        if observers_by_attr is None:
+            return
 
-    def _remove_observer(self, observer: "ObservableObject", attribute: str) -> None:
-        if attribute in self._observers:
-            self._observers[attribute].remove(observer)
+        observers = observers_by_attr.get(attribute)
+        if observers is None or key not in observers:
+            return
+        if copy_on_write:
+            observers_by_attr = dict(observers_by_attr)
+            observers = dict(observers)
+        del observers[key]
+        if observers:
+            observers_by_attr[attribute] = observers
+        else:
+            del observers_by_attr[attribute]
+            self._forget_extended_attr_paths(attribute)
+        if copy_on_write:
+            object.__setattr__(self, "_observers", observers_by_attr)
+
+    def _forget_extended_attr_paths(self, attribute: "str | _ListIndex") -> None:
+        if self._extended_attr_paths is not None:
+            self._extended_attr_paths.pop(attribute, None)  # type: ignore[arg-type]
+
+    def _enable_thread_safety(self) -> None:
+        """Registers the observers of this object and of its observable children under
+        a lock from now on."""
+
+        if self._thread_safe:
+            return
+        object.__setattr__(self, "_registration_lock", threading.RLock())
+        object.__setattr__(self, "_thread_safe", True)
+        for child in self._observable_children():
+            child._enable_thread_safety()
+
+    def _snapshot_copy(self) -> Any:
+        """Returns the copy of the object contained in snapshots and patches if
+        `_snapshot_as_value` is set."""
+
+        return shallow_copy(self)
+
+    @abstractmethod
+    def _observable_children(self) -> Iterable["ObservableObject"]:
+        """Returns the `ObservableObject` instances directly held by this object."""
+        ...
 
     @abstractmethod
     def _remove_observer_if_observable(self, name: str) -> None:
@@ -50,12 +321,56 @@ class ObservableObject(ABC):
             changed_attribute (str): The name of the changed attribute.
             value (Any): The value that the attribute was set to.
         """
-        for attr_name, observer_list in self._observers.items():
-            for observer in observer_list:
-                extendend_attr_path = self._construct_extended_attr_path(
-                    attr_name, changed_attribute
+
+        object.__setattr__(self, "_version", _version_clock.version)
+        for attr_name, observers in _group_observers(self._observers):
+            if attr_name == "":
+                self._dispatch(observers, "_notify_changed", (changed_attribute, value))
+                continue
+            extended_attr_path = self._extend_attr_path(attr_name, changed_attribute)
+            for observer in observers:
+                observer._notify_changed(extended_attr_path, value)
+
+        subscriptions = self._subscriptions
+        if subscriptions:
+            self._dispatch(
+                subscriptions.match(changed_attribute),
+                "_notify_changed",
+                (changed_attribute, value),
+            )
+
+    def _notify_batch_changed(self, changes: dict[str, Any]) -> None:
+        """Notifies all observers about a batch of coalesced changes.
+
+        Args:
+            changes (dict[str, Any]): Maps the names (or access paths relative to this
+            object) of the changed attributes to their new values, in the order of
+            their last change.
+        """
+
+        object.__setattr__(self, "_version", _version_clock.version)
+        for attr_name, observers in _group_observers(self._observers):
+            if attr_name == "":
+                self._dispatch(observers, "_notify_batch_changed", (changes,))
+                continue
+            extended_changes = {
+                self._extend_attr_path(attr_name, path): value
+                for path, value in changes.items()
+            }
+            for observer in observers:
+                observer._notify_batch_changed(extended_changes)
+
+        if self._subscriptions:
+            observer_changes: dict[int, tuple[Any, dict[str, Any]]] = {}
+            for path, value in changes.items():
+                for observer in self._subscriptions.match(path):
+                    observer_changes.setdefault(id(observer), (observer, {}))[1][
+                        path
+                    ] = value
+            for observer, filtered_changes in observer_changes.values():
+                self._dispatch(
+                    (observer,), "_notify_batch_changed", (filtered_changes,)
                 )
-                observer._notify_changed(extendend_attr_path, value)
 
     def _notify_change_start(self, changing_attribute: str) -> None:
         """Notify observers that an attribute or item change process has started.
@@ -73,38 +388,148 @@ class ObservableObject(ABC):
             value (Any): The value that the attribute is being set to.
         """
 
-        for attr_name, observer_list in self._observers.items():
-            for observer in observer_list:
-                extended_attr_path = self._construct_extended_attr_path(
-                    attr_name, changing_attribute
-                )
+        for attr_name, observers in _group_observers(self._observers):
+            if attr_name == "":
+                self._dispatch(observers, "_notify_change_start", (changing_attribute,))
+                continue
+            extended_attr_path = self._extend_attr_path(attr_name, changing_attribute)
+            for observer in observers:
                 observer._notify_change_start(extended_attr_path)
 
+        subscriptions = self._subscriptions
+        if subscriptions:
+            self._dispatch(
+                subscriptions.match(changing_attribute),
+                "_notify_change_start",
+                (changing_attribute,),
+            )
+
+    def _record_versions(self, keys: Iterable[Any]) -> None:
+        """Records a new version for the assigned or deleted `keys` of this object."""
+
+        version = _version_clock.advance()
+        object.__setattr__(self, "_version", version)
+        child_versions = self._child_versions
+        if child_versions is None:
+            child_versions = {}
+            object.__setattr__(self, "_child_versions", child_versions)
+        for key in keys:
+            child_versions[key] = version
+
+    def _dispatch(
+        self,
+        observers: Iterable[_RegisteredObserver],
+        method: str,
+        args: tuple[Any, ...],
+    ) -> None:
+        """Calls the notification method `method` of the `Observer` instances of this
+        object, through the dispatcher if one is set."""
+
+        dispatcher = self._dispatcher
+        if _instrumentation is not None:
+            _instrumentation._deliver(observers, method, args, dispatcher)
+        elif dispatcher is None:
+            for observer in tuple(observers):
+                getattr(observer, method)(*args)
+        else:
+            for observer in tuple(observers):
+                dispatcher.dispatch(observer, method, args)
+
+    def set_dispatcher(self, dispatcher: "Dispatcher | None") -> None:
+        """Delivers the notifications of the `Observer` instances registered with this
+        object through `dispatcher` (see `observer_pattern.dispatchers`).
+
+        `None` restores the default, which notifies the observers inline.
+        """
+
+        object.__setattr__(self, "_dispatcher", dispatcher)
+
+    def _extend_attr_path(
+        self, observer_attr_name: "str | _ListIndex", instance_attr_name: str
+    ) -> str:
+        """Returns the interned result of `_construct_extended_attr_path`.
+
+        The extended paths are cached per registration of an observer, so that
+        repeated changes of the same attribute do not format the same path again.
+        Paths relative to `_ListIndex` registrations are not cached, as the index of
+        the item may change.
+        """
+
+        if isinstance(observer_attr_name, _ListIndex):
+            return self._construct_extended_attr_path(
+                observer_attr_name, instance_attr_name
+            )
+
+        paths_by_attr = self._extended_attr_paths
+        if paths_by_attr is None:
+            paths_by_attr = {}
+            object.__setattr__(self, "_extended_attr_paths", paths_by_attr)
+        paths = paths_by_attr.get(observer_attr_name)
+        if paths is None:
+            paths = paths_by_attr[observer_attr_name] = {}
+        extended_attr_path = paths.get(instance_attr_name)
+        if extended_attr_path is None:
+            if len(paths) >= _MAX_CACHED_PATHS:
+                paths.clear()
+            extended_attr_path = paths[instance_attr_name] = sys.intern(
+                self._construct_extended_attr_path(
+                    observer_attr_name, instance_attr_name
+                )
+            )
+        return extended_attr_path
+
     def _initialise_new_objects(self, attr_name_or_key: Any, value: Any) -> Any:
-        new_value = value
-        if isinstance(value, list):
-            if id(value) in self._list_mapping:
-                # If the list `value` was already referenced somewhere else
-                new_value = self._list_mapping[id(value)]
-            else:
-                # convert the builtin list into a ObservableList
-                new_value = _ObservableList(original_list=value)
-                self._list_mapping[id(value)] = new_value
-        elif isinstance(value, dict):
-            if id(value) in self._dict_mapping:
-                # If the list `value` was already referenced somewhere else
-                new_value = self._dict_mapping[id(value)]
-            else:
-                # convert the builtin list into a ObservableList
-                new_value = _ObservableDict(original_dict=value)
-                self._dict_mapping[id(value)] = new_value
+        new_value = self._wrap_container(value)
         if isinstance(new_value, ObservableObject):
             new_value.add_observer(self, str(attr_name_or_key))
         return new_value
 
+    def _wrap_container(self, value: Any) -> Any:
+        """Converts builtin lists and dicts into their observable counterparts."""
+
+        if not self._thread_safe:
+            return self._get_or_create_wrapper(value)
+
+        with _mapping_lock:
+            new_value = self._get_or_create_wrapper(value)
+            if isinstance(new_value, ObservableObject):
+                new_value._enable_thread_safety()
+        return new_value
+
+    def _get_or_create_wrapper(self, value: Any) -> Any:
+        new_value = value
+        if isinstance(value, list) and not isinstance(value, ObservableObject):
+            # reuse the ObservableList if the list `value` was already referenced
+            # somewhere else
+            new_value = self._list_mapping.get(value)
+            if new_value is None:
+                # convert the builtin list into a ObservableList
+                list_type = (
+                    _LazyObservableList if self._lazy_wrapping else _ObservableList
+                )
+                new_value = list_type(original_list=value)
+                self._list_mapping.add(value, new_value)
+        elif isinstance(value, dict) and not isinstance(value, ObservableObject):
+            new_value = self._dict_mapping.get(value)
+            if new_value is None:
+                # convert the builtin dict into a ObservableDict
+                dict_type = (
+                    _LazyObservableDict if self._lazy_wrapping else _ObservableDict
+                )
+                new_value = dict_type(original_dict=value)
+                self._dict_mapping.add(value, new_value)
+        else:
+            # arrays can only be assigned once numpy is imported
+            numpy = sys.modules.get("numpy")
+            if numpy is not None and type(value) is numpy.ndarray:
+                from observer_pattern.observable_array import wrap_array
+
+                new_value = wrap_array(value)
+        return new_value
+
     @abstractmethod
     def _construct_extended_attr_path(
-        self, observer_attr_name: str, instance_attr_name: str
+        self, observer_attr_name: "str | _ListIndex", instance_attr_name: str
     ) -> str:
         """
         Constructs the extended attribute path for notification purposes, which is used
@@ -114,11 +539,13 @@ class ObservableObject(ABC):
         `ObservableObject`.
 
         Args:
-            observer_attr_name (str): The name of the attribute in the observer that
-            holds a reference to the instance. Equals `""` if observer itself is of type
-            `Observer`.
+            observer_attr_name (str | _ListIndex): The name of the attribute in the
+            observer that holds a reference to the instance. Equals `""` if observer
+            itself is of type `Observer`. Formats to the current index of the instance
+            if the observer is an `_ObservableList`.
             instance_attr_name (str): The name of the attribute within the instance that
-            has changed.
+            has changed. Equals `""` if the instance itself changed (see
+            `ContainerEvent`).
 
         Returns:
             str: The constructed extended attribute path.
@@ -126,77 +553,729 @@ class ObservableObject(ABC):
         ...
 
 
-class _ObservableList(ObservableObject, list):
+class _WeakObserver:
+    """Forwards notifications to a weakly referenced observer.
+
+    Registered by `ObservableObject.add_observer(..., weak=True)`. Once the observer
+    is garbage collected, the registration is removed from the (still living)
+    observable object.
+    """
+
+    __slots__ = ("_ref",)
+
+    def __init__(
+        self,
+        observer: "ObservableObject | Observer",
+        observable: ObservableObject,
+        attr_name: "str | _ListIndex",
+        key: int,
+    ) -> None:
+        observable_ref = weakref.ref(observable)
+
+        def discard(_: "weakref.ref[Any]") -> None:
+            observable = observable_ref()
+            if observable is not None:
+                observable._discard_observer(attr_name, key)
+
+        self._ref = weakref.ref(observer, discard)
+
+    def _notify_changed(self, changed_attribute: str, value: Any) -> None:
+        observer = self._ref()
+        if observer is not None:
+            observer._notify_changed(changed_attribute, value)
+
+    def _notify_change_start(self, changing_attribute: str) -> None:
+        observer = self._ref()
+        if observer is not None:
+            observer._notify_change_start(changing_attribute)
+
+    def _notify_batch_changed(self, changes: dict[str, Any]) -> None:
+        observer = self._ref()
+        if observer is not None:
+            observer._notify_batch_changed(changes)
+
+
+class _ObservableContainer(ObservableObject):
+    """Base of the observable list and dict, which keep their state in slots instead
+    of an instance `__dict__`, as trees may hold millions of them."""
+
+    __slots__ = ()
+
+    _CONTAINER_SLOTS = (
+        "_observers",
+        "_extended_attr_paths",
+        "_subscriptions",
+        "_thread_safe",
+        "_registration_lock",
+        "_version",
+        "_child_versions",
+        "_dispatcher",
+        "_write_policy",
+        "__weakref__",
+    )
+    """The slots of the state of `ObservableObject`, declared by the concrete
+    container classes (a base class of `list` or `dict` cannot declare slots). The
+    slots shadow the class defaults of `ObservableObject`, so the containers set them
+    in `_init_container_state`."""
+
+    _write_policy: "_WritePolicy | None"
+    """Elides the no-op writes of the container (see `_apply_write_policy`)."""
+
+    def _wrap_container(self, value: Any) -> Any:
+        new_value = ObservableObject._wrap_container(self, value)
+        if self._write_policy is not None and isinstance(
+            new_value, _ObservableContainer
+        ):
+            new_value._apply_write_policy(self._write_policy)
+        return new_value
+
+    def _apply_write_policy(self, policy: _WritePolicy) -> None:
+        """Elides the no-op writes of this container and of the containers below it
+        that do not have a write policy yet."""
+
+        pending: list[ObservableObject] = [self]
+        while pending:
+            container = pending.pop()
+            # only lists and dicts compare their writes, arrays notify every write
+            if (
+                not isinstance(container, _ObservableList | _ObservableDict)
+                or container._write_policy is not None
+            ):
+                continue
+            container._write_policy = policy
+            pending.extend(
+                child
+                for child in container._observable_children()
+                if isinstance(child, _ObservableContainer)
+            )
+
+
+_MAX_PENDING_SHIFTS = 64
+"""Number of recorded index shifts after which all item indices of an
+`_ObservableList` are updated and the recorded shifts are discarded."""
+
+
+class _ListIndex:
+    """Registration key of an observable item of an `_ObservableList`.
+
+    Formats to the current index of the item (e.g. `[3]`). Inserting or removing items
+    only records the shift of the following indices in the list, which is applied
+    lazily when the index is formatted. This avoids re-registering the list with all
+    following items.
+    """
+
+    __slots__ = ("_list", "position", "applied_shifts")
+
+    def __init__(
+        self, observable_list: "_ObservableList", position: int, applied_shifts: int
+    ) -> None:
+        self._list = observable_list
+        self.position = position
+        """Index of the item after applying the first `applied_shifts` shifts."""
+        self.applied_shifts = applied_shifts
+
+    def __str__(self) -> str:
+        return f"[{self._list._resolve_position(self)}]"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self})"
+
+
+def _as_list_indices(
+    registered: _ListIndex | list[_ListIndex],
+) -> list[_ListIndex] | tuple[_ListIndex]:
+    if isinstance(registered, list):
+        return registered
+    return (registered,)
+
+
+class _ObservableList(_ObservableContainer, list):
+    __slots__ = (
+        *_ObservableContainer._CONTAINER_SLOTS,
+        "_original_list",
+        "_item_indices",
+        "_shifts",
+        "_shift_base",
+        "_tail_changes",
+    )
+
+    def _init_container_state(self) -> None:
+        self._observers = None
+        self._extended_attr_paths = None
+        self._subscriptions = None
+        self._thread_safe = False
+        self._registration_lock = None
+        self._version = 0
+        self._child_versions = None
+        self._dispatcher = None
+        self._write_policy = None
+
     def __init__(
         self,
         original_list: list[Any],
     ) -> None:
+        # keeps the `id()` of the original list in the identity registry unique
         self._original_list = original_list
-        ObservableObject.__init__(self)
-        list.__init__(self, self._original_list)
-        for i, item in enumerate(self._original_list):
-            super().__setitem__(i, self._initialise_new_objects(f"[{i}]", item))
+        self._init_container_state()
+        self._item_indices: dict[int, _ListIndex | list[_ListIndex]] | None = None
+        """Maps the ids of the observable items to the keys the list is registered
+        with, one per occurrence of the item (a list only if the item occurs several
+        times). Created with `_shifts` when the first item is registered."""
+        self._shifts: list[tuple[int, int]] = None  # type: ignore[assignment]
+        """Index shifts `(threshold, delta)` which are not yet applied to all keys in
+        `_item_indices`: indices greater or equal to `threshold` move by `delta`."""
+        self._shift_base = 0
+        """Total number of shifts recorded before the first entry of `_shifts`."""
+        self._tail_changes: list[tuple[int, int]] | None = None
+        """The versions of the changes at the end of the list since its last
+        structural change, with the length of the list before each change (see
+        `_record_tail_change`)."""
 
-    def __setitem__(self, key: int, value: Any) -> None:  # type: ignore[override]
-        if hasattr(self, "_observers"):
-            self._remove_observer_if_observable(f"[{key}]")
-            value = self._initialise_new_objects(f"[{key}]", value)
-            self._notify_change_start(f"[{key}]")
+        items = [self._wrap_container(item) for item in self._original_list]
+        list.__init__(self, items)
+        for position, item in enumerate(items):
+            if isinstance(item, ObservableObject):
+                self._register_item(item, position)
 
-        super().__setitem__(key, value)
+    def __setitem__(  # type: ignore[override]
+        self, key: SupportsIndex | slice, value: Any
+    ) -> None:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                self._splice(start, max(start, stop), value)
+            else:
+                self._set_extended_slice(range(start, stop, step), value)
+            return
 
-        self._notify_changed(f"[{key}]", value)
+        index = self._normalise_index(key, "list assignment index out of range")
+        if self._write_policy is not None and _elide_write(
+            self._write_policy, list.__getitem__(self, index), value
+        ):
+            return
+        item_path = f"[{index}]"
+        value = self._wrap_container(value)
+        self._notify_change_start(item_path)
 
-    def _remove_observer_if_observable(self, name: str) -> None:
-        key = int(name[1:-1])
-        current_value = self.__getitem__(key)
+        self._release_item(list.__getitem__(self, index), index)
+        list.__setitem__(self, index, value)
+        if isinstance(value, ObservableObject):
+            self._register_item(value, index)
+        self._record_versions((index,))
 
-        if isinstance(current_value, ObservableObject):
-            current_value._remove_observer(self, name)
+        self._notify_changed(item_path, value)
+
+    def __delitem__(self, key: SupportsIndex | slice) -> None:  # type: ignore[override]
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                self._splice(start, max(start, stop), ())
+            else:
+                deleted = range(start, stop, step)
+                if deleted:
+                    start, stop = min(deleted), max(deleted) + 1
+                    self._splice(
+                        start,
+                        stop,
+                        [
+                            list.__getitem__(self, index)
+                            for index in range(start, stop)
+                            if index not in deleted
+                        ],
+                    )
+            return
+
+        index = self._normalise_index(key, "list assignment index out of range")
+        self._splice(index, index + 1, ())
+
+    def __iadd__(self, other: Iterable[Any]) -> Self:  # type: ignore[override, misc]
+        self.extend(other)
+        return self
+
+    def __imul__(self, value: SupportsIndex) -> Self:
+        count = operator.index(value)
+        if count <= 0:
+            self.clear()
+        else:
+            self.extend(tuple(self) * (count - 1))
+        return self
+
+    def append(self, item: Any) -> None:
+        self._splice(len(self), len(self), (item,))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        self._splice(len(self), len(self), items)
+
+    def insert(self, index: SupportsIndex, item: Any) -> None:
+        position = operator.index(index)
+        if position < 0:
+            position = max(0, position + len(self))
+        position = min(position, len(self))
+        self._splice(position, position, (item,))
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        if not self:
+            raise IndexError("pop from empty list")
+        position = self._normalise_index(index, "pop index out of range")
+        # wrapped like the items read through the list, see `_LazyObservableList`
+        item = self[position]
+        self._splice(position, position + 1, ())
+        return item
+
+    def remove(self, item: Any) -> None:
+        position = self.index(item)
+        self._splice(position, position + 1, ())
+
+    def clear(self) -> None:
+        self._splice(0, len(self), ())
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> None:
+        self._notify_change_start("")
+        list.sort(self, key=key, reverse=reverse)
+        self._notify_reordered()
+
+    def reverse(self) -> None:
+        self._notify_change_start("")
+        list.reverse(self)
+        self._notify_reordered()
+
+    def _splice(self, start: int, stop: int, items: Iterable[Any]) -> None:
+        """Replaces the items `[start:stop]` by `items` and notifies a `ListSplice`."""
+
+        new_items = tuple(self._wrap_container(item) for item in items)
+        self._notify_change_start("")
+
+        length = len(self)
+        if self._item_indices:
+            for position in range(start, stop):
+                self._release_item(list.__getitem__(self, position), position)
+        list.__setitem__(self, slice(start, stop), new_items)
+        self._record_shift(stop, len(new_items) - (stop - start))
+        for offset, item in enumerate(new_items):
+            if isinstance(item, ObservableObject):
+                self._register_item(item, start + offset)
+        # e.g. `append` or `pop`, unless the tail is longer than the kept items,
+        # which is cheaper to replace as a whole
+        if stop == length and stop - start <= start:
+            self._record_tail_change(start, length)
+        else:
+            self._record_structural_change()
+
+        self._notify_changed("", ListSplice(start, stop, new_items))
+
+    def _set_extended_slice(self, indices: range, items: Iterable[Any]) -> None:
+        new_items = list(items)
+        if len(new_items) != len(indices):
+            raise ValueError(
+                f"attempt to assign sequence of size {len(new_items)} to extended "
+                f"slice of size {len(indices)}"
+            )
+        if not indices:
+            return
+
+        start, stop = min(indices), max(indices) + 1
+        replaced = list(list.__getitem__(self, slice(start, stop)))
+        for index, item in zip(indices, new_items, strict=True):
+            replaced[index - start] = item
+        self._splice(start, stop, replaced)
+
+    def _notify_reordered(self) -> None:
+        if self._item_indices:
+            # reassign the keys of every item in the order of its occurrences
+            indices = {
+                item_id: iter(_as_list_indices(item_indices))
+                for item_id, item_indices in self._item_indices.items()
+            }
+            applied_shifts = self._shift_base + len(self._shifts)
+            for position, item in enumerate(list.__iter__(self)):
+                if isinstance(item, ObservableObject):
+                    index = next(indices[id(item)])
+                    index.position = position
+                    index.applied_shifts = applied_shifts
+        self._record_structural_change()
+        self._notify_changed("", ListSplice(0, len(self), tuple(list.__iter__(self))))
+
+    def _record_structural_change(self) -> None:
+        # the versions of the indices are superseded by the structural change
+        object.__setattr__(self, "_child_versions", None)
+        self._tail_changes = None
+        self._record_versions((None,))
+
+    def _record_tail_change(self, start: int, length: int) -> None:
+        """Records the change of the items from `start` to the end of the list, which
+        had `length` items before the change, as changes of single indices.
+
+        `diff` uses the recorded lengths to tell the added and removed indices from
+        the replaced ones.
+        """
+
+        self._record_versions(range(start, max(length, len(self))))
+        if length != len(self):
+            if self._tail_changes is None:
+                self._tail_changes = []
+            self._tail_changes.append((self._version, length))
+
+    def _length_at(self, version: int) -> int:
+        """Returns the length of the list at `version`, which must not be older than
+        the last structural change of the list."""
+
+        tail_changes = self._tail_changes
+        if tail_changes:
+            position = bisect.bisect_right(
+                tail_changes, version, key=operator.itemgetter(0)
+            )
+            if position < len(tail_changes):
+                return tail_changes[position][1]
+        return len(self)
+
+    def _normalise_index(self, key: SupportsIndex, message: str) -> int:
+        index = operator.index(key)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(message)
+        return index
+
+    def _register_item(self, item: "ObservableObject", position: int) -> None:
+        """Registers the list as observer of the observable item at `position`."""
+
+        item_indices = self._item_indices
+        if item_indices is None:
+            item_indices = self._item_indices = {}
+            self._shifts = []
+        index = _ListIndex(self, position, self._shift_base + len(self._shifts))
+        registered = item_indices.get(id(item))
+        if registered is None:
+            item_indices[id(item)] = index
+        elif isinstance(registered, list):
+            registered.append(index)
+        else:
+            item_indices[id(item)] = [registered, index]
+        item.add_observer(self, index)
+
+    def _release_item(self, item: Any, position: int) -> None:
+        """Unregisters the list from the item at `position` before it is removed."""
+
+        if isinstance(item, ObservableObject):
+            registered = self._item_indices[id(item)]  # type: ignore[index]
+            indices = registered if isinstance(registered, list) else [registered]
+            for index in indices:
+                if self._resolve_position(index) == position:
+                    indices.remove(index)
+                    item._remove_observer(self, index)
+                    break
+            if not indices:
+                del self._item_indices[id(item)]  # type: ignore[union-attr]
+
+    def _record_shift(self, threshold: int, delta: int) -> None:
+        if not delta or not self._item_indices:
+            return
+
+        self._shifts.append((threshold, delta))
+        if len(self._shifts) > _MAX_PENDING_SHIFTS:
+            for indices in self._item_indices.values():
+                for index in _as_list_indices(indices):
+                    self._resolve_position(index)
+            self._shift_base += len(self._shifts)
+            self._shifts.clear()
+
+    def _resolve_position(self, index: _ListIndex) -> int:
+        """Applies the pending shifts to `index` and returns its current position."""
+
+        shifts = self._shifts
+        pending = index.applied_shifts - self._shift_base
+        if pending < len(shifts):
+            position = index.position
+            for threshold, delta in itertools.islice(shifts, pending, None):
+                if position >= threshold:
+                    position += delta
+            index.position = position
+            index.applied_shifts = self._shift_base + len(shifts)
+        return index.position
+
+    def __reduce__(self) -> tuple[type[list[Any]], tuple[list[Any]]]:
+        # pickled as a builtin list (e.g. when sent to another process), as the
+        # observers are not meant to be copied
+        return list, (list(self),)
+
+    def _observable_children(self) -> Iterable[ObservableObject]:
+        return [
+            item for item in list.__iter__(self) if isinstance(item, ObservableObject)
+        ]
+
+    def _remove_observer_if_observable(self, name: str) -> None:
+        position = int(name[1:-1])
+        self._release_item(list.__getitem__(self, position), position)
 
     def _construct_extended_attr_path(
-        self, observer_attr_name: str, instance_attr_name: str
+        self, observer_attr_name: "str | _ListIndex", instance_attr_name: str
     ) -> str:
         if observer_attr_name != "":
             return f"{observer_attr_name}{instance_attr_name}"
         return instance_attr_name
 
 
-class _ObservableDict(dict, ObservableObject):
+_MISSING = object()
+
+
+class _ObservableDict(dict, _ObservableContainer):
+    __slots__ = (*_ObservableContainer._CONTAINER_SLOTS, "_original_dict")
+
+    def _init_container_state(self) -> None:
+        self._observers = None
+        self._extended_attr_paths = None
+        self._subscriptions = None
+        self._thread_safe = False
+        self._registration_lock = None
+        self._version = 0
+        self._child_versions = None
+        self._dispatcher = None
+        self._write_policy = None
+
     def __init__(
         self,
         original_dict: dict[Any, Any],
     ) -> None:
+        # keeps the `id()` of the original dict in the identity registry unique
         self._original_dict = original_dict
-        ObservableObject.__init__(self)
+        self._init_container_state()
         dict.__init__(self)
         for key, value in self._original_dict.items():
-            super().__setitem__(key, self._initialise_new_objects(f"['{key}']", value))
+            dict.__setitem__(self, key, self._adopt_value(key, value))
 
-    def __setitem__(self, key: str, value: Any) -> None:  # type: ignore[override]
-        if not isinstance(key, str):
-            logger.warning("Converting non-string dictionary key %s to string.", key)
-            key = str(key)
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if (
+            self._write_policy is not None
+            and dict.__contains__(self, key)
+            and _elide_write(self._write_policy, dict.__getitem__(self, key), value)
+        ):
+            return
+        item_path = self._item_path(key)
+        self._release_value(key)
+        value = self._adopt_value(key, value)
+        self._notify_change_start(item_path)
 
-        if hasattr(self, "_observers"):
-            self._remove_observer_if_observable(f"['{key}']")
-            value = self._initialise_new_objects(key, value)
-            self._notify_change_start(f"['{key}']")
+        dict.__setitem__(self, key, value)
+        self._record_versions((key,))
 
-        super().__setitem__(key, value)
+        self._notify_changed(item_path, value)
 
-        self._notify_changed(f"['{key}']", value)
+    def __delitem__(self, key: Any) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._delete_keys((key,))
 
-    def _remove_observer_if_observable(self, name: str) -> None:
-        key = name[2:-2]
-        current_value = self.get(key, None)
+    def __ior__(self, other: Any) -> Self:  # type: ignore[override, misc]
+        self.update(other)
+        return self
+
+    def update(self, other: Any = (), /, **kwargs: Any) -> None:  # type: ignore[override]
+        items = dict(other, **kwargs)
+        policy = self._write_policy
+        if policy is not None:
+            # elides the unchanged keys like `__setitem__`
+            items = {
+                key: value
+                for key, value in items.items()
+                if not dict.__contains__(self, key)
+                or not _elide_write(policy, dict.__getitem__(self, key), value)
+            }
+        if not items:
+            return
+
+        self._notify_change_start("")
+
+        updated = {}
+        for key, value in items.items():
+            if isinstance(dict.get(self, key), ObservableObject):
+                self._release_value(key)
+            updated[key] = self._adopt_value(key, value)
+        dict.update(self, updated)
+        self._record_versions(updated)
+
+        self._notify_changed("", DictUpdate(updated))
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        if key not in self:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        # wrapped like the items read through the dict, see `_LazyObservableDict`
+        value = self[key]
+        self._delete_keys((key,))
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(self.keys()))
+        value = self[key]
+        self._delete_keys((key,))
+        return key, value
+
+    def clear(self) -> None:
+        if self:
+            self._delete_keys(tuple(self))
+
+    def _delete_keys(self, keys: tuple[Any, ...]) -> None:
+        self._notify_change_start("")
+
+        for key in keys:
+            self._release_value(key)
+            dict.__delitem__(self, key)
+        self._record_versions(keys)
+
+        self._notify_changed("", DictUpdate({}, keys))
+
+    @staticmethod
+    def _item_path(key: Any) -> str:
+        """Returns the access path of the item `key`, e.g. `['name']` or `[3]`."""
+
+        return f"[{key!r}]"
+
+    def _adopt_value(self, key: Any, value: Any) -> Any:
+        """Wraps `value` and registers the dict as observer of observable values."""
+
+        value = self._wrap_container(value)
+        if isinstance(value, ObservableObject):
+            value.add_observer(self, self._item_path(key))
+        return value
+
+    def _release_value(self, key: Any) -> None:
+        """Unregisters the dict from the current value of `key`."""
+
+        current_value = dict.get(self, key)
 
         if isinstance(current_value, ObservableObject):
-            current_value._remove_observer(self, name)
+            current_value._remove_observer(self, self._item_path(key))
+
+    def __reduce__(self) -> tuple[type[dict[Any, Any]], tuple[dict[Any, Any]]]:
+        # pickled as a builtin dict, see `_ObservableList.__reduce__`
+        return dict, (dict(self),)
+
+    def _observable_children(self) -> Iterable[ObservableObject]:
+        return [
+            value for value in dict.values(self) if isinstance(value, ObservableObject)
+        ]
+
+    def _remove_observer_if_observable(self, name: str) -> None:
+        self._release_value(ast.literal_eval(name[1:-1]))
 
     def _construct_extended_attr_path(
-        self, observer_attr_name: str, instance_attr_name: str
+        self, observer_attr_name: "str | _ListIndex", instance_attr_name: str
     ) -> str:
         if observer_attr_name != "":
             return f"{observer_attr_name}{instance_attr_name}"
         return instance_attr_name
+
+
+_RAW_CONTAINERS = (list, dict)
+
+
+class _LazyObservableList(_ObservableList):
+    """`_ObservableList` keeping its builtin list and dict items unwrapped until they
+    are accessed through the list (indexing, slicing, iteration or `copy()`).
+
+    An item is wrapped (and the list registered as its observer) on its first access,
+    so the access paths of its notifications are the same as in an eagerly wrapped
+    list. Items that were never accessed cannot be changed through the list and do
+    not need to notify.
+    """
+
+    __slots__ = ()
+
+    _lazy_wrapping = True
+
+    def _wrap_container(self, value: Any) -> Any:
+        # builtin lists and dicts are wrapped on their first access
+        return value
+
+    def _wrap_item(self, position: int) -> Any:
+        """Returns the item at `position`, wrapping a builtin list or dict."""
+
+        item = list.__getitem__(self, position)
+        if type(item) not in _RAW_CONTAINERS:
+            return item
+        with _mapping_lock:
+            # another thread may have wrapped the item in the meantime
+            item = list.__getitem__(self, position)
+            if type(item) in _RAW_CONTAINERS:
+                item = _ObservableContainer._wrap_container(self, item)
+                list.__setitem__(self, position, item)
+                self._register_item(item, position)
+        return item
+
+    def __getitem__(self, key: SupportsIndex | slice) -> Any:  # type: ignore[override]
+        if isinstance(key, slice):
+            for position in range(*key.indices(len(self))):
+                self._wrap_item(position)
+            return list.__getitem__(self, key)
+        return self._wrap_item(self._normalise_index(key, "list index out of range"))
+
+    def __iter__(self) -> Iterator[Any]:
+        for position, item in enumerate(list.__iter__(self)):
+            yield self._wrap_item(position) if type(item) in _RAW_CONTAINERS else item
+
+    def __reversed__(self) -> Iterator[Any]:
+        for position in reversed(range(len(self))):
+            yield self._wrap_item(position)
+
+    def copy(self) -> list[Any]:
+        return self[:]
+
+
+class _LazyObservableDict(_ObservableDict):
+    """`_ObservableDict` keeping its builtin list and dict values unwrapped until they
+    are accessed through the dict (see `_LazyObservableList`)."""
+
+    __slots__ = ()
+
+    _lazy_wrapping = True
+
+    def _wrap_container(self, value: Any) -> Any:
+        # builtin lists and dicts are wrapped on their first access
+        return value
+
+    def _wrap_value(self, key: Any, value: Any) -> Any:
+        """Returns `value`, the value of `key`, wrapping a builtin list or dict."""
+
+        if type(value) not in _RAW_CONTAINERS:
+            return value
+        with _mapping_lock:
+            # another thread may have wrapped the value in the meantime
+            value = dict.__getitem__(self, key)
+            if type(value) in _RAW_CONTAINERS:
+                value = _ObservableContainer._wrap_container(self, value)
+                value.add_observer(self, self._item_path(key))
+                dict.__setitem__(self, key, value)
+        return value
+
+    def _wrap_values(self) -> None:
+        for key, value in dict.items(self):
+            self._wrap_value(key, value)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._wrap_value(key, dict.__getitem__(self, key))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            return default
+        return self._wrap_value(key, value)
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        self._wrap_values()
+        return dict.values(self)
+
+    def items(self) -> ItemsView[Any, Any]:  # type: ignore[override]
+        self._wrap_values()
+        return dict.items(self)
+
+    def copy(self) -> dict[Any, Any]:
+        self._wrap_values()
+        return dict.copy(self)
@@ -1,3 +1,25 @@
+from typing import TYPE_CHECKING
+
 from observer_pattern.observer.observer import Observer
+from observer_pattern.observer.rate_limited_observer import RateLimitedObserver
+
+if TYPE_CHECKING:
+    from observer_pattern.observer.async_observer import AsyncObserver
+    from observer_pattern.observer.journal import JournalObserver
+
+# AsyncObserver and JournalObserver are left out, so that a star import does not
+# import asyncio and mmap
+__all__ = ["Observer", "RateLimitedObserver"]
+
+
+def __getattr__(name: str) -> "type[AsyncObserver | JournalObserver]":
+    # imported on first access, as they import asyncio and mmap
+    if name == "AsyncObserver":
+        from observer_pattern.observer.async_observer import AsyncObserver
+
+        return AsyncObserver
+    if name == "JournalObserver":
+        from observer_pattern.observer.journal import JournalObserver
 
-__all__ = ["Observer"]
+        return JournalObserver
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,220 @@
+import asyncio
+import itertools
+import logging
+import threading
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any, Literal
+
+from observer_pattern.observable import Observable
+from observer_pattern.observer.observer import Observer
+
+logger = logging.getLogger(__name__)
+
+Backpressure = Literal["drop_oldest", "coalesce", "block"]
+"""What an `AsyncObserver` does with a notification while its queue is full:
+
+- `"drop_oldest"` discards the oldest queued notification,
+- `"coalesce"` replaces the latest queued notification of the same access path
+  (keeping the new value), or discards the oldest notification if there is none,
+- `"block"` waits until the event loop has processed a notification. Writers
+  running on the event loop itself cannot wait and exceed `maxsize` instead.
+"""
+
+_BACKPRESSURE_POLICIES = ("drop_oldest", "coalesce", "block")
+
+
+class AsyncObserver(Observer):
+    """Observer whose callbacks are coroutines running on an event loop.
+
+    Notifications are put onto a bounded queue per observer and processed in order by
+    a task on `loop`, so that writers do not wait for the callbacks of the observer.
+    Notifications can be queued from any thread.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        observable: Observable,
+        paths: Iterable[str] | None = None,
+        *,
+        weak: bool = False,
+        loop: asyncio.AbstractEventLoop | None = None,
+        maxsize: int = 1024,
+        backpressure: Backpressure = "coalesce",
+    ) -> None:
+        """Registers the observer with `observable`.
+
+        Args:
+            observable (Observable): The observed object.
+            paths (Iterable[str] | None): See `Observer`.
+            weak (bool): See `Observer`.
+            loop (asyncio.AbstractEventLoop | None): The event loop running the
+                callbacks. Defaults to the running event loop.
+            maxsize (int): The maximum number of queued notifications.
+            backpressure (Backpressure): What to do with notifications while the
+                queue is full.
+        """
+
+        if backpressure not in _BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Invalid backpressure policy: {backpressure!r}. Must be one of "
+                f"{', '.join(map(repr, _BACKPRESSURE_POLICIES))}."
+            )
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._maxsize = maxsize
+        self._backpressure = backpressure
+        self._queue: OrderedDict[
+            int, tuple[Hashable, Callable[..., Awaitable[None]], tuple[Any, ...]]
+        ] = OrderedDict()
+        """Maps the sequence numbers of the queued notifications to `(path_key,
+        callback, args)`."""
+        self._latest: dict[Hashable, int] = {}
+        """Maps the path keys to the sequence number of their latest queued
+        notification, used to coalesce notifications while the queue is full."""
+        self._not_full = threading.Condition(threading.Lock())
+        self._sequence = itertools.count()
+        self._draining = False
+        self._task: asyncio.Task[None] | None = None
+        # only queue the start of changes if they are handled by a subclass
+        self._queues_change_start = (
+            type(self).on_change_start is not AsyncObserver.on_change_start
+        )
+        self.dropped = 0
+        """The number of notifications discarded or coalesced because of a full
+        queue."""
+        super().__init__(observable, paths, weak=weak)
+
+    def _notify_changed(self, changed_attribute: str, value: Any) -> None:
+        self._put(
+            ("change", changed_attribute),
+            self.on_change,
+            (changed_attribute, value),
+        )
+
+    def _notify_change_start(self, changing_attribute: str) -> None:
+        if not self._queues_change_start:
+            return
+        self._put(
+            ("start", changing_attribute), self.on_change_start, (changing_attribute,)
+        )
+
+    def _notify_batch_changed(self, changes: dict[str, Any]) -> None:
+        self._put(None, self.on_batch_change, (changes,))
+
+    def _put(
+        self,
+        path_key: Hashable,
+        callback: Callable[..., Awaitable[None]],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Queues a notification and makes sure that the queue is being drained.
+
+        Args:
+            path_key (Hashable): Identifies the notifications that may be coalesced
+                with this one while the queue is full. `None` if the notification
+                cannot be coalesced.
+            callback (Callable[..., Awaitable[None]]): The callback to await.
+            args (tuple[Any, ...]): The arguments of the callback.
+        """
+
+        with self._not_full:
+            queue = self._queue
+            coalesces = self._backpressure == "coalesce" and path_key is not None
+            if len(queue) >= self._maxsize:
+                if self._backpressure == "block":
+                    if not self._in_loop():
+                        while len(queue) >= self._maxsize:
+                            self._not_full.wait()
+                elif coalesces and path_key in self._latest:
+                    del queue[self._latest[path_key]]
+                    self.dropped += 1
+                else:
+                    self._forget(*queue.popitem(last=False))
+                    self.dropped += 1
+
+            sequence_number = next(self._sequence)
+            queue[sequence_number] = (path_key, callback, args)
+            if coalesces:
+                self._latest[path_key] = sequence_number
+
+            if self._draining:
+                return
+            self._draining = True
+
+        if self._in_loop():
+            self._start_draining()
+        else:
+            self._loop.call_soon_threadsafe(self._start_draining)
+
+    def _forget(
+        self, sequence_number: int, notification: tuple[Hashable, Any, Any]
+    ) -> None:
+        """Forgets the path key of a notification leaving the queue."""
+
+        path_key = notification[0]
+        if path_key is not None and self._latest.get(path_key) == sequence_number:
+            del self._latest[path_key]
+
+    def _in_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _start_draining(self) -> None:
+        self._task = self._loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while True:
+            with self._not_full:
+                if not self._queue:
+                    self._draining = False
+                    return
+                sequence_number, notification = self._queue.popitem(last=False)
+                self._forget(sequence_number, notification)
+                _, callback, args = notification
+                self._not_full.notify()
+
+            try:
+                await callback(*args)
+            except Exception:
+                logger.exception("Error in %s with arguments %s", callback, args)
+
+    async def join(self) -> None:
+        """Waits until all queued notifications have been processed.
+
+        Must be awaited on the event loop of the observer.
+        """
+
+        while self._draining:
+            if self._task is None or self._task.done():
+                # the task draining the queue has not been started yet
+                await asyncio.sleep(0)
+            else:
+                await asyncio.shield(self._task)
+
+    @abstractmethod
+    async def on_change(  # type: ignore[override]
+        self, full_access_path: str, value: Any
+    ) -> None:
+        ...
+
+    async def on_change_start(  # type: ignore[override]
+        self, full_access_path: str
+    ) -> None:
+        return
+
+    async def on_batch_change(  # type: ignore[override]
+        self, changes: dict[str, Any]
+    ) -> None:
+        """Called with the coalesced changes of an `Observable.batch()`.
+
+        The default implementation awaits `on_change` for every change.
+        """
+
+        for full_access_path, value in changes.items():
+            await self.on_change(full_access_path=full_access_path, value=value)
@@ -0,0 +1,316 @@
+import logging
+import mmap
+import pickle
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, Literal, NamedTuple
+
+from observer_pattern.computed import computed
+from observer_pattern.events import ContainerEvent
+from observer_pattern.observable import Observable
+from observer_pattern.observer.observer import Observer
+from observer_pattern.utils.helpers import (
+    get_object_by_path,
+    parse_full_access_path,
+    set_object_by_path,
+)
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<BIdI")
+"""Record header: kind, path id, timestamp and length of the payload."""
+
+_END = 0
+"""Zero bytes following the last record of a segment."""
+_PATH = 1
+"""Defines the path of a path id. The payload is the UTF-8 encoded path."""
+_CHANGE = 2
+"""The payload is the encoded value."""
+_CHANGE_START = 3
+"""The record has no payload."""
+
+_SEGMENT_SUFFIX = ".journal"
+
+
+class JournalPosition(NamedTuple):
+    """Position in a journal, e.g. of the last record covered by a snapshot."""
+
+    segment: int
+    offset: int
+
+
+class JournalRecord(NamedTuple):
+    kind: Literal["change", "change_start"]
+    full_access_path: str
+    timestamp: float
+    value: Any
+    """The decoded value of a change, `None` for the start of a change."""
+    position: JournalPosition
+    """The position after the record."""
+
+
+class JournalObserver(Observer):
+    """Observer appending all notifications of an `Observable` to a journal.
+
+    The journal is a directory of memory-mapped segment files of `segment_size` bytes.
+    Each notification is written as a binary record of the id of the access path, the
+    time and the encoded value (`pickle` by default, which encodes `Observable`
+    objects without their observers). Records are collected in a buffer of
+    `buffer_size` bytes which is copied into the memory map when it is full (or on
+    `flush()`), so that writing a record does not issue a system call. A new segment
+    is started when the current segment is full.
+
+    The errors of `encode` are raised in the notifying thread (i.e. from the write),
+    so that the journal never silently misses a change.
+
+    Use `read_journal()` to iterate over the records and `replay()` to restore an
+    `Observable` from a snapshot and the records written after the snapshot.
+    """
+
+    # the state of the current segment, set by `_open_segment`
+    _segment: int
+    _offset: int
+    """The offset of the buffered records in the segment."""
+    _path_ids: dict[str, int]
+    """The ids of the paths defined in the segment."""
+    _file: BinaryIO
+    _map: mmap.mmap
+
+    def __init__(  # noqa: PLR0913
+        self,
+        observable: Observable,
+        directory: str | Path,
+        *,
+        segment_size: int = 16 * 1024 * 1024,
+        buffer_size: int = 64 * 1024,
+        encode: Callable[[Any], bytes] = pickle.dumps,
+        weak: bool = False,
+    ) -> None:
+        """Starts a new segment in `directory` and registers the observer.
+
+        Args:
+            observable (Observable): The observed object.
+            directory (str | Path): The directory of the segments. Created if it
+                does not exist. Existing segments are kept.
+            segment_size (int): The size of the segment files in bytes.
+            buffer_size (int): The number of buffered bytes that triggers a copy into
+                the segment.
+            encode (Callable[[Any], bytes]): Encodes the changed values.
+            weak (bool): See `Observer`.
+        """
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._segment_size = segment_size
+        self._buffer_size = buffer_size
+        self._encode = encode
+        self._lock = threading.Lock()
+        self._buffer = bytearray()
+        segments = _list_segments(self._directory)
+        self._open_segment(segments[-1] + 1 if segments else 1)
+        super().__init__(observable, weak=weak)
+
+    @property
+    def position(self) -> JournalPosition:
+        """The position after the last written record."""
+
+        with self._lock:
+            return JournalPosition(self._segment, self._offset + len(self._buffer))
+
+    def _notify_changed(self, changed_attribute: str, value: Any) -> None:
+        payload = self._encode(value)
+        with self._lock:
+            self._append(_CHANGE, changed_attribute, payload)
+
+    def _notify_change_start(self, changing_attribute: str) -> None:
+        with self._lock:
+            self._append(_CHANGE_START, changing_attribute, b"")
+
+    def _notify_batch_changed(self, changes: dict[str, Any]) -> None:
+        for full_access_path, value in changes.items():
+            self._notify_changed(full_access_path, value)
+
+    def on_change(self, full_access_path: str, value: Any) -> None:  # noqa: ARG002
+        # notifications are written in `_notify_changed`
+        return
+
+    def _append(self, kind: int, full_access_path: str, payload: bytes) -> None:
+        path_id = self._path_ids.get(full_access_path)
+        size = _HEADER.size + len(payload)
+        encoded_path = b""
+        if path_id is None:
+            encoded_path = full_access_path.encode()
+            size += _HEADER.size + len(encoded_path)
+
+        # keeps at least one zero byte after the last record
+        if self._offset + len(self._buffer) + size >= len(self._map):
+            if path_id is not None:
+                # every segment defines the paths of its records
+                encoded_path = full_access_path.encode()
+                size += _HEADER.size + len(encoded_path)
+                path_id = None
+            self._rotate(min_size=size + 1)
+
+        if path_id is None:
+            path_id = self._path_ids[full_access_path] = len(self._path_ids)
+            self._write(_PATH, path_id, 0.0, encoded_path)
+        self._write(kind, path_id, time.time(), payload)
+
+    def _write(self, kind: int, path_id: int, timestamp: float, payload: bytes) -> None:
+        self._buffer += _HEADER.pack(kind, path_id, timestamp, len(payload))
+        self._buffer += payload
+        if len(self._buffer) >= self._buffer_size:
+            self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        end = self._offset + len(self._buffer)
+        self._map[self._offset : end] = self._buffer
+        self._offset = end
+        self._buffer.clear()
+
+    def _open_segment(self, segment: int, min_size: int = 0) -> None:
+        self._segment = segment
+        self._offset = 0
+        self._path_ids = {}
+        path = self._directory / f"{segment:08d}{_SEGMENT_SUFFIX}"
+        with path.open("xb") as file:
+            file.truncate(max(self._segment_size, min_size))
+        self._file = path.open("r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def _close_segment(self) -> None:
+        self._map.close()
+        # the unused end of the segment is not kept, except for one zero byte
+        # marking the end of the records
+        self._file.truncate(self._offset + 1)
+        self._file.close()
+
+    def _rotate(self, min_size: int) -> None:
+        self._flush_buffer()
+        self._close_segment()
+        self._open_segment(self._segment + 1, min_size)
+
+    def flush(self, *, sync: bool = False) -> None:
+        """Copies the buffered records into the segment.
+
+        Args:
+            sync (bool): Also write the segment to disk.
+        """
+
+        with self._lock:
+            self._flush_buffer()
+            if sync:
+                self._map.flush()
+
+    def close(self) -> None:
+        """Detaches the observer and closes the journal."""
+
+        self.detach()
+        with self._lock:
+            self._flush_buffer()
+            self._close_segment()
+
+
+def _list_segments(directory: Path) -> list[int]:
+    return sorted(
+        int(path.stem)
+        for path in directory.glob(f"*{_SEGMENT_SUFFIX}")
+        if path.stem.isdigit()
+    )
+
+
+def read_journal(
+    directory: str | Path,
+    start: JournalPosition | None = None,
+    decode: Callable[[bytes], Any] = pickle.loads,
+) -> Iterator[JournalRecord]:
+    """Iterates over the records of the journal in `directory`.
+
+    Args:
+        directory (str | Path): The directory of the journal.
+        start (JournalPosition | None): Only return the records after this position,
+            e.g. the `JournalObserver.position` at the time of a snapshot.
+        decode (Callable[[bytes], Any]): Decodes the changed values.
+    """
+
+    directory = Path(directory)
+    for segment in _list_segments(directory):
+        if start is not None and segment < start.segment:
+            continue
+        first_offset = start.offset if start and segment == start.segment else 0
+        with (directory / f"{segment:08d}{_SEGMENT_SUFFIX}").open("rb") as file:
+            data = file.read()
+
+        paths: dict[int, str] = {}
+        offset = 0
+        while offset + _HEADER.size <= len(data) and data[offset] != _END:
+            kind, path_id, timestamp, length = _HEADER.unpack_from(data, offset)
+            payload_offset = offset + _HEADER.size
+            offset = payload_offset + length
+            if kind == _PATH:
+                paths[path_id] = data[payload_offset:offset].decode()
+            elif offset > first_offset:
+                yield JournalRecord(
+                    "change" if kind == _CHANGE else "change_start",
+                    paths[path_id],
+                    timestamp,
+                    decode(data[payload_offset:offset]) if kind == _CHANGE else None,
+                    JournalPosition(segment, offset),
+                )
+
+
+def replay(
+    target: Observable,
+    directory: str | Path,
+    snapshot: dict[str, Any] | None = None,
+    start: JournalPosition | None = None,
+    decode: Callable[[bytes], Any] = pickle.loads,
+) -> JournalPosition | None:
+    """Restores `target` from a snapshot and the journal records following it.
+
+    Args:
+        target (Observable): The object to restore.
+        directory (str | Path): The directory of the journal.
+        snapshot (dict[str, Any] | None): Maps attribute names of `target` to their
+            values at the time of the snapshot.
+        start (JournalPosition | None): The position of the journal at the time of
+            the snapshot. Replays the whole journal if `None`.
+        decode (Callable[[bytes], Any]): Decodes the changed values.
+
+    Returns:
+        JournalPosition | None: The position after the last replayed record, or
+        `None` if no record was replayed.
+    """
+
+    for name, value in (snapshot or {}).items():
+        setattr(target, name, value)
+
+    position = None
+    for record in read_journal(directory, start, decode):
+        position = record.position
+        if record.kind == "change" and not _is_derived(target, record):
+            _apply_change(target, record.full_access_path, record.value)
+    return position
+
+
+def _is_derived(target: Observable, record: JournalRecord) -> bool:
+    """Whether the record is a notification of a property or computed attribute,
+    which cannot be set."""
+
+    *parent_elements, (name, is_item) = parse_full_access_path(record.full_access_path)
+    if is_item:
+        return False
+    parent: Any = target
+    for key, parent_is_item in parent_elements:
+        parent = parent[key] if parent_is_item else getattr(parent, key)
+    return isinstance(getattr(type(parent), name, None), property | computed)
+
+
+def _apply_change(target: Observable, full_access_path: str, value: Any) -> None:
+    if isinstance(value, ContainerEvent):
+        value.apply(get_object_by_path(target, full_access_path))
+    else:
+        set_object_by_path(target, full_access_path, value)
@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 
 from observer_pattern.observable import Observable
@@ -8,9 +9,42 @@ logger = logging.getLogger(__name__)
 
 
 class Observer(ABC):
-    def __init__(self, observable: Observable) -> None:
+    # subclasses without `__slots__` still get an instance `__dict__`
+    __slots__ = ("observable", "__weakref__")
+
+    def __init__(
+        self,
+        observable: Observable,
+        paths: Iterable[str] | None = None,
+        *,
+        weak: bool = False,
+    ) -> None:
+        """Registers the observer with `observable`.
+
+        Args:
+            observable (Observable): The observed object.
+            paths (Iterable[str] | None): Only notify the observer about changes of
+                these access paths. Supports exact paths (`devices[3].name`), prefixes
+                (`devices[3].*`) and glob patterns (`devices[*].name`). Notifies
+                about all changes if `None`.
+            weak (bool): Only let `observable` keep a weak reference to the observer,
+                so that the observer is detached once it is no longer referenced
+                elsewhere.
+        """
+
         self.observable = observable
-        self.observable.add_observer(self)
+        self.observable.add_observer(self, paths=paths, weak=weak)
+
+    def detach(self) -> None:
+        """Stops the notifications of the observer. Calling it again has no effect."""
+
+        self.observable._remove_observer(self, "")
+
+    def __getstate__(self) -> dict[str, Any] | None:
+        # the observed object (a slot) is not pickled along with the observer, e.g.
+        # when the observer is notified in another process
+        state = getattr(self, "__dict__", None)
+        return dict(state) if state else None
 
     def _notify_changed(self, changed_attribute: str, value: Any) -> None:
         self.on_change(full_access_path=changed_attribute, value=value)
@@ -18,9 +52,26 @@ class Observer(ABC):
     def _notify_change_start(self, changing_attribute: str) -> None:
         self.on_change_start(changing_attribute)
 
+    def _notify_batch_changed(self, changes: dict[str, Any]) -> None:
+        self.on_batch_change(changes)
+
     @abstractmethod
     def on_change(self, full_access_path: str, value: Any) -> None:
         ...
 
     def on_change_start(self, full_access_path: str) -> None:
         return
+
+    def on_batch_change(self, changes: dict[str, Any]) -> None:
+        """Called with the coalesced changes of an `Observable.batch()`.
+
+        The default implementation calls `on_change` for every change. Note that
+        `on_change_start` is not called for batched changes.
+
+        Args:
+            changes (dict[str, Any]): Maps the full access paths of the changed
+            attributes to their last value, in the order of their last change.
+        """
+
+        for full_access_path, value in changes.items():
+            self.on_change(full_access_path=full_access_path, value=value)
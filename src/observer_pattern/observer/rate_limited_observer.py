@@ -0,0 +1,240 @@
+import logging
+import threading
+import time
+from abc import abstractmethod
+from collections.abc import Iterable, Mapping
+from typing import Any, Literal, NamedTuple
+
+from observer_pattern.observable import Observable
+from observer_pattern.observer.observer import Observer
+from observer_pattern.utils.subscription_index import _compile_glob
+
+logger = logging.getLogger(__name__)
+
+RateLimitMode = Literal["throttle", "debounce"]
+"""How a `RateLimitedObserver` delivers the changes of a path:
+
+- `"throttle"` delivers the first change right away and then the latest value at
+  most once per interval,
+- `"debounce"` delivers the latest value once the path has not changed for an
+  interval.
+"""
+
+_RATE_LIMIT_MODES = ("throttle", "debounce")
+
+_MAX_CACHED_PATHS = 1024
+"""Maximum number of access paths whose rate limit is cached."""
+
+_NO_VALUE: Any = object()
+"""Marks throttled paths whose latest value was delivered."""
+
+
+class RateLimit(NamedTuple):
+    interval: float
+    """The interval in seconds."""
+    mode: RateLimitMode = "throttle"
+
+
+class RateLimitedObserver(Observer):
+    """Observer receiving at most one value per access path and interval.
+
+    Changes of rate-limited paths are stored as the latest value per path and
+    delivered to `on_change` by a background thread, so that writers only update a
+    dict entry while a path is throttled. Changes of paths without a rate limit are
+    delivered right away. `on_change_start` is only called for paths without a rate
+    limit.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        observable: Observable,
+        paths: Iterable[str] | None = None,
+        *,
+        interval: float,
+        mode: RateLimitMode = "throttle",
+        path_limits: Mapping[str, RateLimit | None] | None = None,
+        weak: bool = False,
+    ) -> None:
+        """Registers the observer with `observable`.
+
+        Args:
+            observable (Observable): The observed object.
+            paths (Iterable[str] | None): See `Observer`.
+            interval (float): The interval of the paths not matching `path_limits`
+                in seconds.
+            mode (RateLimitMode): The mode of the paths not matching `path_limits`.
+            path_limits (Mapping[str, RateLimit | None] | None): The rate limits of
+                the paths matching a glob pattern (e.g. `"sensors[*].value"`), where
+                `*` matches any characters. The first matching pattern applies.
+                `None` delivers the changes of the matching paths right away.
+            weak (bool): See `Observer`.
+        """
+
+        for limit in (RateLimit(interval, mode), *(path_limits or {}).values()):
+            if limit is None:
+                continue
+            if limit.mode not in _RATE_LIMIT_MODES:
+                raise ValueError(
+                    f"Invalid rate limit mode: {limit.mode!r}. Must be one of "
+                    f"{', '.join(map(repr, _RATE_LIMIT_MODES))}."
+                )
+            if limit.interval <= 0:
+                raise ValueError("The interval must be positive.")
+
+        self._default_limit = RateLimit(interval, mode)
+        self._path_limits = [
+            (_compile_glob(pattern), limit)
+            for pattern, limit in (path_limits or {}).items()
+        ]
+        self._limits: dict[str, RateLimit | None] = {}
+        """Caches the rate limit per access path."""
+        self._pending: dict[str, list[Any]] = {}
+        """Maps the rate-limited paths to `[value, due time, limit]`. Throttled paths
+        are kept with `_NO_VALUE` for an interval after their delivery."""
+        self._wakeup = threading.Condition(threading.Lock())
+        self._delivery_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        super().__init__(observable, paths, weak=weak)
+
+    def _get_limit(self, full_access_path: str) -> RateLimit | None:
+        try:
+            return self._limits[full_access_path]
+        except KeyError:
+            pass
+        limit: RateLimit | None = self._default_limit
+        for regex, path_limit in self._path_limits:
+            if regex.fullmatch(full_access_path):
+                limit = path_limit
+                break
+        if len(self._limits) >= _MAX_CACHED_PATHS:
+            self._limits.clear()
+        self._limits[full_access_path] = limit
+        return limit
+
+    def _notify_changed(self, changed_attribute: str, value: Any) -> None:
+        limit = self._get_limit(changed_attribute)
+        if limit is None:
+            self.on_change(full_access_path=changed_attribute, value=value)
+        else:
+            self._put(changed_attribute, value, limit)
+
+    def _notify_change_start(self, changing_attribute: str) -> None:
+        if self._get_limit(changing_attribute) is None:
+            self.on_change_start(changing_attribute)
+
+    def _notify_batch_changed(self, changes: dict[str, Any]) -> None:
+        unlimited = {}
+        for full_access_path, value in changes.items():
+            limit = self._get_limit(full_access_path)
+            if limit is None:
+                unlimited[full_access_path] = value
+            else:
+                self._put(full_access_path, value, limit)
+        if unlimited:
+            self.on_batch_change(unlimited)
+
+    def _put(self, full_access_path: str, value: Any, limit: RateLimit) -> None:
+        with self._wakeup:
+            if self._closed:
+                return
+            entry = self._pending.get(full_access_path)
+            if entry is not None:
+                entry[0] = value
+                if limit.mode == "debounce":
+                    entry[1] = time.monotonic() + limit.interval
+                return
+
+            due = time.monotonic()
+            if limit.mode == "debounce":
+                due += limit.interval
+            self._pending[full_access_path] = [value, due, limit]
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="observer-rate-limit", daemon=True
+                )
+                self._thread.start()
+            else:
+                self._wakeup.notify()
+
+    def _time_until_due(self, now: float) -> float | None:
+        dues = [entry[1] for entry in self._pending.values()]
+        return min(dues) - now if dues else None
+
+    def _collect_due(self, now: float, *, flush: bool = False) -> dict[str, Any]:
+        """Returns the values that are due (all values if `flush` is set) and marks
+        them as delivered."""
+
+        changes = {}
+        for full_access_path, entry in list(self._pending.items()):
+            value, due, limit = entry
+            if value is _NO_VALUE:
+                if due <= now:
+                    del self._pending[full_access_path]
+                continue
+            if due > now and not flush:
+                continue
+            changes[full_access_path] = value
+            if limit.mode == "debounce":
+                del self._pending[full_access_path]
+            else:
+                entry[0] = _NO_VALUE
+                entry[1] = now + limit.interval
+        return changes
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                if self._closed or not self._pending:
+                    # started again by the next change of a rate-limited path
+                    self._thread = None
+                    return
+                timeout = self._time_until_due(time.monotonic())
+                if timeout is not None and timeout > 0:
+                    self._wakeup.wait(timeout)
+                    continue
+            self._deliver_due()
+
+    def _deliver_due(self, *, flush: bool = False) -> None:
+        # delivering under `_delivery_lock` keeps the values of a path in order
+        with self._delivery_lock:
+            with self._wakeup:
+                changes = self._collect_due(time.monotonic(), flush=flush)
+            for full_access_path, value in changes.items():
+                self._deliver_change(full_access_path, value)
+
+    def _deliver_change(self, full_access_path: str, value: Any) -> None:
+        # an error of one path does not prevent the delivery of the others
+        try:
+            self.on_change(full_access_path=full_access_path, value=value)
+        except Exception:
+            logger.exception("Error while delivering %r", full_access_path)
+
+    def flush(self) -> None:
+        """Delivers the pending values right away, in the calling thread."""
+
+        self._deliver_due(flush=True)
+
+    def close(self, *, flush: bool = True) -> None:
+        """Detaches the observer and stops the background thread.
+
+        Args:
+            flush (bool): Deliver the pending values before returning. Discards them
+                otherwise.
+        """
+
+        self.detach()
+        with self._wakeup:
+            self._closed = True
+            thread = self._thread
+            self._wakeup.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        if flush:
+            self.flush()
+        with self._wakeup:
+            self._pending.clear()
+
+    @abstractmethod
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        ...
@@ -0,0 +1,211 @@
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from observer_pattern.observable_object import ObservableObject, _version_clock
+from observer_pattern.snapshot import (
+    _DICT,
+    _LEAF,
+    _LIST,
+    _OBSERVABLE,
+    _VALUE,
+    _get_node_kind,
+    _iter_children,
+    to_dict,
+)
+from observer_pattern.utils.helpers import (
+    AttributeKind,
+    classify_attribute,
+    parse_full_access_path,
+)
+
+PatchOperation = dict[str, Any]
+"""A JSON-Patch style operation, i.e. `{"op": "replace", "path": path, "value":
+value}`, `{"op": "add", "path": path, "value": value}` or `{"op": "remove", "path":
+path}`, where `path` is an access path like `devices[3].name`. `"add"` inserts list
+items, `"replace"` also adds missing dict keys."""
+
+
+class Patch(NamedTuple):
+    version: int
+    """The version of the state after applying the patch. Pass it to the next
+    `diff()` call."""
+    operations: list[PatchOperation]
+
+
+def current_version() -> int:
+    """Returns the version of the latest change of any observable object.
+
+    Pass it to `diff()` to get the changes made after e.g. taking a snapshot.
+    """
+
+    return _version_clock.version
+
+
+def _copy(value: Any) -> Any:
+    kind = _get_node_kind(value)
+    if kind == _VALUE:
+        return value._snapshot_copy()
+    return to_dict(value) if kind != _LEAF else value
+
+
+def diff(observable: ObservableObject, since_version: int) -> Patch:
+    """Returns the changes of the tree below `observable` since `since_version`.
+
+    Only the objects containing changes are visited, using the version every object
+    keeps of the latest change below it. Repeated changes of the same path are
+    coalesced into one operation with the current value, and changes below a
+    replaced object are part of its new value. Items appended to or removed from
+    the end of a list are added or removed by index, other insertions, removals and
+    reorders replace the list as a whole.
+    """
+
+    version = _version_clock.version
+    operations: list[PatchOperation] = []
+    pending: list[tuple[str, Any]] = [("", observable)]
+    while pending:
+        path, node = pending.pop()
+        kind = _get_node_kind(node)
+        child_versions = object.__getattribute__(node, "_child_versions") or {}
+
+        # the length of a list at `since_version`, the items behind it were appended
+        added_from = None
+        if kind == _LIST:
+            if child_versions.get(None, 0) > since_version:
+                operations.append(
+                    {"op": "replace", "path": path, "value": to_dict(node)}
+                )
+                continue
+            added_from = node._length_at(since_version)
+            # the removed items, starting with the last one to keep the indices valid
+            operations.extend(
+                {"op": "remove", "path": f"{path}[{index}]"}
+                for index in range(added_from - 1, len(node) - 1, -1)
+            )
+        elif kind == _DICT:
+            operations.extend(
+                {"op": "remove", "path": f"{path}[{key!r}]"}
+                for key, key_version in child_versions.items()
+                if key_version > since_version and not dict.__contains__(node, key)
+            )
+        elif kind == _OBSERVABLE:
+            attributes = object.__getattribute__(node, "__dict__")
+            operations.extend(
+                {"op": "remove", "path": f"{path}.{name}" if path else name}
+                for name, name_version in child_versions.items()
+                if name_version > since_version and name not in attributes
+                # properties record the versions of their writes, but their values
+                # are not part of the state
+                and classify_attribute(type(node), name) is not AttributeKind.PROPERTY
+            )
+
+        for key, value in _iter_children(node, kind):
+            if kind == _OBSERVABLE:
+                child_path = f"{path}.{key}" if path else key
+            else:
+                child_path = f"{path}[{key!r}]"
+            value_kind = _get_node_kind(value)
+            if child_versions.get(key, 0) > since_version or (
+                # e.g. arrays, which are replaced as a whole when changed
+                value_kind == _VALUE
+                and object.__getattribute__(value, "_version") > since_version
+            ):
+                op = (
+                    "add" if added_from is not None and key >= added_from else "replace"
+                )
+                operations.append({"op": op, "path": child_path, "value": _copy(value)})
+            elif (
+                value_kind not in (_LEAF, _VALUE)
+                # unwrapped items of lazily wrapping containers were not changed
+                and type(value) not in (list, dict)
+                and object.__getattribute__(value, "_version") > since_version
+            ):
+                pending.append((child_path, value))
+
+    return Patch(version, operations)
+
+
+def _get_child(obj: Any, key: Any, *, is_item: bool) -> Any:
+    # attributes of `Observable` objects are items of their `to_dict()` copies
+    return obj[key] if is_item or isinstance(obj, dict) else getattr(obj, key)
+
+
+def _get_item(container: Any, key: Any) -> Any:
+    try:
+        return container[key]
+    except (IndexError, KeyError):
+        return None
+
+
+def _updated_in_place(current: Any, new_value: Any) -> bool:
+    return new_value is current and isinstance(current, ObservableObject)
+
+
+def _merge(current: Any, value: Any) -> Any:
+    """Returns the value replacing `current` in a patched observable object.
+
+    `Observable` objects, which patches contain as dicts of their attributes, are
+    updated in place, also as items of lists and dicts, so that the target keeps
+    its types. Other values (and the items without a current counterpart) are
+    replaced by `value`.
+    """
+
+    kind = _get_node_kind(current)
+    if kind == _OBSERVABLE and isinstance(value, dict):
+        for name, _ in list(_iter_children(current, kind)):
+            if name not in value:
+                delattr(current, name)
+        for name, attribute_value in value.items():
+            current_value = getattr(current, name, None)
+            new_value = _merge(current_value, attribute_value)
+            if not _updated_in_place(current_value, new_value):
+                setattr(current, name, new_value)
+        return current
+    if kind == _LIST and isinstance(value, list):
+        items = list.__iter__(current)
+        return [_merge(next(items, None), item) for item in value]
+    if kind == _DICT and isinstance(value, dict):
+        return {key: _merge(current.get(key), item) for key, item in value.items()}
+    return value
+
+
+def apply_patch(target: Any, operations: Iterable[PatchOperation]) -> None:
+    """Applies the operations of a `Patch` to `target`.
+
+    `target` is either an observable object or its copy made with `to_dict()`. The
+    `Observable` objects of an observable target are updated in place (see
+    `_merge`), i.e. only objects added to lists and dicts are added as dicts.
+    """
+
+    patches_observable = isinstance(target, ObservableObject)
+    for operation in operations:
+        *parent_elements, (key, is_item) = parse_full_access_path(operation["path"])
+        parent = target
+        for parent_key, parent_is_item in parent_elements:
+            parent = _get_child(parent, parent_key, is_item=parent_is_item)
+
+        is_attribute = not is_item and not isinstance(parent, dict)
+        if operation["op"] == "remove":
+            if is_attribute:
+                delattr(parent, key)
+            else:
+                del parent[key]
+        elif operation["op"] == "add" and isinstance(parent, list):
+            # the added items have no counterpart in the target
+            parent.insert(key, operation["value"])
+        elif operation["op"] in ("add", "replace"):
+            value = operation["value"]
+            if patches_observable:
+                current = (
+                    getattr(parent, key, None)
+                    if is_attribute
+                    else _get_item(parent, key)
+                )
+                value = _merge(current, value)
+                if _updated_in_place(current, value):
+                    continue
+            if is_attribute:
+                setattr(parent, key, value)
+            else:
+                parent[key] = value
+        else:
+            raise ValueError(f"Invalid patch operation: {operation['op']!r}")
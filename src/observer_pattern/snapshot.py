@@ -0,0 +1,158 @@
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
+
+from observer_pattern.observable_object import ObservableObject
+
+
+class Reference(NamedTuple):
+    """Refers to a list, dict or `Observable` that was already emitted under
+    `full_access_path`, e.g. because it is referenced twice in the tree."""
+
+    full_access_path: str
+
+
+class SnapshotEntry(NamedTuple):
+    full_access_path: str
+    parent_path: str
+    """The access path of the container of the value, `""` for the root."""
+    key: Any
+    """The attribute name, list index or dict key of the value in its container."""
+    value: Any
+    """The value. Lists and dicts (and `Observable` objects, which are emitted as
+    dicts) are emitted empty and followed by the entries of their items."""
+
+
+_LEAF, _LIST, _DICT, _OBSERVABLE, _VALUE = range(5)
+
+_node_kinds: dict[type, int] = {list: _LIST, dict: _DICT}
+"""Caches the kind of node per type. Checking the type avoids the `isinstance` checks
+against the abstract base classes. Builtin lists and dicts are nodes, as lazily
+wrapping containers hold their unaccessed items unwrapped."""
+
+
+def _get_node_kind(value: Any) -> int:
+    value_type = type(value)
+    kind = _node_kinds.get(value_type)
+    if kind is None:
+        if not issubclass(value_type, ObservableObject):
+            kind = _LEAF
+        elif issubclass(value_type, list):
+            kind = _LIST
+        elif issubclass(value_type, dict):
+            kind = _DICT
+        elif value_type._snapshot_as_value:
+            kind = _VALUE
+        else:
+            kind = _OBSERVABLE
+        _node_kinds[value_type] = kind
+    return kind
+
+
+def _iter_children(node: Any, kind: int) -> Iterable[tuple[Any, Any]]:
+    """Returns the keys and values of the items of a node, bypassing the notifying
+    accessors of the observable classes."""
+
+    if kind == _LIST:
+        return enumerate(list.__iter__(node))
+    if kind == _DICT:
+        return dict.items(node)
+    return (
+        (name, value)
+        for name, value in object.__getattribute__(node, "__dict__").items()
+        if not name.startswith("_")
+    )
+
+
+def _empty_copy(kind: int) -> list[Any] | dict[Any, Any]:
+    return [] if kind == _LIST else {}
+
+
+def to_dict(observable: ObservableObject) -> dict[str, Any]:
+    """Returns a copy of the tree below `observable` made of builtin dicts and lists.
+
+    `Observable` objects are copied as dicts of their public instance attributes
+    (properties and computed attributes are not included). Lists, dicts and
+    `Observable` objects referenced several times (also cyclically) are copied once
+    and referenced several times in the copy. Observable arrays are copied as plain
+    arrays, other values are not copied. The tree is traversed iteratively, so that
+    its depth is not limited by the recursion limit.
+    """
+
+    root_kind = _get_node_kind(observable)
+    root = _empty_copy(root_kind)
+    copies: dict[int, Any] = {id(observable): root}
+    pending = [(observable, root_kind, root)]
+    while pending:
+        node, kind, copy = pending.pop()
+        append = copy.append if isinstance(copy, list) else None
+        for key, value in _iter_children(node, kind):
+            value_kind = _get_node_kind(value)
+            if value_kind == _LEAF:
+                value_copy = value
+            elif value_kind == _VALUE:
+                value_copy = value._snapshot_copy()
+            else:
+                value_copy = copies.get(id(value))
+                if value_copy is None:
+                    value_copy = copies[id(value)] = _empty_copy(value_kind)
+                    pending.append((value, value_kind, value_copy))
+            if append is not None:
+                append(value_copy)
+            else:
+                copy[key] = value_copy
+    return root  # type: ignore[return-value]
+
+
+def iter_snapshot(observable: ObservableObject) -> Iterator[SnapshotEntry]:
+    """Yields the entries of a snapshot of the tree below `observable`.
+
+    The entries of a container follow the entry of the container, and the items of a
+    list are emitted in order. Lists, dicts and `Observable` objects that were
+    already emitted are yielded as `Reference` to their first access path. Use
+    `assemble_snapshot` to build the result of `to_dict` from the entries, e.g.
+    after sending them to a client in chunks.
+    """
+
+    paths: dict[int, str] = {id(observable): ""}
+    pending: list[tuple[str, Any, int]] = [("", observable, _get_node_kind(observable))]
+    while pending:
+        parent_path, node, kind = pending.pop()
+        for key, value in _iter_children(node, kind):
+            if kind != _OBSERVABLE:
+                path = f"{parent_path}[{key!r}]"
+            else:
+                path = f"{parent_path}.{key}" if parent_path else key
+            value_kind = _get_node_kind(value)
+            if value_kind == _LEAF:
+                entry_value = value
+            elif value_kind == _VALUE:
+                entry_value = value._snapshot_copy()
+            else:
+                known_path = paths.get(id(value))
+                if known_path is not None:
+                    entry_value = Reference(known_path)
+                else:
+                    paths[id(value)] = path
+                    pending.append((path, value, value_kind))
+                    entry_value = _empty_copy(value_kind)
+            yield SnapshotEntry(path, parent_path, key, entry_value)
+
+
+def assemble_snapshot(entries: Iterable[SnapshotEntry]) -> dict[str, Any]:
+    """Builds the result of `to_dict` from the entries of `iter_snapshot`."""
+
+    root: dict[str, Any] = {}
+    containers: dict[str, Any] = {"": root}
+    for entry in entries:
+        value = entry.value
+        if isinstance(value, Reference):
+            value = containers[value.full_access_path]
+        elif type(value) in (list, dict) and not value:
+            value = containers[entry.full_access_path] = type(value)()
+
+        parent = containers[entry.parent_path]
+        if isinstance(parent, list):
+            parent.append(value)
+        else:
+            parent[entry.key] = value
+    return root
@@ -0,0 +1,43 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+EqualityStrategy = Literal["identity", "equality"] | Callable[[Any, Any], bool]
+"""Decides whether two values are considered the same. Either one of the builtin
+strategies `"identity"` (`is`) and `"equality"` (`==`) or a custom comparator
+returning `True` if the values are equal."""
+
+
+@dataclass
+class NotificationCounters:
+    """Counts notifications that were emitted or suppressed by change detection."""
+
+    emitted: int = 0
+    suppressed: int = 0
+
+
+def _is_identical(old: Any, new: Any) -> bool:
+    return old is new
+
+
+def _is_equal(old: Any, new: Any) -> bool:
+    try:
+        return bool(old == new)
+    except (TypeError, ValueError):
+        # e.g. ambiguous truth values of element-wise comparisons
+        return False
+
+
+def resolve_equality(strategy: EqualityStrategy) -> Callable[[Any, Any], bool]:
+    """Returns the comparator implementing the given equality strategy."""
+
+    if strategy == "identity":
+        return _is_identical
+    if strategy == "equality":
+        return _is_equal
+    if callable(strategy):
+        return strategy
+    raise ValueError(
+        f"Invalid equality strategy: {strategy!r}. Must be 'identity', 'equality' "
+        "or a callable."
+    )
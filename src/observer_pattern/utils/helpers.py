@@ -1,5 +1,146 @@
-from typing import Any
+import ast
+from enum import Enum, auto
+from typing import Any, NamedTuple
+
+
+class AttributeKind(Enum):
+    """Classification of a class attribute as seen through an instance."""
+
+    DATA = auto()
+    PROPERTY = auto()
+    METHOD = auto()
 
 
 def is_property_attribute(target_obj: Any, attr_name: str) -> bool:
     return isinstance(getattr(type(target_obj), attr_name, None), property)
+
+
+def classify_attribute(cls: type, attr_name: str) -> AttributeKind:
+    """Classifies the attribute `attr_name` of the class `cls`.
+
+    Names that are not defined on the class (e.g. plain instance attributes) are
+    classified as `AttributeKind.DATA`.
+    """
+
+    attr = getattr(cls, attr_name, None)
+    if isinstance(attr, property):
+        return AttributeKind.PROPERTY
+    if callable(attr):
+        return AttributeKind.METHOD
+    return AttributeKind.DATA
+
+
+def build_attribute_kinds(cls: type) -> dict[str, AttributeKind]:
+    """Returns the classification of every attribute defined along the MRO of `cls`."""
+
+    return {
+        name: classify_attribute(cls, name)
+        for klass in cls.__mro__
+        for name in vars(klass)
+    }
+
+
+def get_root_attribute_name(full_access_path: str) -> str:
+    """Returns the first attribute name of an access path like `devices[3].name`."""
+
+    end = len(full_access_path)
+    for separator in ".[":
+        index = full_access_path.find(separator)
+        if index != -1 and index < end:
+            end = index
+    return full_access_path[:end]
+
+
+def get_parent_paths(full_access_path: str) -> list[str]:
+    """Returns the access paths of all parents of `full_access_path`.
+
+    Example:
+
+    ```python
+    >>> get_parent_paths("devices[3].name")
+    ['devices', 'devices[3]']
+    ```
+    """
+
+    return [
+        full_access_path[:index]
+        for index, char in enumerate(full_access_path)
+        if char in ".[" and index > 0
+    ]
+
+
+class PathElement(NamedTuple):
+    key: Any
+    """Attribute name, list index or dictionary key."""
+    is_item: bool
+    """`True` for list indices and dictionary keys, `False` for attribute names."""
+
+
+def parse_full_access_path(full_access_path: str) -> list[PathElement]:
+    """Splits an access path like `devices[3].name` into its elements.
+
+    Example:
+
+    ```python
+    >>> parse_full_access_path("devices[3]['name']")
+    [PathElement(key='devices', is_item=False), PathElement(key=3, is_item=True),
+     PathElement(key='name', is_item=True)]
+    ```
+    """
+
+    elements: list[PathElement] = []
+    index = 0
+    while index < len(full_access_path):
+        char = full_access_path[index]
+        if char == ".":
+            index += 1
+        elif char == "[":
+            end = _find_closing_bracket(full_access_path, index)
+            key = ast.literal_eval(full_access_path[index + 1 : end])
+            elements.append(PathElement(key, is_item=True))
+            index = end + 1
+        else:
+            end = len(full_access_path)
+            for separator in ".[":
+                separator_index = full_access_path.find(separator, index)
+                if separator_index != -1:
+                    end = min(end, separator_index)
+            elements.append(PathElement(full_access_path[index:end], is_item=False))
+            index = end
+    return elements
+
+
+def _find_closing_bracket(full_access_path: str, start: int) -> int:
+    index = start + 1
+    quote = full_access_path[index] if index < len(full_access_path) else ""
+    if quote in ("'", '"'):
+        index += 1
+        while full_access_path[index] != quote:
+            index += 2 if full_access_path[index] == "\\" else 1
+    end = full_access_path.find("]", index)
+    if end == -1:
+        raise ValueError(f"Invalid access path: {full_access_path!r}")
+    return end
+
+
+def get_object_by_path(target_obj: Any, full_access_path: str) -> Any:
+    """Returns the object at `full_access_path` relative to `target_obj`."""
+
+    for key, is_item in parse_full_access_path(full_access_path):
+        target_obj = target_obj[key] if is_item else getattr(target_obj, key)
+    return target_obj
+
+
+def set_object_by_path(target_obj: Any, full_access_path: str, value: Any) -> None:
+    """Sets the attribute or item at `full_access_path` relative to `target_obj`."""
+
+    *parent_elements, (key, is_item) = parse_full_access_path(full_access_path)
+    for parent_key, parent_is_item in parent_elements:
+        if parent_is_item:
+            target_obj = target_obj[parent_key]
+        else:
+            target_obj = getattr(target_obj, parent_key)
+    if is_item:
+        target_obj[key] = value
+    else:
+        setattr(target_obj, key, value)
@@ -0,0 +1,59 @@
+import weakref
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RegistryStats:
+    size: int
+    hits: int
+    misses: int
+
+
+class IdentityRegistry(Generic[T]):
+    """Maps containers by identity to their wrappers without keeping them alive.
+
+    Builtin lists and dicts cannot be weakly referenced, so entries are keyed by the
+    `id()` of the original container and hold a weak reference to the wrapper. The
+    wrapper is expected to reference the original container, which guarantees that
+    the `id()` is not reused while the entry is alive. Entries are evicted as soon as
+    the wrapper is garbage collected, which in turn releases the original container.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, weakref.KeyedRef] = {}
+        self.hits = 0
+        self.misses = 0
+
+        # a single callback for all entries, as a closure per entry would take more
+        # memory than the entry itself
+        self._evict_callback = self._evict
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, original: Any) -> T | None:
+        """Returns the wrapper registered for `original`, or `None`."""
+
+        ref = self._entries.get(id(original))
+        wrapper = ref() if ref is not None else None
+        if wrapper is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return wrapper
+
+    def add(self, original: Any, wrapper: T) -> None:
+        """Registers `wrapper` for `original` until the wrapper is collected."""
+
+        key = id(original)
+        self._entries[key] = weakref.KeyedRef(wrapper, self._evict_callback, key)
+
+    def _evict(self, ref: weakref.KeyedRef) -> None:
+        if self._entries.get(ref.key) is ref:
+            del self._entries[ref.key]
+
+    def stats(self) -> RegistryStats:
+        return RegistryStats(size=len(self), hits=self.hits, misses=self.misses)
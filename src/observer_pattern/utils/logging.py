@@ -4,7 +4,19 @@ from collections.abc import Callable
 from copy import copy
 from typing import ClassVar, Literal, Optional
 
-import click
+_handler: logging.Handler | None = None
+"""The handler added to the root logger by `setup_logging`."""
+
+
+def _styled(fg: str) -> Callable[[str], str]:
+    def style(level_name: str) -> str:
+        # imported on first use, as importing click takes longer than importing the
+        # whole package
+        import click
+
+        return click.style(str(level_name), fg=fg)
+
+    return style
 
 
 class ColourizedFormatter(logging.Formatter):
@@ -17,13 +29,11 @@ class ColourizedFormatter(logging.Formatter):
     """
 
     level_name_colors: ClassVar[dict[int, Callable[..., str]]] = {
-        logging.DEBUG: lambda level_name: click.style(str(level_name), fg="cyan"),
-        logging.INFO: lambda level_name: click.style(str(level_name), fg="green"),
-        logging.WARNING: lambda level_name: click.style(str(level_name), fg="yellow"),
-        logging.ERROR: lambda level_name: click.style(str(level_name), fg="red"),
-        logging.CRITICAL: lambda level_name: click.style(
-            str(level_name), fg="bright_red"
-        ),
+        logging.DEBUG: _styled("cyan"),
+        logging.INFO: _styled("green"),
+        logging.WARNING: _styled("yellow"),
+        logging.ERROR: _styled("red"),
+        logging.CRITICAL: _styled("bright_red"),
     }
 
     def __init__(
@@ -47,6 +57,8 @@ class ColourizedFormatter(logging.Formatter):
         return func(level_name)
 
     def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
+        # the record is passed on to the other handlers, which must not see the
+        # colourized level prefix and message
         recordcopy = copy(record)
         levelname = recordcopy.levelname
         seperator = " " * (8 - len(recordcopy.levelname))
@@ -64,18 +76,16 @@ class ColourizedFormatter(logging.Formatter):
 
 def setup_logging(level: str | int = logging.INFO) -> None:
     """
-    Configures the logging settings for the application.
+    Configures the root logger to print colourized log messages.
 
-    This function sets up logging with specific formatting and colorization of log
-    messages. The log level is determined based on the application's operation mode,
-    with an option to override the level. By default, in a development environment, the
-    log level is set to DEBUG, whereas in other environments, it is set to INFO.
+    Importing `observer_pattern` does not configure logging. Call this function to
+    opt in, e.g. in scripts and during development. Calling it again only changes the
+    log level, i.e. the colourized handler is added once.
 
     Args:
-        level (Optional[str | int]):
-            A specific log level to set for the application. If None, the log level is
-            determined based on the application's operation mode. Accepts standard log
-            level names ('DEBUG', 'INFO', etc.) and corresponding numerical values.
+        level (str | int):
+            The log level of the root logger. Accepts standard log level names
+            ('DEBUG', 'INFO', etc.) and corresponding numerical values.
 
     Example:
 
@@ -107,22 +117,24 @@ def setup_logging(level: str | int = logging.INFO) -> None:
     # Set the logger's level.
     logger.setLevel(log_level)
 
-    # create console handler and set level to debug
-    ch = logging.StreamHandler()
-
-    # add formatter to ch
-    ch.setFormatter(
-        ColourizedFormatter(
-            fmt=(
-                "%(asctime)s.%(msecs)03d | %(levelprefix)s | "
-                "%(name)s:%(funcName)s:%(lineno)d - %(message)s"
-            ),
-            datefmt="%Y-%m-%d %H:%M:%S",
+    global _handler  # noqa: PLW0603
+    if _handler is None or _handler not in logger.handlers:
+        # create console handler
+        _handler = logging.StreamHandler()
+
+        # add formatter to the handler
+        _handler.setFormatter(
+            ColourizedFormatter(
+                fmt=(
+                    "%(asctime)s.%(msecs)03d | %(levelprefix)s | "
+                    "%(name)s:%(funcName)s:%(lineno)d - %(message)s"
+                ),
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
         )
-    )
 
-    # add ch to logger
-    logger.addHandler(ch)
+        # add the handler to the logger
+        logger.addHandler(_handler)
 
     logger.debug("Configuring service logging.")
     logging.getLogger("asyncio").setLevel(logging.INFO)
@@ -0,0 +1,118 @@
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from observer_pattern.utils.helpers import get_parent_paths
+
+_WILDCARDS = ("*", "?")
+
+
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compiles a glob pattern in which only `*` and `?` are wildcards.
+
+    Unlike `fnmatch`, square brackets match literally, as they are part of the
+    access paths of list and dict items.
+    """
+
+    regex = "".join(
+        ".*" if char == "*" else "." if char == "?" else re.escape(char)
+        for char in pattern
+    )
+    return re.compile(regex, re.DOTALL)
+
+
+class SubscriptionIndex:
+    """Index of observers that only want to be notified about some access paths.
+
+    Supported patterns are:
+
+    - exact paths, e.g. `devices[3].name`,
+    - prefixes ending with `.*`, e.g. `devices[3].*`, matching the prefix itself, all
+      paths below it and all paths above it (whose change replaces the prefix),
+    - glob patterns where `*` matches any sequence of characters and `?` a single
+      character, e.g. `devices[*].name`.
+
+    Looking up the observers of a path costs a few dictionary lookups per element of
+    the path, plus a regular expression match per glob subscription.
+    """
+
+    def __init__(self) -> None:
+        self._exact: dict[str, dict[int, Any]] = {}
+        self._prefixes: dict[str, dict[int, Any]] = {}
+        self._prefixes_below: dict[str, dict[int, Any]] = {}
+        """Maps paths to the observers subscribed to a prefix below that path."""
+        self._globs: dict[int, list[tuple[re.Pattern[str], Any]]] = {}
+        self._entries: dict[int, list[tuple[dict[str, dict[int, Any]], str]]] = {}
+        """Maps the keys of the observers to their entries in the path mappings."""
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def copy(self) -> "SubscriptionIndex":
+        """Returns an independent copy of the index."""
+
+        index = SubscriptionIndex()
+        mappings = {
+            id(self._exact): index._exact,
+            id(self._prefixes): index._prefixes,
+            id(self._prefixes_below): index._prefixes_below,
+        }
+        for mapping in (self._exact, self._prefixes, self._prefixes_below):
+            mappings[id(mapping)].update(
+                (path, dict(observers)) for path, observers in mapping.items()
+            )
+        index._globs = {key: list(globs) for key, globs in self._globs.items()}
+        index._entries = {
+            key: [(mappings[id(mapping)], path) for mapping, path in entries]
+            for key, entries in self._entries.items()
+        }
+        return index
+
+    def add(self, key: int, observer: Any, patterns: Iterable[str]) -> None:
+        """Subscribes `observer`, identified by `key`, to the given path patterns."""
+
+        entries = self._entries.setdefault(key, [])
+        for pattern in patterns:
+            prefix = pattern[:-2]
+            if pattern.endswith(".*") and not any(w in prefix for w in _WILDCARDS):
+                entries.append((self._prefixes, prefix))
+                entries.extend(
+                    (self._prefixes_below, parent_path)
+                    for parent_path in get_parent_paths(prefix)
+                )
+            elif any(wildcard in pattern for wildcard in _WILDCARDS):
+                self._globs.setdefault(key, []).append(
+                    (_compile_glob(pattern), observer)
+                )
+            else:
+                entries.append((self._exact, pattern))
+        for mapping, path in entries:
+            mapping.setdefault(path, {})[key] = observer
+
+    def remove(self, key: int) -> None:
+        """Removes all subscriptions of the observer identified by `key`."""
+
+        for mapping, path in self._entries.pop(key, ()):
+            observers = mapping.get(path)
+            if observers is not None:
+                observers.pop(key, None)
+                if not observers:
+                    del mapping[path]
+        self._globs.pop(key, None)
+
+    def match(self, full_access_path: str) -> list[Any]:
+        """Returns the observers subscribed to `full_access_path`."""
+
+        matches: dict[int, Any] = {}
+        if self._exact:
+            matches.update(self._exact.get(full_access_path, {}))
+        if self._prefixes:
+            for path in (*get_parent_paths(full_access_path), full_access_path):
+                matches.update(self._prefixes.get(path, {}))
+            matches.update(self._prefixes_below.get(full_access_path, {}))
+        for key, globs in self._globs.items():
+            for regex, observer in globs:
+                if regex.fullmatch(full_access_path):
+                    matches[key] = observer
+                    break
+        return list(matches.values())
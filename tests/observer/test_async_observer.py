@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+from observer_pattern.observable import Observable
+from observer_pattern.observer import AsyncObserver
+from observer_pattern.observer.async_observer import Backpressure
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 0
+        self.other = 0
+
+
+class MyAsyncObserver(AsyncObserver):
+    def __init__(
+        self,
+        observable: Observable,
+        maxsize: int = 1024,
+        backpressure: Backpressure = "coalesce",
+    ) -> None:
+        super().__init__(observable, maxsize=maxsize, backpressure=backpressure)
+        self.changes: list[tuple[str, Any]] = []
+        self.released = asyncio.Event()
+        self.released.set()
+
+    async def on_change(self, full_access_path: str, value: Any) -> None:
+        await self.released.wait()
+        self.changes.append((full_access_path, value))
+
+
+def test_notifications_are_delivered_in_order() -> None:
+    async def main() -> None:
+        instance = MyObservable()
+        observer = MyAsyncObserver(instance)
+
+        instance.value = 1
+        instance.other = 2
+        assert observer.changes == []  # noqa: S101
+
+        await observer.join()
+        assert observer.changes == [("value", 1), ("other", 2)]  # noqa: S101
+
+    asyncio.run(main())
+
+
+def test_writer_does_not_wait_for_slow_observer() -> None:
+    async def main() -> None:
+        instance = MyObservable()
+        observer = MyAsyncObserver(instance, backpressure="drop_oldest")
+        observer.released.clear()
+
+        for i in range(3):
+            instance.value = i
+        await asyncio.sleep(0)
+        assert observer.changes == []  # noqa: S101
+
+        observer.released.set()
+        await observer.join()
+        expected = [("value", 0), ("value", 1), ("value", 2)]
+        assert observer.changes == expected  # noqa: S101
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    ("backpressure", "expected"),
+    [
+        ("drop_oldest", [("value", 0), ("value", 3), ("other", 4)]),
+        ("coalesce", [("value", 0), ("value", 3), ("other", 4)]),
+    ],
+)
+def test_backpressure_of_full_queue(
+    backpressure: Backpressure, expected: list[tuple[str, Any]]
+) -> None:
+    async def main() -> None:
+        instance = MyObservable()
+        observer = MyAsyncObserver(instance, maxsize=2, backpressure=backpressure)
+        observer.released.clear()
+
+        instance.value = 0
+        await asyncio.sleep(0)  # the first notification is being handled
+        instance.value = 1
+        instance.value = 2
+        instance.value = 3
+        instance.other = 4
+
+        observer.released.set()
+        await observer.join()
+        assert observer.changes == expected  # noqa: S101
+        assert observer.dropped == 2  # noqa: S101
+
+    asyncio.run(main())
+
+
+def test_coalesce_keeps_latest_value_per_path() -> None:
+    async def main() -> None:
+        instance = MyObservable()
+        observer = MyAsyncObserver(instance, maxsize=2)
+        observer.released.clear()
+
+        instance.value = 0
+        await asyncio.sleep(0)
+        instance.value = 1
+        instance.other = 2
+        instance.value = 3
+
+        observer.released.set()
+        await observer.join()
+        assert observer.changes == [  # noqa: S101
+            ("value", 0),
+            ("other", 2),
+            ("value", 3),
+        ]
+        assert observer.dropped == 1  # noqa: S101
+
+    asyncio.run(main())
+
+
+def test_coalesce_keeps_all_values_while_queue_is_not_full() -> None:
+    async def main() -> None:
+        instance = MyObservable()
+        observer = MyAsyncObserver(instance)
+        observer.released.clear()
+
+        for i in range(5):
+            instance.value = i
+
+        observer.released.set()
+        await observer.join()
+        assert observer.changes == [("value", i) for i in range(5)]  # noqa: S101
+        assert observer.dropped == 0  # noqa: S101
+
+    asyncio.run(main())
+
+
+def test_block_from_other_thread() -> None:
+    async def main() -> None:
+        instance = MyObservable()
+        observer = MyAsyncObserver(instance, maxsize=1, backpressure="block")
+
+        def write() -> None:
+            for i in range(100):
+                instance.value = i
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        while thread.is_alive():
+            await asyncio.sleep(0.001)
+        await observer.join()
+
+        assert observer.changes == [("value", i) for i in range(100)]  # noqa: S101
+        assert observer.dropped == 0  # noqa: S101
+
+    asyncio.run(main())
+
+
+def test_invalid_backpressure() -> None:
+    async def main() -> None:
+        with pytest.raises(ValueError, match="Invalid backpressure policy"):
+            MyAsyncObserver(MyObservable(), backpressure="ignore")  # type: ignore[arg-type]
+
+    asyncio.run(main())
@@ -0,0 +1,137 @@
+import threading
+from pathlib import Path
+
+import pytest
+from observer_pattern.observable import Observable
+from observer_pattern.observer.journal import JournalObserver, read_journal, replay
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 0
+        self.items = [1, 2]
+        self.mapping = {"a": 1}
+
+    @property
+    def total(self) -> int:
+        return sum(self.items)
+
+
+class MyChild(Observable, thread_safe=True):
+    def __init__(self) -> None:
+        super().__init__()
+        self.x = 0
+        self._scale = 2
+
+    @property
+    def scaled(self) -> int:
+        return self.x * self._scale
+
+
+def test_records_are_read_in_order(tmp_path: Path) -> None:
+    instance = MyObservable()
+    journal = JournalObserver(instance, tmp_path)
+
+    instance.value = 1
+    instance.mapping["b"] = 2
+    journal.close()
+
+    assert [  # noqa: S101
+        (record.kind, record.full_access_path, record.value)
+        for record in read_journal(tmp_path)
+    ] == [
+        ("change_start", "value", None),
+        ("change", "value", 1),
+        ("change_start", "mapping['b']", None),
+        ("change", "mapping['b']", 2),
+    ]
+
+
+def test_replay_whole_journal(tmp_path: Path) -> None:
+    instance = MyObservable()
+    journal = JournalObserver(instance, tmp_path, segment_size=128, buffer_size=64)
+
+    for i in range(20):
+        instance.value = i
+        instance.items[0] = i
+    instance.items.append(3)
+    instance.total  # noqa: B018
+    del instance.mapping["a"]
+    instance.mapping["b"] = [4]
+    journal.close()
+
+    assert len(list(tmp_path.iterdir())) > 1  # noqa: S101
+    restored = MyObservable()
+    replay(restored, tmp_path)
+
+    assert restored.value == 19  # noqa: S101, PLR2004
+    assert restored.items == [19, 2, 3]  # noqa: S101
+    assert restored.mapping == {"b": [4]}  # noqa: S101
+
+
+def test_replay_snapshot_and_tail(tmp_path: Path) -> None:
+    instance = MyObservable()
+    journal = JournalObserver(instance, tmp_path, segment_size=256)
+
+    instance.value = 1
+    instance.items.append(3)
+    snapshot = {"value": 1, "items": [1, 2, 3], "mapping": {"a": 1}}
+    position = journal.position
+    instance.value = 2
+    instance.items.pop(0)
+    instance.mapping["a"] = 5
+    journal.close()
+
+    restored = MyObservable()
+    end = replay(restored, tmp_path, snapshot, position)
+
+    assert restored.value == 2  # noqa: S101, PLR2004
+    assert restored.items == [2, 3]  # noqa: S101
+    assert restored.mapping == {"a": 5}  # noqa: S101
+    assert end is not None  # noqa: S101
+    assert replay(MyObservable(), tmp_path, start=end) is None  # noqa: S101
+
+
+def test_new_journal_appends_segment(tmp_path: Path) -> None:
+    instance = MyObservable()
+    JournalObserver(instance, tmp_path).close()
+    journal = JournalObserver(instance, tmp_path)
+    instance.value = 1
+    journal.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [  # noqa: S101
+        "00000001.journal",
+        "00000002.journal",
+    ]
+    values = [record.value for record in read_journal(tmp_path)]
+    assert values == [None, 1]  # noqa: S101
+
+
+def test_replay_nested_observable(tmp_path: Path) -> None:
+    instance = MyObservable()
+    journal = JournalObserver(instance, tmp_path)
+
+    instance.child = MyChild()
+    instance.child.x = 5
+    instance.items.append(MyChild())
+    journal.close()
+
+    restored = MyObservable()
+    replay(restored, tmp_path)
+
+    assert isinstance(restored.child, MyChild)  # noqa: S101
+    assert restored.child.scaled == 10  # noqa: S101, PLR2004
+    assert isinstance(restored.items[2], MyChild)  # noqa: S101
+    # the restored objects notify their new parent
+    restored.child.x = 6
+    assert restored.child._observers  # noqa: S101
+
+
+def test_unencodable_value_raises(tmp_path: Path) -> None:
+    instance = MyObservable()
+    journal = JournalObserver(instance, tmp_path)
+
+    with pytest.raises(TypeError, match="pickle"):
+        instance.value = threading.Lock()
+    journal.close()
@@ -1,3 +1,4 @@
+import gc
 from typing import Any
 
 import observer_pattern.observer
@@ -23,3 +24,147 @@ def test_constructor_error() -> None:
 
     with pytest.raises(TypeError):
         MyObserver()
+
+
+class MyRecordingObserver(observer_pattern.observer.Observer):
+    def __init__(
+        self,
+        observable: Observable,
+        paths: list[str] | None = None,
+        *,
+        weak: bool = False,
+    ) -> None:
+        super().__init__(observable, paths=paths, weak=weak)
+        self.changes: list[str] = []
+        self.started: list[str] = []
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.changes.append(full_access_path)
+
+    def on_change_start(self, full_access_path: str) -> None:
+        self.started.append(full_access_path)
+
+
+class Device(Observable):
+    name = "device"
+    voltage = 0.0
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.devices = [Device(), Device()]
+        self.value = 0
+
+
+def test_exact_path_subscription() -> None:
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance, paths=["devices[1].name"])
+
+    instance.devices[0].name = "first"
+    instance.devices[1].name = "second"
+    instance.devices[1].voltage = 1.0
+
+    assert observer.changes == ["devices[1].name"]  # noqa: S101
+    assert observer.started == ["devices[1].name"]  # noqa: S101
+
+
+def test_prefix_subscription() -> None:
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance, paths=["devices[1].*"])
+
+    instance.devices[0].name = "first"
+    instance.devices[1].name = "second"
+    instance.devices[1].voltage = 1.0
+    instance.value = 1
+    instance.devices.append(Device())
+
+    assert observer.changes == [  # noqa: S101
+        "devices[1].name",
+        "devices[1].voltage",
+        "devices",
+    ]
+
+
+def test_glob_subscription() -> None:
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance, paths=["devices[*].name", "val?e"])
+
+    instance.devices[0].name = "first"
+    instance.devices[1].voltage = 1.0
+    instance.value = 1
+
+    assert observer.changes == ["devices[0].name", "value"]  # noqa: S101
+
+
+def test_subscription_of_batched_changes() -> None:
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance, paths=["devices[0].*"])
+    unfiltered_observer = MyRecordingObserver(instance)
+
+    with instance.batch():
+        instance.devices[0].name = "first"
+        instance.value = 1
+
+    assert observer.changes == ["devices[0].name"]  # noqa: S101
+    assert unfiltered_observer.changes == ["devices[0].name", "value"]  # noqa: S101
+
+
+def test_weak_observer_is_removed_when_collected() -> None:
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance, weak=True)
+    subscriber = MyRecordingObserver(instance, paths=["value"], weak=True)
+
+    instance.value = 1
+    assert observer.changes == ["value"]  # noqa: S101
+    assert subscriber.changes == ["value"]  # noqa: S101
+
+    del observer, subscriber
+    gc.collect()
+
+    assert "" not in instance._observers  # noqa: S101
+    assert not instance._subscriptions  # noqa: S101
+    instance.value = 2
+
+
+def test_detach() -> None:
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance)
+    subscriber = MyRecordingObserver(instance, paths=["value"])
+
+    observer.detach()
+    subscriber.detach()
+    observer.detach()
+    instance.value = 1
+
+    assert observer.changes == []  # noqa: S101
+    assert subscriber.changes == []  # noqa: S101
+    assert "" not in instance._observers  # noqa: S101
+
+
+def test_detach_while_notified() -> None:
+    class DetachingObserver(MyRecordingObserver):
+        def on_change(self, full_access_path: str, value: Any) -> None:
+            super().on_change(full_access_path, value)
+            self.detach()
+
+    instance = MyObservable()
+    first = DetachingObserver(instance)
+    second = MyRecordingObserver(instance)
+
+    instance.value = 1
+    instance.value = 2
+
+    assert first.changes == ["value"]  # noqa: S101
+    assert second.changes == ["value", "value"]  # noqa: S101
+
+
+def test_dropped_weak_observers_do_not_leak() -> None:
+    instance = MyObservable()
+
+    for _ in range(10_000):
+        MyRecordingObserver(instance, weak=True)
+        MyRecordingObserver(instance, paths=["devices[*].name"], weak=True)
+
+    assert "" not in instance._observers  # noqa: S101
+    assert not instance._subscriptions  # noqa: S101
@@ -0,0 +1,83 @@
+import threading
+import time
+from typing import Any
+
+from observer_pattern.observable import Observable
+from observer_pattern.observer import RateLimitedObserver
+from observer_pattern.observer.rate_limited_observer import RateLimit
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 0
+        self.other = 0
+
+
+class MyRateLimitedObserver(RateLimitedObserver):
+    def __init__(self, observable: Observable, **kwargs: Any) -> None:
+        self.changes: list[tuple[str, Any]] = []
+        self.delivered = threading.Event()
+        super().__init__(observable, **kwargs)
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.changes.append((full_access_path, value))
+        self.delivered.set()
+
+
+def test_throttle_delivers_first_and_latest_value() -> None:
+    instance = MyObservable()
+    observer = MyRateLimitedObserver(instance, interval=10.0)
+
+    instance.value = 0
+    assert observer.delivered.wait(1.0)  # noqa: S101
+    for i in range(1, 100):
+        instance.value = i
+    assert observer.changes == [("value", 0)]  # noqa: S101
+
+    observer.close()
+    assert observer.changes == [("value", 0), ("value", 99)]  # noqa: S101
+
+
+def test_debounce_delivers_after_quiet_interval() -> None:
+    instance = MyObservable()
+    observer = MyRateLimitedObserver(instance, interval=0.05, mode="debounce")
+
+    for i in range(10):
+        instance.value = i
+    assert observer.changes == []  # noqa: S101
+
+    assert observer.delivered.wait(1.0)  # noqa: S101
+    time.sleep(0.1)
+    assert observer.changes == [("value", 9)]  # noqa: S101
+    observer.close()
+
+
+def test_path_limits() -> None:
+    instance = MyObservable()
+    observer = MyRateLimitedObserver(
+        instance,
+        interval=10.0,
+        mode="debounce",
+        path_limits={"oth*": None, "value": RateLimit(10.0, "throttle")},
+    )
+
+    instance.other = 1
+    assert observer.changes == [("other", 1)]  # noqa: S101
+
+    observer.delivered.clear()
+    instance.value = 1
+    assert observer.delivered.wait(1.0)  # noqa: S101
+    assert observer.changes == [("other", 1), ("value", 1)]  # noqa: S101
+    observer.close()
+
+
+def test_close_without_flush_discards_pending_values() -> None:
+    instance = MyObservable()
+    observer = MyRateLimitedObserver(instance, interval=10.0, mode="debounce")
+
+    instance.value = 1
+    observer.close(flush=False)
+    instance.value = 2
+
+    assert observer.changes == []  # noqa: S101
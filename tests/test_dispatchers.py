@@ -0,0 +1,106 @@
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from observer_pattern.dispatchers import (
+    Dispatcher,
+    InlineDispatcher,
+    ProcessPoolDispatcher,
+    ThreadPoolDispatcher,
+)
+from observer_pattern.observable import Observable
+from observer_pattern.observer import Observer
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 0
+        self.items = [0]
+
+
+class MyRecordingObserver(Observer):
+    def __init__(self, observable: Observable, delay: float = 0.0) -> None:
+        super().__init__(observable)
+        self.delay = delay
+        self.changes: list[tuple[str, Any]] = []
+        self.threads: set[str] = set()
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        time.sleep(self.delay)
+        self.threads.add(threading.current_thread().name)
+        self.changes.append((full_access_path, value))
+
+
+class MyFileObserver(Observer):
+    def __init__(self, observable: Observable, path: Path) -> None:
+        super().__init__(observable)
+        self.path = path
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        with self.path.open("a") as file:
+            file.write(f"{full_access_path}={value}\n")
+
+
+@pytest.mark.parametrize("dispatcher", [None, InlineDispatcher()])
+def test_inline_dispatch(dispatcher: Dispatcher | None) -> None:
+    instance = MyObservable()
+    instance.set_dispatcher(dispatcher)
+    observer = MyRecordingObserver(instance)
+
+    instance.value = 1
+    instance.items.append(1)
+
+    assert observer.changes[0] == ("value", 1)  # noqa: S101
+    assert observer.changes[1][0] == "items"  # noqa: S101
+    assert observer.threads == {threading.current_thread().name}  # noqa: S101
+
+
+def test_thread_pool_dispatch_keeps_order_per_observer() -> None:
+    instance = MyObservable()
+    dispatcher = ThreadPoolDispatcher(max_workers=4)
+    instance.set_dispatcher(dispatcher)
+    observers = [MyRecordingObserver(instance, delay=0.001) for _ in range(4)]
+
+    start = time.perf_counter()
+    for i in range(10):
+        instance.value = i
+    assert time.perf_counter() - start < 0.04  # noqa: S101, PLR2004
+
+    assert dispatcher.wait(timeout=5)  # noqa: S101
+    for observer in observers:
+        assert observer.changes == [("value", i) for i in range(10)]  # noqa: S101
+        assert threading.current_thread().name not in observer.threads  # noqa: S101
+    dispatcher.shutdown()
+
+
+def test_thread_pool_dispatch_logs_errors(caplog: pytest.LogCaptureFixture) -> None:
+    class MyFailingObserver(Observer):
+        def on_change(self, full_access_path: str, value: Any) -> None:
+            raise ValueError("failed")
+
+    instance = MyObservable()
+    dispatcher = ThreadPoolDispatcher(max_workers=1)
+    instance.set_dispatcher(dispatcher)
+    MyFailingObserver(instance)
+
+    instance.value = 1
+    dispatcher.shutdown()
+
+    assert "ValueError('failed')" in caplog.text  # noqa: S101
+
+
+def test_process_pool_dispatch(tmp_path: Path) -> None:
+    instance = MyObservable()
+    dispatcher = ProcessPoolDispatcher(max_workers=2)
+    instance.set_dispatcher(dispatcher)
+    MyFileObserver(instance, tmp_path / "changes.txt")
+
+    instance.value = 1
+    instance.items[0] = 2
+    dispatcher.shutdown()
+
+    changes = (tmp_path / "changes.txt").read_text()
+    assert changes == "value=1\nitems[0]=2\n"  # noqa: S101
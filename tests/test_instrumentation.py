@@ -0,0 +1,113 @@
+import gc
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from observer_pattern import Observable, Observer
+from observer_pattern.dispatchers import ThreadPoolDispatcher
+from observer_pattern.instrumentation import (
+    SlowNotification,
+    disable_instrumentation,
+    enable_instrumentation,
+    stats,
+)
+
+
+class Device(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.voltage = 0.0
+        self.channels = [0, 0]
+
+
+class MyObserver(Observer):
+    def __init__(self, observable: Observable, delay: float = 0.0) -> None:
+        self.delay = delay
+        super().__init__(observable)
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        time.sleep(self.delay)
+
+
+@pytest.fixture(autouse=True)
+def _disable_instrumentation() -> Iterator[None]:
+    yield
+    disable_instrumentation()
+
+
+def test_stats_per_observer_and_path_prefix() -> None:
+    device = Device()
+    MyObserver(device)
+    enable_instrumentation()
+
+    device.voltage = 1.0
+    device.channels[1] = 5
+
+    result = stats()
+    [observer_stats] = result.observers.values()
+    # the start and the end of each change
+    assert observer_stats.calls == 4  # noqa: S101
+    assert result.paths.keys() == {"voltage", "channels"}  # noqa: S101
+    assert result.paths["channels"].calls == 2  # noqa: S101
+    assert observer_stats.max_time <= observer_stats.total_time  # noqa: S101
+    assert observer_stats.rate > 0  # noqa: S101
+
+
+def test_stats_of_collected_observers_are_discarded() -> None:
+    device = Device()
+    observer = MyObserver(device)
+    enable_instrumentation()
+
+    device.voltage = 1.0
+    observer.detach()
+    del observer
+    gc.collect()
+
+    result = stats()
+    assert result.observers == {}  # noqa: S101
+    assert result.paths["voltage"].calls == 2  # noqa: S101
+
+
+def test_slow_observer_hook() -> None:
+    device = Device()
+    MyObserver(device)
+    slow = MyObserver(device, delay=0.01)
+    slow_notifications: list[SlowNotification] = []
+    enable_instrumentation(
+        latency_budget=0.005, on_slow_observer=slow_notifications.append
+    )
+
+    device.voltage = 1.0
+
+    assert [  # noqa: S101
+        (notification.observer, notification.full_access_path)
+        for notification in slow_notifications
+    ] == [(slow, "voltage")]
+    assert slow_notifications[0].duration >= 0.01  # noqa: S101
+
+
+def test_dispatched_notifications_are_timed_in_the_worker() -> None:
+    device = Device()
+    slow = MyObserver(device, delay=0.01)
+    slow_notifications: list[SlowNotification] = []
+    enable_instrumentation(
+        latency_budget=0.005, on_slow_observer=slow_notifications.append
+    )
+    dispatcher = ThreadPoolDispatcher(max_workers=4)
+    device.set_dispatcher(dispatcher)
+
+    for value in range(3):
+        device.voltage = float(value)
+    dispatcher.shutdown()
+
+    [observer_stats] = stats().observers.values()
+    assert observer_stats.calls == 6  # noqa: S101
+    assert observer_stats.total_time >= 0.03  # noqa: S101
+    notified = [notification.observer for notification in slow_notifications]
+    assert notified == [slow] * 3  # noqa: S101
+
+
+def test_stats_requires_enabled_instrumentation() -> None:
+    with pytest.raises(RuntimeError):
+        stats()
@@ -1,9 +1,11 @@
 import logging
+import threading
 from typing import Any
 
 import observer_pattern
 import observer_pattern.observable_object
 import pytest
+from observer_pattern.events import DictUpdate
 from observer_pattern.observer import Observer
 
 logger = logging.getLogger(__name__)
@@ -158,3 +160,610 @@ def test_property_setter(caplog: pytest.LogCaptureFixture) -> None:
 
     assert "'name' changed to 'Hello'" not in caplog.text  # noqa: S101
     assert "'name' changed to 'Ciao'" in caplog.text  # noqa: S101
+
+
+def test_property_added_at_runtime(caplog: pytest.LogCaptureFixture) -> None:
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self._name = "Hello"
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    assert not hasattr(instance, "name")  # noqa: S101
+
+    MyObservable.name = property(lambda self: self._name)  # type: ignore[attr-defined]
+    _ = instance.name  # type: ignore[attr-defined]
+
+    assert "'name' changed to 'Hello'" in caplog.text  # noqa: S101
+
+
+def test_attribute_reads_are_not_intercepted() -> None:
+    class PropertyMixin:
+        @property
+        def tripled(self) -> int:
+            return 3 * self.value  # type: ignore[attr-defined]
+
+    class MyObservable(observer_pattern.Observable, PropertyMixin):
+        value = 1
+
+        @property
+        def doubled(self) -> int:
+            return 2 * self.value
+
+        @observer_pattern.computed
+        def quadrupled(self) -> int:
+            return 2 * self.doubled
+
+    instance = MyObservable()
+    observer = MyBatchObserver(instance)
+    assert instance.quadrupled == 4  # noqa: S101
+    assert instance.tripled == 3  # noqa: S101
+
+    # reads are only intercepted while a computed attribute is evaluated
+    assert MyObservable.__getattribute__ is object.__getattribute__  # noqa: S101
+    assert [path for path, _ in observer.changes] == [  # noqa: S101
+        "doubled",
+        "tripled",
+    ]
+
+
+def test_property_added_to_base_class_at_runtime(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    class BaseObservable(observer_pattern.Observable):
+        _name = "Hello"
+
+    class MyObservable(BaseObservable):
+        pass
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    _ = instance._name
+
+    BaseObservable.name = property(lambda self: self._name)  # type: ignore[attr-defined]
+    _ = instance.name  # type: ignore[attr-defined]
+
+    assert "'name' changed to 'Hello'" in caplog.text  # noqa: S101
+
+
+def test_property_equality_suppresses_unchanged_reads(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    class MyObservable(observer_pattern.Observable, property_equality="equality"):
+        def __init__(self) -> None:
+            super().__init__()
+            self._name = "Hello"
+
+        @property
+        def name(self) -> str:
+            return self._name
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    _ = instance.name
+    _ = instance.name
+
+    assert caplog.text.count("'name' changed to 'Hello'") == 1  # noqa: S101
+
+    instance._name = "Ciao"
+    _ = instance.name
+
+    assert "'name' changed to 'Ciao'" in caplog.text  # noqa: S101
+    counters = instance.get_property_notification_counters()
+    assert (counters.emitted, counters.suppressed) == (2, 1)  # noqa: S101
+
+
+def test_property_equality_invalidate_cache(caplog: pytest.LogCaptureFixture) -> None:
+    class MyObservable(observer_pattern.Observable, property_equality="identity"):
+        @property
+        def name(self) -> str:
+            return "Hello"
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    _ = instance.name
+    caplog.clear()
+
+    _ = instance.name
+    assert "'name' changed to 'Hello'" not in caplog.text  # noqa: S101
+
+    instance.invalidate_property_cache("name")
+    _ = instance.name
+    assert "'name' changed to 'Hello'" in caplog.text  # noqa: S101
+
+
+def test_property_equality_custom_comparator(caplog: pytest.LogCaptureFixture) -> None:
+    class MyObservable(
+        observer_pattern.Observable,
+        property_equality=lambda old, new: abs(old - new) < 1,  # noqa: ARG005
+    ):
+        value = 1.0
+
+        @property
+        def rounded(self) -> float:
+            return self.value
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    _ = instance.rounded
+    instance.value = 1.5
+    _ = instance.rounded
+
+    assert "'rounded' changed to '1.5'" not in caplog.text  # noqa: S101
+
+    instance.value = 2.5
+    _ = instance.rounded
+
+    assert "'rounded' changed to '2.5'" in caplog.text  # noqa: S101
+
+
+def test_property_equality_invalid_strategy() -> None:
+    with pytest.raises(ValueError, match="Invalid equality strategy"):
+
+        class MyObservable(
+            observer_pattern.Observable,
+            property_equality="unknown",  # type: ignore[arg-type]
+        ):
+            pass
+
+
+def test_computed_attribute(caplog: pytest.LogCaptureFixture) -> None:
+    evaluations = []
+
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.values = [1, 2, 3]
+            self.unrelated = 0
+
+        @observer_pattern.computed
+        def total(self) -> int:
+            evaluations.append(None)
+            return sum(self.values)
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+
+    assert instance.total == 6  # noqa: S101
+    assert instance.total == 6  # noqa: S101
+    assert len(evaluations) == 1  # noqa: S101
+    assert "'total' changed" not in caplog.text  # noqa: S101
+
+    instance.unrelated = 1
+    assert len(evaluations) == 1  # noqa: S101
+
+    instance.values[0] = 11
+    assert "'total' changed to '16'" in caplog.text  # noqa: S101
+    assert instance.total == 16  # noqa: S101
+    assert len(evaluations) == 2  # noqa: S101
+
+
+def test_computed_attribute_with_path_subscription() -> None:
+    class MyObservable(observer_pattern.Observable):
+        values = [1, 2]
+
+        @observer_pattern.computed
+        def total(self) -> int:
+            return sum(self.values)
+
+    changes = []
+
+    class MyPathObserver(Observer):
+        def on_change(self, full_access_path: str, value: Any) -> None:
+            changes.append((full_access_path, value))
+
+    instance = MyObservable()
+    MyPathObserver(instance, paths=["total"])
+    assert instance.total == 3  # noqa: S101
+
+    instance.values.append(3)
+    assert changes == [("total", 6)]  # noqa: S101
+
+
+def test_computed_attribute_chain(caplog: pytest.LogCaptureFixture) -> None:
+    class MyObservable(observer_pattern.Observable):
+        value = 1
+
+        @observer_pattern.computed
+        def double(self) -> int:
+            return 2 * self.value
+
+        @observer_pattern.computed
+        def quadruple(self) -> int:
+            return 2 * self.double
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    assert instance.quadruple == 4  # noqa: S101
+
+    instance.value = 2
+
+    assert "'double' changed to '4'" in caplog.text  # noqa: S101
+    assert "'quadruple' changed to '8'" in caplog.text  # noqa: S101
+
+
+def test_unobserved_computed_attribute_chain() -> None:
+    class MyObservable(observer_pattern.Observable):
+        x = 1
+
+        @observer_pattern.computed
+        def a(self) -> int:
+            return self.x * 2
+
+        @observer_pattern.computed
+        def b(self) -> int:
+            return self.a + 1
+
+    instance = MyObservable()
+    assert instance.b == 3  # noqa: S101
+
+    instance.x = 5
+
+    assert instance.a == 10  # noqa: S101
+    assert instance.b == 11  # noqa: S101
+
+
+def test_computed_attribute_of_nested_observable(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    class NestedObservable(observer_pattern.Observable):
+        name = "Hello"
+
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.nested = NestedObservable()
+
+        @observer_pattern.computed
+        def greeting(self) -> str:
+            return f"{self.nested.name} World"
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    assert instance.greeting == "Hello World"  # noqa: S101
+
+    instance.nested.name = "Ciao"
+
+    assert "'greeting' changed to 'Ciao World'" in caplog.text  # noqa: S101
+
+
+def test_computed_attribute_cannot_be_set() -> None:
+    class MyObservable(observer_pattern.Observable):
+        @observer_pattern.computed
+        def value(self) -> int:
+            return 1
+
+    instance = MyObservable()
+
+    with pytest.raises(AttributeError):
+        instance.value = 2  # type: ignore[misc]
+
+
+class MyBatchObserver(Observer):
+    def __init__(self, observable: observer_pattern.Observable) -> None:
+        super().__init__(observable)
+        self.changes: list[tuple[str, Any]] = []
+        self.batches: list[dict[str, Any]] = []
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.changes.append((full_access_path, value))
+
+    def on_batch_change(self, changes: dict[str, Any]) -> None:
+        self.batches.append(changes)
+
+
+def test_batch_coalesces_changes() -> None:
+    class MyObservable(observer_pattern.Observable):
+        voltage = 0.0
+        current = 0.0
+
+    instance = MyObservable()
+    observer = MyBatchObserver(instance)
+
+    with instance.batch():
+        instance.voltage = 1.0
+        instance.current = 0.1
+        instance.voltage = 2.0
+
+        assert observer.batches == []  # noqa: S101
+
+    assert observer.changes == []  # noqa: S101
+    assert observer.batches == [{"current": 0.1, "voltage": 2.0}]  # noqa: S101
+    assert list(observer.batches[0]) == ["current", "voltage"]  # noqa: S101
+
+
+def test_nested_batches_are_delivered_once() -> None:
+    class MyObservable(observer_pattern.Observable):
+        value = 0
+
+    instance = MyObservable()
+    observer = MyBatchObserver(instance)
+
+    with instance.batch():
+        instance.value = 1
+        with instance.batch():
+            instance.value = 2
+        assert observer.batches == []  # noqa: S101
+
+    assert observer.batches == [{"value": 2}]  # noqa: S101
+
+
+def test_batch_is_delivered_on_exception() -> None:
+    class MyObservable(observer_pattern.Observable):
+        value = 0
+
+    instance = MyObservable()
+    observer = MyBatchObserver(instance)
+
+    with pytest.raises(RuntimeError), instance.batch():
+        instance.value = 1
+        raise RuntimeError
+
+    assert observer.batches == [{"value": 1}]  # noqa: S101
+
+    instance.value = 2
+    assert observer.changes == [("value", 2)]  # noqa: S101
+
+
+def test_batch_of_nested_observable(caplog: pytest.LogCaptureFixture) -> None:
+    class NestedObservable(observer_pattern.Observable):
+        name = "Hello"
+        value = 0
+
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.nested = NestedObservable()
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+
+    with instance.nested.batch():
+        instance.nested.name = "Ciao"
+        instance.nested.value = 1
+
+    assert "'nested.name' changed to 'Ciao'" in caplog.text  # noqa: S101
+    assert "'nested.value' changed to '1'" in caplog.text  # noqa: S101
+
+
+def test_batch_drops_changes_superseded_by_parent() -> None:
+    class NestedObservable(observer_pattern.Observable):
+        name = "Hello"
+
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.nested = NestedObservable()
+
+    instance = MyObservable()
+    observer = MyBatchObserver(instance)
+    new_nested = NestedObservable()
+
+    with instance.batch():
+        instance.nested.name = "Ciao"
+        instance.nested = new_nested
+
+    assert observer.batches == [{"nested": new_nested}]  # noqa: S101
+
+
+class MyThreadSafeObservable(observer_pattern.Observable, thread_safe=True):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 0
+        self.items = [{"value": 0}]
+
+
+class MyCountingObserver(Observer):
+    def __init__(self, observable: observer_pattern.Observable) -> None:
+        # writers in other threads may notify the observer once it is registered
+        self.count = 0
+        super().__init__(observable)
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.count += 1
+
+
+def test_thread_safe_mode_is_inherited_by_containers() -> None:
+    instance = MyThreadSafeObservable()
+    instance.items.append({"value": 1})
+
+    assert instance._thread_safe  # noqa: S101
+    assert instance.items._thread_safe  # noqa: S101
+    assert instance.items[0]._thread_safe  # noqa: S101
+    assert instance.items[1]._thread_safe  # noqa: S101
+
+
+def test_concurrent_registration_and_notification() -> None:
+    instance = MyThreadSafeObservable()
+    barrier = threading.Barrier(8)
+    observers: list[MyCountingObserver] = []
+
+    def register() -> None:
+        barrier.wait()
+        for _ in range(200):
+            observers.append(MyCountingObserver(instance))
+            MyCountingObserver(instance).detach()
+
+    def write() -> None:
+        barrier.wait()
+        for i in range(200):
+            instance.value = i
+            instance.items[0]["value"] = i
+
+    threads = [threading.Thread(target=register) for _ in range(4)]
+    threads += [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(instance._observers[""]) == len(observers) == 800  # noqa: S101
+    instance.value = -1
+    assert all(observer.count > 0 for observer in observers)  # noqa: S101
+
+
+def test_computed_attributes_evaluated_in_parallel_threads() -> None:
+    reading = threading.Event()
+    read = threading.Event()
+
+    class MyObservable(observer_pattern.Observable, thread_safe=True):
+        a = 1
+        b = 1
+
+        @observer_pattern.computed
+        def slow(self) -> int:
+            reading.wait()
+            value = self.a
+            read.set()
+            return value
+
+        @observer_pattern.computed
+        def other(self) -> int:
+            value = self.b
+            # `slow` reads its input while `other` is being evaluated
+            reading.set()
+            read.wait()
+            return value
+
+    instance = MyObservable()
+    thread = threading.Thread(target=lambda: instance.slow)
+    thread.start()
+    assert instance.other == 1  # noqa: S101
+    thread.join()
+
+    instance.a = 2
+    assert instance.slow == 2  # noqa: S101
+    assert instance._computed_inputs == {"slow": {"a"}, "other": {"b"}}  # noqa: S101
+
+
+def test_write_equality_elides_unchanged_writes() -> None:
+    class MyObservable(observer_pattern.Observable, write_equality="equality"):
+        def __init__(self) -> None:
+            super().__init__()
+            self.voltage = 0.0
+            self.channels = [{"gain": 1}]
+
+    instance = MyObservable()
+    observer = MyBatchObserver(instance)
+
+    instance.voltage = 0.0
+    instance.channels[0]["gain"] = 1
+    instance.channels[0] = {"gain": 1}
+    instance.channels.append({"gain": 2})
+    instance.channels[1]["gain"] = 2
+    # only the append notifies
+    assert [path for path, _ in observer.changes] == ["channels"]  # noqa: S101
+
+    instance.voltage = 1.0
+    instance.channels[1]["gain"] = 3
+    assert observer.changes[1:] == [  # noqa: S101
+        ("voltage", 1.0),
+        ("channels[1]['gain']", 3),
+    ]
+    counters = instance.get_write_notification_counters()
+    assert (counters.suppressed, counters.emitted) == (4, 2)  # noqa: S101
+
+
+def test_write_equality_elides_unchanged_dict_update_keys() -> None:
+    class MyObservable(observer_pattern.Observable, write_equality="equality"):
+        def __init__(self) -> None:
+            super().__init__()
+            self.limits = {"low": 0, "high": 10}
+
+    instance = MyObservable()
+    observer = MyBatchObserver(instance)
+
+    instance.limits.update(low=0, high=20, step=1)
+    instance.limits.update({"low": 0})
+
+    assert observer.changes == [  # noqa: S101
+        ("limits", DictUpdate({"high": 20, "step": 1}))
+    ]
+    counters = instance.get_write_notification_counters()
+    assert (counters.suppressed, counters.emitted) == (2, 1)  # noqa: S101
+
+
+def test_write_equality_per_attribute() -> None:
+    class MyObservable(
+        observer_pattern.Observable,
+        write_equality={"voltage": "identity", "name": None},
+    ):
+        voltage = 0.0
+        name = "sensor"
+
+    instance = MyObservable()
+    observer = MyBatchObserver(instance)
+
+    instance.voltage = instance.voltage
+    instance.name = "sensor"
+
+    assert observer.changes == [("name", "sensor")]  # noqa: S101
+
+
+def test_inherited_class_attributes_are_initialised() -> None:
+    class MyBase(observer_pattern.Observable):
+        unit = "V"
+        channels = [1, 2]
+
+    class MyObservable(MyBase):
+        unit = "mV"
+
+        @classmethod
+        def create(cls) -> "MyObservable":
+            return cls()
+
+    instance = MyObservable()
+    observer = MyBatchObserver(instance)
+    instance.channels.append(3)
+    instance.unit = "A"
+
+    assert "create" not in instance.__dict__  # noqa: S101
+    assert [path for path, _ in observer.changes] == ["channels", "unit"]  # noqa: S101
+
+    # class attributes added at runtime are copied into new instances
+    MyBase.scale = 1.0
+    assert MyObservable().__dict__["scale"] == 1.0  # noqa: S101
+
+
+def test_from_records() -> None:
+    class MyObservable(observer_pattern.Observable):
+        name = ""
+        value = 0.0
+        history: list[float] = []
+
+    first, second = MyObservable.from_records(
+        [{"name": "a", "value": 1.0}, {"name": "b", "history": [2.0]}]
+    )
+    observer = MyBatchObserver(second)
+    second.history.append(3.0)
+
+    assert (first.name, first.value) == ("a", 1.0)  # noqa: S101
+    assert (second.name, second.value) == ("b", 0.0)  # noqa: S101
+    assert [path for path, _ in observer.changes] == ["history"]  # noqa: S101
+    assert MyObservable.history == []  # noqa: S101
+
+
+def test_from_records_records_versions() -> None:
+    class MyObservable(observer_pattern.Observable):
+        name = ""
+        value = 0.0
+
+    [instance] = MyObservable.from_records([{"name": "a"}])
+
+    assert instance.diff(0).operations == [  # noqa: S101
+        {"op": "replace", "path": "name", "value": "a"}
+    ]
+
+
+@pytest.mark.parametrize("name", ["_observers", "_private", "diff", "doubled"])
+def test_from_records_rejects_non_data_attributes(name: str) -> None:
+    class MyObservable(observer_pattern.Observable):
+        value = 0.0
+
+        @property
+        def doubled(self) -> float:
+            return 2 * self.value
+
+    with pytest.raises(ValueError, match=name):
+        MyObservable.from_records([{"value": 1.0}, {name: None}])
@@ -0,0 +1,135 @@
+import pickle
+from typing import Any
+
+import pytest
+from observer_pattern import Observable, Observer
+from observer_pattern.events import ArrayUpdate
+
+np = pytest.importorskip("numpy")
+
+
+class MyRecordingObserver(Observer):
+    def __init__(self, observable: Observable) -> None:
+        super().__init__(observable)
+        self.changes: list[tuple[str, Any]] = []
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.changes.append((full_access_path, value))
+
+
+class Waveforms(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.samples = np.zeros(8)
+        self.channels = [np.arange(4)]
+
+
+def test_arrays_are_wrapped_without_copying() -> None:
+    samples = np.zeros(8)
+    instance = Waveforms()
+    instance.samples = samples
+
+    assert np.shares_memory(instance.samples, samples)  # noqa: S101
+    assert instance.samples is not samples  # noqa: S101
+    instance.other = samples
+    assert instance.other is instance.samples  # noqa: S101
+
+
+def test_slice_write_is_a_single_event() -> None:
+    instance = Waveforms()
+    observer = MyRecordingObserver(instance)
+    instance.samples[2:6] = np.arange(4)
+
+    [(path, event)] = observer.changes
+    assert path == "samples"  # noqa: S101
+    assert isinstance(event, ArrayUpdate)  # noqa: S101
+    assert event.key == slice(2, 6)  # noqa: S101
+    assert np.shares_memory(event.values, instance.samples)  # noqa: S101
+    assert not event.values.flags.writeable  # noqa: S101
+    np.testing.assert_array_equal(event.values, [0, 1, 2, 3])
+
+
+def test_mask_and_index_array_writes() -> None:
+    instance = Waveforms()
+    observer = MyRecordingObserver(instance)
+    mask = np.arange(8) % 2 == 0
+    instance.samples[mask] = 1.0
+    instance.channels[0][[0, 3]] = [7, 8]
+
+    assert [path for path, _ in observer.changes] == [  # noqa: S101
+        "samples",
+        "channels[0]",
+    ]
+    np.testing.assert_array_equal(observer.changes[0][1].key, mask)
+    np.testing.assert_array_equal(observer.changes[0][1].values, [1.0] * 4)
+    np.testing.assert_array_equal(observer.changes[1][1].values, [7, 8])
+    np.testing.assert_array_equal(instance.samples, [1, 0] * 4)
+    np.testing.assert_array_equal(instance.channels[0], [7, 1, 2, 8])
+
+    replica = np.zeros(8)
+    observer.changes[0][1].apply(replica)
+    np.testing.assert_array_equal(replica, instance.samples)
+
+
+def test_in_place_operations() -> None:
+    instance = Waveforms()
+    samples = instance.samples
+    observer = MyRecordingObserver(instance)
+    samples += 1
+    np.multiply(samples, 2, out=samples)
+    samples.fill(5)
+
+    assert len(observer.changes) == 3  # noqa: S101
+    assert all(event.key is Ellipsis for _, event in observer.changes)  # noqa: S101
+    np.testing.assert_array_equal(instance.samples, np.full(8, 5.0))
+
+
+def test_augmented_assignment_notifies_once() -> None:
+    instance = Waveforms()
+    observer = MyRecordingObserver(instance)
+    samples = instance.samples
+    instance.samples += 1
+
+    assert instance.samples is samples  # noqa: S101
+    [(path, event)] = observer.changes
+    assert (path, event.key) == ("samples", Ellipsis)  # noqa: S101
+
+
+def test_derived_arrays_are_plain() -> None:
+    instance = Waveforms()
+    observer = MyRecordingObserver(instance)
+
+    assert type(instance.samples[1:3]) is np.ndarray  # noqa: S101
+    assert type(instance.samples + 1) is np.ndarray  # noqa: S101
+    pickled = pickle.dumps(instance.samples)
+    assert type(pickle.loads(pickled)) is np.ndarray  # noqa: S101
+    assert observer.changes == []  # noqa: S101
+
+
+def test_snapshot_and_diff_copy_arrays() -> None:
+    instance = Waveforms()
+    version = instance.diff(0).version
+    instance.samples[0] = 3.0
+
+    snapshot = instance.to_dict()
+    assert type(snapshot["samples"]) is np.ndarray  # noqa: S101
+    assert not np.shares_memory(snapshot["samples"], instance.samples)  # noqa: S101
+
+    [operation] = instance.diff(version).operations
+    assert operation["path"] == "samples"  # noqa: S101
+    np.testing.assert_array_equal(operation["value"], instance.samples)
+
+
+def test_arrays_added_by_dict_update_are_observed() -> None:
+    instance = Waveforms()
+    instance.settings = {}
+    observer = MyRecordingObserver(instance)
+    instance.settings.update(gains=np.ones(2))
+    instance.settings |= {"offsets": np.zeros(2)}
+    instance.settings["gains"][0] = 2.0
+    instance.settings["offsets"][1] = 3.0
+
+    assert [path for path, _ in observer.changes[-2:]] == [  # noqa: S101
+        "settings['gains']",
+        "settings['offsets']",
+    ]
@@ -1,9 +1,12 @@
+import gc
 import logging
 from typing import Any
 
 import observer_pattern
 import observer_pattern.observable_object
 import pytest
+from observer_pattern.events import DictUpdate, ListSplice
+from observer_pattern.observable_object import ObservableObject
 from observer_pattern.observer import Observer
 
 logger = logging.getLogger(__name__)
@@ -297,3 +300,441 @@ def test_list_in_dict_instance(caplog: pytest.LogCaptureFixture) -> None:
     assert (  # noqa: S101
         "'list_in_dict['some_list'][0]' changed to 'Ciao'" in caplog.text
     )
+
+
+def test_shared_list_is_wrapped_once() -> None:
+    list_instance = [1, 2, 3]
+
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.first = list_instance
+            self.second = list_instance
+
+    instance = MyObservable()
+
+    assert instance.first is instance.second  # noqa: S101
+
+
+def test_list_mapping_does_not_keep_lists_alive() -> None:
+    class MyObservable(observer_pattern.Observable):
+        list_attr: list[int] = []  # noqa: RUF012
+
+    list_mapping = observer_pattern.Observable._list_mapping
+    dict_mapping = observer_pattern.Observable._dict_mapping
+    instance = MyObservable()
+    gc.collect()
+    initial_sizes = (len(list_mapping), len(dict_mapping))
+
+    for i in range(1_000):
+        instance.list_attr = [i]
+        instance.dict_attr = {"value": i}
+    gc.collect()
+
+    assert len(list_mapping) <= initial_sizes[0] + 1  # noqa: S101
+    assert len(dict_mapping) <= initial_sizes[1] + 1  # noqa: S101
+
+
+class MyRecordingObserver(Observer):
+    def __init__(self, observable: observer_pattern.Observable) -> None:
+        super().__init__(observable)
+        self.changes: list[tuple[str, Any]] = []
+
+    def on_change(self, full_access_path: str, value: Any) -> None:
+        self.changes.append((full_access_path, value))
+
+
+@pytest.mark.parametrize(
+    ("mutate", "expected_event", "expected_list"),
+    [
+        (lambda lst: lst.append(4), ListSplice(3, 3, (4,)), [1, 2, 3, 4]),
+        (lambda lst: lst.extend([4, 5]), ListSplice(3, 3, (4, 5)), [1, 2, 3, 4, 5]),
+        (lambda lst: lst.insert(-1, 4), ListSplice(2, 2, (4,)), [1, 2, 4, 3]),
+        (lambda lst: lst.pop(), ListSplice(2, 3, ()), [1, 2]),
+        (lambda lst: lst.pop(0), ListSplice(0, 1, ()), [2, 3]),
+        (lambda lst: lst.remove(2), ListSplice(1, 2, ()), [1, 3]),
+        (lambda lst: lst.clear(), ListSplice(0, 3, ()), []),
+        (lambda lst: lst.__delitem__(1), ListSplice(1, 2, ()), [1, 3]),
+        (lambda lst: lst.__delitem__(slice(0, 2)), ListSplice(0, 2, ()), [3]),
+        (
+            lambda lst: lst.__delitem__(slice(None, None, 2)),
+            ListSplice(0, 3, (2,)),
+            [2],
+        ),
+        (
+            lambda lst: lst.__setitem__(slice(1, 2), [7, 8]),
+            ListSplice(1, 2, (7, 8)),
+            [1, 7, 8, 3],
+        ),
+        (
+            lambda lst: lst.__setitem__(slice(None, None, 2), [7, 8]),
+            ListSplice(0, 3, (7, 2, 8)),
+            [7, 2, 8],
+        ),
+        (lambda lst: lst.sort(reverse=True), ListSplice(0, 3, (3, 2, 1)), [3, 2, 1]),
+        (lambda lst: lst.reverse(), ListSplice(0, 3, (3, 2, 1)), [3, 2, 1]),
+        (lambda lst: lst.__iadd__([4]), ListSplice(3, 3, (4,)), [1, 2, 3, 4]),
+        (lambda lst: lst.__imul__(2), ListSplice(3, 3, (1, 2, 3)), [1, 2, 3] * 2),
+    ],
+)
+def test_list_mutations(
+    mutate: Any, expected_event: ListSplice, expected_list: list[int]
+) -> None:
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.list_attr = [1, 2, 3]
+
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance)
+    mutate(instance.list_attr)
+
+    assert observer.changes == [("list_attr", expected_event)]  # noqa: S101
+    assert instance.list_attr == expected_list  # noqa: S101
+
+    copied_list = [1, 2, 3]
+    expected_event.apply(copied_list)
+    assert copied_list == expected_list  # noqa: S101
+
+
+def test_list_negative_index(caplog: pytest.LogCaptureFixture) -> None:
+    class MyObservable(observer_pattern.Observable):
+        list_attr = [1, 2]
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    instance.list_attr[-1] = 12
+
+    assert "'list_attr[1]' changed to '12'" in caplog.text  # noqa: S101
+
+
+def test_list_item_index_is_updated_on_insert(caplog: pytest.LogCaptureFixture) -> None:
+    class NestedObservable(observer_pattern.Observable):
+        name = "Hello"
+
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.list_attr = [NestedObservable()]
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    nested_instance = instance.list_attr[0]
+    instance.list_attr.insert(0, NestedObservable())
+    instance.list_attr.insert(0, 1)
+    nested_instance.name = "Ciao"
+
+    assert "'list_attr[2].name' changed to 'Ciao'" in caplog.text  # noqa: S101
+
+    instance.list_attr.pop(1)
+    nested_instance.name = "Hi"
+
+    assert "'list_attr[1].name' changed to 'Hi'" in caplog.text  # noqa: S101
+
+
+def test_list_removed_item_is_not_observed(caplog: pytest.LogCaptureFixture) -> None:
+    class NestedObservable(observer_pattern.Observable):
+        name = "Hello"
+
+    nested_instance = NestedObservable()
+
+    class MyObservable(observer_pattern.Observable):
+        list_attr = [nested_instance]
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    instance.list_attr.remove(nested_instance)
+    nested_instance.name = "Ciao"
+
+    assert "name' changed to 'Ciao'" not in caplog.text  # noqa: S101
+    assert nested_instance._observers == {}  # noqa: S101
+
+
+def test_list_item_occurring_twice(caplog: pytest.LogCaptureFixture) -> None:
+    class NestedObservable(observer_pattern.Observable):
+        name = "Hello"
+
+    nested_instance = NestedObservable()
+
+    class MyObservable(observer_pattern.Observable):
+        list_attr = [nested_instance, 1, nested_instance]
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    del instance.list_attr[1]
+    nested_instance.name = "Ciao"
+
+    assert "'list_attr[0].name' changed to 'Ciao'" in caplog.text  # noqa: S101
+    assert "'list_attr[1].name' changed to 'Ciao'" in caplog.text  # noqa: S101
+
+    caplog.clear()
+    instance.list_attr.pop(0)
+    nested_instance.name = "Hi"
+
+    assert "'list_attr[0].name' changed to 'Hi'" in caplog.text  # noqa: S101
+    assert "'list_attr[1].name'" not in caplog.text  # noqa: S101
+
+
+def test_batched_list_mutations() -> None:
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.list_attr = [1, 2, 3]
+
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance)
+    with instance.batch():
+        instance.list_attr.append(4)
+        instance.list_attr.append(5)
+
+    assert observer.changes == [("list_attr", [1, 2, 3, 4, 5])]  # noqa: S101
+
+
+def test_list_item_index_after_many_mutations(caplog: pytest.LogCaptureFixture) -> None:
+    class NestedObservable(observer_pattern.Observable):
+        name = "Hello"
+
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.list_attr = [NestedObservable(), NestedObservable()]
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    first, second = instance.list_attr
+    for i in range(100):
+        instance.list_attr.insert(1, i)
+    instance.list_attr.sort(key=lambda item: isinstance(item, int))
+    del instance.list_attr[2:]
+    instance.list_attr.insert(0, 0)
+
+    second.name = "Ciao"
+    first.name = "Hi"
+
+    assert "'list_attr[2].name' changed to 'Ciao'" in caplog.text  # noqa: S101
+    assert "'list_attr[1].name' changed to 'Hi'" in caplog.text  # noqa: S101
+
+
+@pytest.mark.parametrize(
+    ("mutate", "expected_event", "expected_dict"),
+    [
+        (
+            lambda dct: dct.update({"b": 3, "c": 4}),
+            DictUpdate({"b": 3, "c": 4}),
+            {"a": 1, "b": 3, "c": 4},
+        ),
+        (lambda dct: dct.update(c=4), DictUpdate({"c": 4}), {"a": 1, "b": 2, "c": 4}),
+        (
+            lambda dct: dct.__ior__({"c": 4}),
+            DictUpdate({"c": 4}),
+            {"a": 1, "b": 2, "c": 4},
+        ),
+        (lambda dct: dct.__delitem__("a"), DictUpdate({}, ("a",)), {"b": 2}),
+        (lambda dct: dct.pop("a"), DictUpdate({}, ("a",)), {"b": 2}),
+        (lambda dct: dct.popitem(), DictUpdate({}, ("b",)), {"a": 1}),
+        (lambda dct: dct.clear(), DictUpdate({}, ("a", "b")), {}),
+    ],
+)
+def test_dict_mutations(
+    mutate: Any, expected_event: DictUpdate, expected_dict: dict[str, int]
+) -> None:
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.dict_attr = {"a": 1, "b": 2}
+
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance)
+    mutate(instance.dict_attr)
+
+    assert observer.changes == [("dict_attr", expected_event)]  # noqa: S101
+    assert instance.dict_attr == expected_dict  # noqa: S101
+
+    copied_dict = {"a": 1, "b": 2}
+    expected_event.apply(copied_dict)
+    assert copied_dict == expected_dict  # noqa: S101
+
+
+def test_dict_setdefault_and_missing_keys() -> None:
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.dict_attr = {"a": 1}
+
+    instance = MyObservable()
+    observer = MyRecordingObserver(instance)
+
+    assert instance.dict_attr.setdefault("a", 2) == 1  # noqa: S101
+    assert instance.dict_attr.setdefault("b", 2) == 2  # noqa: S101
+    assert instance.dict_attr.pop("c", None) is None  # noqa: S101
+    with pytest.raises(KeyError):
+        instance.dict_attr.pop("c")
+    with pytest.raises(KeyError):
+        del instance.dict_attr["c"]
+
+    assert observer.changes == [("dict_attr['b']", 2)]  # noqa: S101
+
+
+def test_dict_non_string_keys(caplog: pytest.LogCaptureFixture) -> None:
+    class MyObservable(observer_pattern.Observable):
+        dict_attr = {1: "Hello", (2, 3): "World"}
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    instance.dict_attr[1] = "Ciao"
+    instance.dict_attr[(2, 3)] = "Mondo"
+
+    assert "'dict_attr[1]' changed to 'Ciao'" in caplog.text  # noqa: S101
+    assert "'dict_attr[(2, 3)]' changed to 'Mondo'" in caplog.text  # noqa: S101
+    assert "Converting non-string dictionary key" not in caplog.text  # noqa: S101
+    assert instance.dict_attr == {1: "Ciao", (2, 3): "Mondo"}  # noqa: S101
+
+
+def test_dict_popped_value_is_not_observed(caplog: pytest.LogCaptureFixture) -> None:
+    class NestedObservable(observer_pattern.Observable):
+        name = "Hello"
+
+    nested_instance = NestedObservable()
+
+    class MyObservable(observer_pattern.Observable):
+        dict_attr = {"nested": nested_instance}
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    assert instance.dict_attr.pop("nested") is nested_instance  # noqa: S101
+    nested_instance.name = "Ciao"
+
+    assert "name' changed to 'Ciao'" not in caplog.text  # noqa: S101
+    assert nested_instance._observers == {}  # noqa: S101
+
+
+def test_nested_dict_item_assignment(caplog: pytest.LogCaptureFixture) -> None:
+    class MyObservable(observer_pattern.Observable):
+        dict_attr: dict[str, Any] = {}  # noqa: RUF012
+
+    instance = MyObservable()
+    observer = MyObserver(instance)
+    instance.dict_attr["nested"] = {"first": "Hello"}
+    instance.dict_attr["nested"]["first"] = "Ciao"
+
+    assert (  # noqa: S101
+        "'dict_attr['nested']['first']' changed to 'Ciao'" in caplog.text
+    )
+
+
+class MyLazyObservable(observer_pattern.Observable, lazy_wrapping=True):
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows = [{"values": [1, 2]}, {"values": [3]}, [4]]
+        self.dict_attr = {"nested": {"values": [5]}}
+
+
+def test_lazy_wrapping_wraps_items_on_access() -> None:
+    instance = MyLazyObservable()
+
+    assert type(list.__getitem__(instance.rows, 0)) is dict  # noqa: S101
+    assert isinstance(instance.rows[0], ObservableObject)  # noqa: S101
+    assert instance.rows[0] is list.__getitem__(instance.rows, 0)  # noqa: S101
+    assert type(list.__getitem__(instance.rows, 1)) is dict  # noqa: S101
+    assert all(isinstance(row, ObservableObject) for row in instance.rows)  # noqa: S101
+    assert type(dict.__getitem__(instance.dict_attr, "nested")) is dict  # noqa: S101
+    assert instance.dict_attr.get("nested") == {"values": [5]}  # noqa: S101
+    assert isinstance(  # noqa: S101
+        dict.__getitem__(instance.dict_attr, "nested"),
+        ObservableObject,
+    )
+
+
+def test_lazy_wrapping_notification_paths() -> None:
+    instance = MyLazyObservable()
+    observer = MyRecordingObserver(instance)
+
+    instance.rows.insert(0, {"values": []})
+    instance.rows[2]["values"].append(4)
+    instance.rows[0]["values"].append(0)
+    instance.dict_attr["nested"]["values"][0] = 6
+    for values in instance.dict_attr.values():
+        values["other"] = 7
+
+    assert observer.changes == [  # noqa: S101
+        ("rows", ListSplice(0, 0, ({"values": []},))),
+        ("rows[2]['values']", ListSplice(1, 1, (4,))),
+        ("rows[0]['values']", ListSplice(0, 0, (0,))),
+        ("dict_attr['nested']['values'][0]", 6),
+        ("dict_attr['nested']['other']", 7),
+    ]
+    assert instance.to_dict() == {  # noqa: S101
+        "rows": [{"values": [0]}, {"values": [1, 2]}, {"values": [3, 4]}, [4]],
+        "dict_attr": {"nested": {"values": [6], "other": 7}},
+    }
+
+
+def test_lazy_wrapping_removed_item_is_not_observed() -> None:
+    instance = MyLazyObservable()
+    observer = MyRecordingObserver(instance)
+
+    row = instance.rows[0]
+    assert instance.rows.pop(0) is row  # noqa: S101
+    row["values"] = []
+
+    assert observer.changes == [("rows", ListSplice(0, 1, ()))]  # noqa: S101
+    assert row._observers is None  # noqa: S101
+
+
+def test_lazy_wrapping_popped_items_are_wrapped() -> None:
+    instance = MyLazyObservable()
+
+    popped_row = instance.rows.pop()
+    popped_value = instance.dict_attr.pop("nested")
+    instance.dict_attr["other"] = {"values": []}
+    _, popped_item = instance.dict_attr.popitem()
+
+    for popped in (popped_row, popped_value, popped_item):
+        assert isinstance(popped, ObservableObject)  # noqa: S101
+        assert popped._observers is None  # noqa: S101
+
+
+def test_containers_have_no_instance_dict() -> None:
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.list_attr = [[1]]
+            self.dict_attr = {"nested": {}}
+
+    instance = MyObservable()
+
+    for container in (
+        instance.list_attr,
+        instance.list_attr[0],
+        instance.dict_attr,
+        instance.dict_attr["nested"],
+    ):
+        assert not hasattr(container, "__dict__")  # noqa: S101
+
+
+def test_container_with_several_observers() -> None:
+    shared_list = [1]
+
+    class MyObservable(observer_pattern.Observable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.first = shared_list
+            self.second = shared_list
+
+    instance = MyObservable()
+    wrapped_list = instance.first
+    observer = MyRecordingObserver(instance)
+    wrapped_list.append(2)
+    instance.first = []
+    wrapped_list.append(3)
+    instance.second = []
+    wrapped_list.append(4)
+
+    assert observer.changes == [  # noqa: S101
+        ("first", ListSplice(1, 1, (2,))),
+        ("second", ListSplice(1, 1, (2,))),
+        ("first", []),
+        ("second", ListSplice(2, 2, (3,))),
+        ("second", []),
+    ]
+    assert not wrapped_list._observers  # noqa: S101
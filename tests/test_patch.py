@@ -0,0 +1,161 @@
+from typing import Any
+
+from observer_pattern import Observable
+from observer_pattern.patch import apply_patch, current_version
+
+
+class Device(Observable):
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+        self.voltage = 0.0
+
+    @property
+    def label(self) -> str:
+        return self.name.upper()
+
+
+class MyObservable(Observable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.devices = [Device("a"), Device("b"), Device("c")]
+        self.settings: dict[str, Any] = {"mode": "auto", "limits": [0, 10]}
+        self.value = 0
+
+
+def test_diff_coalesces_changes() -> None:
+    instance = MyObservable()
+    version = current_version()
+
+    instance.devices[1].voltage = 1.0
+    instance.devices[1].voltage = 2.0
+    instance.devices[1].label  # noqa: B018
+    instance.settings["limits"][1] = 20
+
+    patch = instance.diff(version)
+
+    assert sorted(patch.operations, key=lambda op: op["path"]) == [  # noqa: S101
+        {"op": "replace", "path": "devices[1].voltage", "value": 2.0},
+        {"op": "replace", "path": "settings['limits'][1]", "value": 20},
+    ]
+    assert instance.diff(patch.version).operations == []  # noqa: S101
+
+
+def test_diff_of_structural_changes() -> None:
+    instance = MyObservable()
+    version = current_version()
+
+    instance.devices.pop(0)
+    instance.devices[0].name = "B"
+    del instance.settings["mode"]
+    instance.settings["new"] = {"x": 1}
+    instance.value = 5
+
+    operations = sorted(instance.diff(version).operations, key=lambda op: op["path"])
+
+    assert operations == [  # noqa: S101
+        {
+            "op": "replace",
+            "path": "devices",
+            "value": [
+                {"name": "B", "voltage": 0.0},
+                {"name": "c", "voltage": 0.0},
+            ],
+        },
+        {"op": "remove", "path": "settings['mode']"},
+        {"op": "replace", "path": "settings['new']", "value": {"x": 1}},
+        {"op": "replace", "path": "value", "value": 5},
+    ]
+
+
+def test_apply_patch_to_copy_and_observable() -> None:
+    instance = MyObservable()
+    copy = instance.to_dict()
+    replica = MyObservable()
+    version = current_version()
+
+    instance.devices[2].voltage = 3.0
+    instance.devices.append(Device("d"))
+    instance.settings.pop("mode")
+    instance.settings["limits"][0] = -10
+    instance.value = 1
+    patch = instance.diff(version)
+
+    apply_patch(copy, patch.operations)
+    replica.apply_patch(patch.operations)
+
+    assert copy == instance.to_dict()  # noqa: S101
+    assert replica.to_dict() == instance.to_dict()  # noqa: S101
+
+
+def test_apply_patch_keeps_nested_observables() -> None:
+    instance = MyObservable()
+    replica = MyObservable()
+    devices = list(replica.devices)
+    version = current_version()
+
+    instance.devices.pop(0)
+    instance.devices.extend([Device("d"), Device("e")])
+    instance.devices[0] = Device("x")
+    instance.settings["device"] = Device("s")
+    replica.settings["device"] = Device("r")
+    settings_device = replica.settings["device"]
+    replica.apply_patch(instance.diff(version).operations)
+
+    assert replica.to_dict() == instance.to_dict()  # noqa: S101
+    # existing objects are updated, objects added to the list are added as dicts
+    assert replica.devices[:3] == devices  # noqa: S101
+    assert replica.devices[0].label == "X"  # noqa: S101
+    assert replica.devices[3] == {"name": "e", "voltage": 0.0}  # noqa: S101
+    assert replica.settings["device"] is settings_device  # noqa: S101
+    assert replica.settings["device"].name == "s"  # noqa: S101
+
+
+def test_diff_of_tail_changes() -> None:
+    instance = MyObservable()
+    instance.settings["samples"] = list(range(100_000))
+    copy = instance.to_dict()
+    version = current_version()
+
+    instance.settings["samples"].append(-1)
+    instance.devices.pop()
+    instance.devices.pop()
+    instance.devices.append(Device("x"))
+    instance.devices[0].name = "A"
+    patch = instance.diff(version)
+
+    assert patch.operations == [  # noqa: S101
+        {"op": "add", "path": "settings['samples'][100000]", "value": -1},
+        {"op": "remove", "path": "devices[2]"},
+        {"op": "replace", "path": "devices[1]", "value": {"name": "x", "voltage": 0.0}},
+        {"op": "replace", "path": "devices[0].name", "value": "A"},
+    ]
+    apply_patch(copy, patch.operations)
+    assert copy == instance.to_dict()  # noqa: S101
+
+    instance.devices.sort(key=lambda device: device.name, reverse=True)
+    operations = instance.diff(patch.version).operations
+    assert [op["path"] for op in operations] == ["devices"]  # noqa: S101
+
+
+def test_diff_of_deleted_attribute() -> None:
+    instance = MyObservable()
+    replica = MyObservable()
+    instance.extra = Device("e")
+    replica.extra = Device("r")
+    extra = instance.extra
+    version = current_version()
+
+    del instance.value
+    del instance.extra
+    patch = instance.diff(version)
+    replica.apply_patch(patch.operations)
+
+    operations = sorted(patch.operations, key=lambda op: op["path"])
+    assert operations == [  # noqa: S101
+        {"op": "remove", "path": "extra"},
+        {"op": "remove", "path": "value"},
+    ]
+    assert not hasattr(replica, "value")  # noqa: S101
+    # the removed object is no longer observed by the instance
+    assert not extra._observers  # noqa: S101
@@ -0,0 +1,82 @@
+from typing import Any
+
+from observer_pattern import Observable, computed
+from observer_pattern.snapshot import Reference, SnapshotEntry, assemble_snapshot
+
+
+class Device(Observable):
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+        self.child: Device | None = None
+        self._secret = 1
+
+    @property
+    def upper_name(self) -> str:
+        return self.name.upper()
+
+    @computed
+    def lower_name(self) -> str:
+        return self.name.lower()
+
+
+class MyObservable(Observable):
+    unit = "V"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.devices = [Device("a"), Device("b")]
+        self.settings: dict[Any, Any] = {"limits": [1, 2], 3: None}
+
+
+def test_to_dict() -> None:
+    instance = MyObservable()
+
+    assert instance.to_dict() == {  # noqa: S101
+        "unit": "V",
+        "devices": [{"name": "a", "child": None}, {"name": "b", "child": None}],
+        "settings": {"limits": [1, 2], 3: None},
+    }
+
+
+def test_to_dict_keeps_shared_and_cyclic_references() -> None:
+    instance = MyObservable()
+    instance.shared = instance.settings["limits"]
+    # cyclic trees cannot notify, so the cycle is created without notifications
+    instance.devices[0].__dict__["child"] = instance.devices[0]
+
+    copy = instance.to_dict()
+
+    assert copy["shared"] is copy["settings"]["limits"]  # noqa: S101
+    assert copy["devices"][0]["child"] is copy["devices"][0]  # noqa: S101
+
+
+def test_to_dict_of_deep_tree() -> None:
+    device = Device("0")
+    for i in range(5_000):
+        parent = Device(str(i + 1))
+        parent.child = device
+        device = parent
+
+    copy = device.to_dict()
+    for _ in range(5_000):
+        copy = copy["child"]
+    assert copy == {"name": "0", "child": None}  # noqa: S101
+
+
+def test_iter_snapshot() -> None:
+    instance = MyObservable()
+    instance.shared = instance.devices[1]
+
+    entries = list(instance.iter_snapshot())
+
+    # the children of a node are emitted before the children of its children
+    assert SnapshotEntry("shared", "", "shared", {}) in entries  # noqa: S101
+    assert SnapshotEntry("shared.name", "shared", "name", "b") in entries  # noqa: S101
+    assert SnapshotEntry("settings[3]", "settings", 3, None) in entries  # noqa: S101
+    assert (  # noqa: S101
+        SnapshotEntry("devices[1]", "devices", 1, Reference("shared")) in entries
+    )
+    assembled = assemble_snapshot(entries)
+    assert assembled == instance.to_dict()  # noqa: S101
+    assert assembled["shared"] is assembled["devices"][1]  # noqa: S101
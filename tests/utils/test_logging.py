@@ -0,0 +1,43 @@
+import logging
+import subprocess
+import sys
+
+import pytest
+from observer_pattern.utils.logging import ColourizedFormatter, setup_logging
+
+
+def test_import_does_not_configure_logging() -> None:
+    code = (
+        "import logging, sys, observer_pattern; "
+        "print(logging.getLogger().handlers, 'click' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[] False"  # noqa: S101
+
+
+def test_setup_logging_adds_one_handler(monkeypatch: pytest.MonkeyPatch) -> None:
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+
+    setup_logging(logging.DEBUG)
+    setup_logging("INFO")
+
+    assert root.level == logging.INFO  # noqa: S101
+    formatters = [type(handler.formatter) for handler in root.handlers]
+    assert formatters == [ColourizedFormatter]  # noqa: S101
+
+
+def test_formatter_does_not_change_the_record() -> None:
+    formatter = ColourizedFormatter(fmt="%(levelprefix)s %(message)s", use_colors=True)
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "plain", None, None)
+    record.__dict__["color_message"] = "coloured"
+
+    formatted = formatter.format(record)
+
+    assert "coloured" in formatted  # noqa: S101
+    assert "levelprefix" not in record.__dict__  # noqa: S101
+    assert record.getMessage() == "plain"  # noqa: S101